@@ -0,0 +1,18 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# __main__.py
+#
+# python -m macro run file.json --loops N 형태의 헤드리스 실행 진입점
+
+
+import sys
+import os
+
+# 패키지 디렉토리를 모듈 경로에 추가 (core, utils 등을 최상위 모듈로 사용)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from cli import main
+
+
+if __name__ == "__main__":
+    sys.exit(main())
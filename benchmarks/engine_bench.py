@@ -0,0 +1,282 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# benchmarks/engine_bench.py
+#
+# MacroEngine 처리량 벤치마크
+#
+# 실제 입력을 발생시키지 않는 NullBackend 와 지연 시간 0ms 설정으로 엔진 자체의
+# 오버헤드를 측정하고 결과를 JSON 으로 출력한다.
+#
+#   python benchmarks/engine_bench.py                  # 기본 크기로 실행, 표준 출력
+#   python benchmarks/engine_bench.py --quick          # 작은 크기로 빠르게 실행
+#   python benchmarks/engine_bench.py -o result.json   # 파일로 저장
+
+
+import sys
+import os
+import gc
+import json
+import time
+import logging
+import platform
+import argparse
+import tempfile
+import statistics
+import tracemalloc
+from datetime import datetime
+
+# 패키지 디렉토리를 모듈 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.macro_engine import MacroEngine
+from core.input_backend import NullBackend
+from core.actions import (MacroAction, MouseMoveAction, MouseClickAction, MouseScrollAction,
+                          MouseDragDropAction, KeyboardInputAction, KeyCombinationAction,
+                          TextListInputAction, DelayAction)
+
+
+# 동작 유형별 측정에 사용하는 샘플 동작 생성 함수 (타이핑도 지연 없이 입력)
+ACTION_FACTORIES = {
+    "MouseMoveAction": lambda i: MouseMoveAction(x=i % 1920, y=i % 1080),
+    "MouseClickAction": lambda i: MouseClickAction(x=i % 1920, y=i % 1080, button=i % 3),
+    "MouseScrollAction": lambda i: MouseScrollAction(x=10, y=10, direction=i % 2, clicks=3),
+    "MouseDragDropAction": lambda i: MouseDragDropAction(start_x=0, start_y=0, end_x=100, end_y=100),
+    "KeyboardInputAction": lambda i: KeyboardInputAction(text="hello world", key_interval=0),
+    "KeyCombinationAction": lambda i: KeyCombinationAction(key_combination="alt+tab"),
+    "TextListInputAction": lambda i: TextListInputAction(text_list=["item"], key_interval=0),
+    "DelayAction": lambda i: DelayAction(delay=0),
+}
+
+
+class LoopMarkerBackend(NullBackend):
+    """
+    반복 시작 표식 좌표로의 이동 시각을 기록하는 백엔드 (반복 간 지터 측정용)
+    """
+    MARKER = (-1, -1)
+
+    def __init__(self):
+        self.marks = []
+
+    def move_to(self, x, y):
+        if (x, y) == self.MARKER:
+            self.marks.append(time.perf_counter())
+
+
+def make_engine(actions, loop_count=1, backend=None):
+    """
+    지연 시간 0ms, 중지 키 없이 실행되는 벤치마크용 엔진 생성
+    """
+    engine = MacroEngine(backend or NullBackend())
+    engine.set_delay(0)
+    engine.set_loop_count(loop_count)
+    engine.stop_key = ""
+    for action in actions:
+        engine.add_action(action)
+    return engine
+
+
+def run_engine(engine):
+    """
+    엔진을 실행하고 완료까지 걸린 시간(초) 반환
+    """
+    start = time.perf_counter()
+    engine.start()
+    engine.wait()
+    return time.perf_counter() - start
+
+
+def bench_action_types(count, repeat):
+    """
+    동작 유형별 동작당 오버헤드(마이크로초) 측정
+    """
+    results = {}
+    for type_name, factory in ACTION_FACTORIES.items():
+        samples = []
+        for _ in range(repeat):
+            engine = make_engine([factory(i) for i in range(count)])
+            samples.append(run_engine(engine))
+        best = min(samples)
+        results[type_name] = {
+            "actions": count,
+            "best_s": best,
+            "median_s": statistics.median(samples),
+            "us_per_action": best / count * 1e6,
+            "actions_per_s": count / best if best > 0 else None,
+        }
+    return results
+
+
+def bench_large_macros(sizes):
+    """
+    대형 합성 매크로(여러 동작 유형 혼합)의 초당 동작 수 측정
+    """
+    factories = list(ACTION_FACTORIES.values())
+    results = []
+    for size in sizes:
+        actions = [factories[i % len(factories)](i) for i in range(size)]
+        elapsed = run_engine(make_engine(actions))
+        results.append({
+            "actions": size,
+            "elapsed_s": elapsed,
+            "actions_per_s": size / elapsed if elapsed > 0 else None,
+        })
+    return results
+
+
+def bench_text_list(sizes):
+    """
+    긴 텍스트 리스트 입력 동작을 리스트 길이만큼 반복 실행할 때의 처리량 측정
+    """
+    results = []
+    for size in sizes:
+        text_list = [f"line {i}" for i in range(size)]
+        engine = make_engine([TextListInputAction(text_list=text_list, key_interval=0)], loop_count=size)
+        elapsed = run_engine(engine)
+        results.append({
+            "items": size,
+            "elapsed_s": elapsed,
+            "items_per_s": size / elapsed if elapsed > 0 else None,
+        })
+    return results
+
+
+def bench_loop_jitter(loops, actions_per_loop):
+    """
+    반복 간 시간 간격의 평균/표준편차/최소/최대(마이크로초) 측정
+    """
+    backend = LoopMarkerBackend()
+    actions = [MouseMoveAction(*LoopMarkerBackend.MARKER)]
+    actions += [ACTION_FACTORIES["MouseClickAction"](i) for i in range(actions_per_loop - 1)]
+    run_engine(make_engine(actions, loop_count=loops, backend=backend))
+
+    intervals = [(b - a) * 1e6 for a, b in zip(backend.marks, backend.marks[1:])]
+    if len(intervals) < 2:
+        return {"loops": loops, "actions_per_loop": actions_per_loop, "intervals": len(intervals)}
+
+    return {
+        "loops": loops,
+        "actions_per_loop": actions_per_loop,
+        "mean_us": statistics.mean(intervals),
+        "stdev_us": statistics.stdev(intervals),
+        "min_us": min(intervals),
+        "max_us": max(intervals),
+        "jitter_us": max(intervals) - min(intervals),
+    }
+
+
+def bench_file_io(sizes):
+    """
+    대형 매크로 파일의 save_to_file / load_from_file 시간 측정 (JSON, 바이너리 각각)
+    """
+    factories = list(ACTION_FACTORIES.values())
+    results = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for size in sizes:
+            engine = make_engine([factories[i % len(factories)](i) for i in range(size)])
+            for extension in (".json", ".macb"):
+                file_path = os.path.join(temp_dir, f"bench_{size}{extension}")
+
+                start = time.perf_counter()
+                saved = engine.save_to_file(file_path)
+                save_s = time.perf_counter() - start
+
+                loader = MacroEngine(NullBackend())
+                start = time.perf_counter()
+                loaded = loader.load_from_file(file_path)
+                load_s = time.perf_counter() - start
+
+                results.append({
+                    "actions": size,
+                    "format": extension[1:],
+                    "file_bytes": os.path.getsize(file_path) if saved else None,
+                    "save_s": save_s if saved else None,
+                    "load_s": load_s if loaded else None,
+                    "loaded_actions": len(loader.actions),
+                })
+    return results
+
+
+def bench_action_load(sizes):
+    """
+    동작 딕셔너리를 객체로 변환(from_dict)하는 시간과 동작당 메모리(바이트) 측정
+    """
+    factories = list(ACTION_FACTORIES.values())
+    results = []
+    for size in sizes:
+        data = [factories[i % len(factories)](i).to_dict() for i in range(size)]
+
+        gc.collect()
+        start = time.perf_counter()
+        actions = [MacroAction.from_dict(action_data) for action_data in data]
+        elapsed = time.perf_counter() - start
+        del actions
+
+        # 메모리는 시간 측정과 분리해서 측정 (tracemalloc 은 할당 비용을 크게 늘림)
+        gc.collect()
+        tracemalloc.start()
+        actions = [MacroAction.from_dict(action_data) for action_data in data]
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del actions
+
+        results.append({
+            "actions": size,
+            "from_dict_s": elapsed,
+            "us_per_action": elapsed / size * 1e6,
+            "bytes_per_action": current / size,
+        })
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MacroEngine 처리량 벤치마크 (JSON 출력)")
+    parser.add_argument("-o", "--output", help="결과 JSON 저장 경로 (생략 시 표준 출력)")
+    parser.add_argument("--quick", action="store_true", help="작은 크기로 빠르게 실행")
+    parser.add_argument("--sizes", default=None,
+                        help="대형 매크로 크기 목록 (쉼표 구분, 기본값: 1000,10000,100000)")
+    parser.add_argument("--with-logging", action="store_true",
+                        help="엔진 로그를 끄지 않고 측정 (기본값은 WARNING 이상만 기록)")
+    args = parser.parse_args(argv)
+
+    if args.sizes:
+        sizes = [int(size) for size in args.sizes.split(",") if size]
+    else:
+        sizes = [1000, 10000] if args.quick else [1000, 10000, 100000]
+    type_count = 1000 if args.quick else 10000
+    repeat = 1 if args.quick else 3
+    loops = 200 if args.quick else 2000
+
+    # 기본적으로 로그 출력 비용을 제외하고 엔진 자체의 비용을 측정
+    if not args.with_logging:
+        logging.getLogger("macro_app").setLevel(logging.WARNING)
+
+    started_at = datetime.now().isoformat(timespec="seconds")
+    results = {
+        "meta": {
+            "started_at": started_at,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "backend": NullBackend.name,
+            "delay_ms": 0,
+            "logging": bool(args.with_logging),
+            "sizes": sizes,
+        },
+        "action_types": bench_action_types(type_count, repeat),
+        "large_macros": bench_large_macros(sizes),
+        "text_list": bench_text_list(sizes),
+        "loop_jitter": bench_loop_jitter(loops, 10),
+        "file_io": bench_file_io(sizes),
+        "action_load": bench_action_load(sizes),
+    }
+
+    output = json.dumps(results, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output)
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
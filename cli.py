@@ -0,0 +1,299 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# cli.py
+
+
+import sys
+import os
+import argparse
+
+
+# 실행 파일 또는 스크립트의 디렉토리를 기준으로 경로 설정
+if getattr(sys, 'frozen', False):
+    # PyInstaller로 생성된 실행 파일의 경우
+    base_dir = sys._MEIPASS
+else:
+    # 일반 Python 스크립트로 실행하는 경우
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+
+# sys.path에 필요한 디렉토리 추가
+sys.path.insert(0, base_dir)
+
+from utils.logger import app_logger
+
+
+def build_parser():
+    """
+    명령줄 인자 파서 생성
+    """
+    parser = argparse.ArgumentParser(
+        prog="macro",
+        description="마우스 키보드 매크로 헤드리스 실행기 (GUI 없이 저장된 매크로 실행)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    # run: 저장된 매크로 실행
+    run_parser = subparsers.add_parser("run", help="저장된 매크로 파일 실행")
+    run_parser.add_argument("files", nargs="+", metavar="file",
+                            help="매크로 파일 경로 (.json 또는 .macb), 여러 개를 지정하면 동시에 실행")
+    run_parser.add_argument("--background", nargs="+", default=[], metavar="file",
+                            help="낮은 입력 우선순위로 함께 실행할 매크로 파일 (다른 매크로의 입력을 막지 않음)")
+    run_parser.add_argument("--loops", type=int, default=None,
+                            help="반복 횟수 (0 이하는 무한 반복, 생략 시 파일 설정 사용)")
+    run_parser.add_argument("--delay", type=int, default=None,
+                            help="동작 간 지연 시간(ms) (생략 시 파일 설정 사용)")
+    run_parser.add_argument("--deadline", action="store_true",
+                            help="절대 마감 시각 기준 스케줄 사용 (누적 지연 없음)")
+    run_parser.add_argument("--clipboard-timeout", type=float, default=None,
+                            help="복사 후 클립보드 변경을 기다리는 최대 시간(초) (생략 시 파일 설정 사용)")
+    run_parser.add_argument("--stop-key", default=None,
+                            help="중지 키 (생략 시 파일 설정 사용)")
+    run_parser.add_argument("--no-stop-key", action="store_true",
+                            help="중지 키 리스너를 사용하지 않음 (Ctrl+C 로 중지)")
+    run_parser.add_argument("--backend", default=None,
+                            choices=["pyautogui", "pynput", "recording", "null"],
+                            help="입력 백엔드 (기본값: pyautogui, recording 은 실제 입력 없이 기록만 함)")
+    run_parser.add_argument("--optimize", action="store_true",
+                            help="실행 전 동작 목록 최적화 (연속 지연/키보드 입력 합치기, 불필요한 마우스 이동 제거)")
+    run_parser.add_argument("--profile", action="store_true",
+                            help="실행 종료 후 동작별 시간 프로파일을 표준 출력으로 출력")
+    run_parser.add_argument("--profile-out", default=None,
+                            help="동작별 시간 프로파일 저장 경로 (.csv 면 CSV, 그 외에는 JSON)")
+    run_parser.add_argument("--checkpoint", nargs="?", const="", default=None, metavar="path",
+                            help="실행 위치를 주기적으로 저장할 체크포인트 파일 (경로 생략 시 <매크로 파일>.checkpoint)")
+    run_parser.add_argument("--checkpoint-interval", type=float, default=None, metavar="seconds",
+                            help="체크포인트 저장 간격(초) (기본값: 5)")
+    run_parser.add_argument("--resume", action="store_true",
+                            help="체크포인트가 있으면 저장된 위치부터 이어서 실행 (--checkpoint 생략 시 기본 경로 사용)")
+    run_parser.add_argument("--log-level", default=None, choices=["debug", "info", "warning", "error"],
+                            help="로그 수준 (기본값: debug)")
+    run_parser.add_argument("--log-every", type=int, default=None, metavar="N",
+                            help="동작별 실행 로그를 첫 반복과 N번째 반복마다 기록 (기본값: 10, 1 이면 매 반복)")
+    run_parser.add_argument("--log-dir", default=None, metavar="path",
+                            help="로그 파일 저장 폴더 (기본값: 프로그램 폴더의 logs 또는 MACRO_LOG_DIR 환경 변수)")
+    run_parser.add_argument("--log-max-mb", type=float, default=None, metavar="MB",
+                            help="로그 파일 하나의 최대 크기, 넘으면 새 파일로 교체하고 이전 파일은 압축 (기본값: 10)")
+    run_parser.add_argument("--log-retention-mb", type=float, default=None, metavar="MB",
+                            help="로그 폴더 전체 최대 크기, 넘으면 오래된 파일부터 삭제 (기본값: 200)")
+    run_parser.add_argument("--trace-out", default=None, metavar="path",
+                            help="실행이 끝나면 최근 실행 기록을 항상 이 파일로 저장 (생략 시 중지/오류 때만 로그 폴더에 저장)")
+    run_parser.add_argument("--trace-size", type=int, default=None, metavar="N",
+                            help="메모리에 보관할 최근 실행 기록 수 (기본값: 100000)")
+
+    # convert: 매크로 파일 형식 변환
+    convert_parser = subparsers.add_parser("convert", help="매크로 파일 형식 변환 (JSON <-> 바이너리 .macb)")
+    convert_parser.add_argument("source", help="원본 매크로 파일 경로")
+    convert_parser.add_argument("target", help="저장할 매크로 파일 경로 (확장자가 .macb 면 바이너리, 그 외에는 JSON)")
+
+    # trace: 실행 기록 파일 보기/변환
+    trace_parser = subparsers.add_parser("trace", help="실행 기록 파일(.mtrace) 내용 출력 또는 CSV 변환")
+    trace_parser.add_argument("file", help="실행 기록 파일 경로")
+    trace_parser.add_argument("--last", type=int, default=50, metavar="N",
+                              help="출력할 최근 기록 수 (기본값: 50, 0 이면 요약만, -1 이면 전체)")
+    trace_parser.add_argument("--csv", default=None, metavar="path",
+                              help="모든 기록을 CSV 파일로 저장")
+
+    return parser
+
+
+def load_engine(args, file_path, backend):
+    """
+    매크로 파일을 불러와 명령줄 인자를 적용한 엔진 반환 (실패 시 None)
+    """
+    from core.macro_engine import MacroEngine
+    from core.scheduler import SCHEDULE_DEADLINE
+
+    engine = MacroEngine(backend)
+    if not engine.load_from_file(file_path):
+        app_logger.error(f"매크로 파일을 불러올 수 없음: {file_path}")
+        return None
+
+    # 명령줄 인자로 파일 설정 덮어쓰기
+    if args.loops is not None:
+        engine.set_loop_count(args.loops)
+    if args.delay is not None:
+        engine.set_delay(args.delay)
+    if args.deadline:
+        engine.set_schedule_mode(SCHEDULE_DEADLINE)
+    if args.clipboard_timeout is not None:
+        engine.set_clipboard_timeout(args.clipboard_timeout)
+    if args.optimize:
+        engine.set_optimize(True)
+    if args.log_every is not None:
+        engine.set_log_every(args.log_every)
+    if args.trace_size is not None:
+        engine.set_trace(capacity=args.trace_size)
+    if args.no_stop_key:
+        engine.stop_key = ""
+    elif args.stop_key:
+        engine.set_stop_key(args.stop_key)
+
+    return engine
+
+
+def get_output_path(path, position, count):
+    """
+    여러 매크로를 실행할 때 매크로별 출력 파일 경로 (파일명 뒤에 순번 추가)
+    """
+    if count == 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{position + 1}{ext}"
+
+
+def run_macro(args):
+    """
+    매크로 파일을 불러와 위젯 없이 실행
+
+    여러 파일을 지정하면 파일마다 엔진을 만들어 동시에 실행하고, 실제 입력
+    단계는 공유 입력 중재자를 통해 차례로 실행한다.
+    """
+    # 엔진 모듈은 실제 실행 시에만 로드 (도움말 출력 등은 즉시 반환)
+    from core.input_backend import create_backend
+    from core.input_arbiter import InputArbiter, PRIORITY_NORMAL, PRIORITY_LOW
+    from core.checkpoint import DEFAULT_CHECKPOINT_INTERVAL, get_checkpoint_path
+
+    if args.log_level:
+        app_logger.set_level(args.log_level)
+    # 로그 파일은 옵션을 적용하면서 처음 만들어짐 (그 전의 로그도 이 파일에 기록)
+    app_logger.configure(
+        log_dir=args.log_dir,
+        max_bytes=args.log_max_mb * 1024 * 1024 if args.log_max_mb is not None else None,
+        retention_bytes=args.log_retention_mb * 1024 * 1024 if args.log_retention_mb is not None else None)
+
+    backend = create_backend(args.backend) if args.backend else None
+
+    jobs = [(file_path, PRIORITY_NORMAL) for file_path in args.files]
+    jobs += [(file_path, PRIORITY_LOW) for file_path in args.background]
+
+    engines = []
+    for file_path, priority in jobs:
+        engine = load_engine(args, file_path, backend)
+        if engine is None:
+            return 1
+        engines.append((file_path, engine))
+
+    # 둘 이상을 동시에 실행할 때만 입력 중재자 사용
+    if len(jobs) > 1:
+        arbiter = InputArbiter()
+        for (file_path, priority), (_, engine) in zip(jobs, engines):
+            engine.set_arbiter(arbiter, priority)
+
+    # 체크포인트 (--resume 만 지정해도 기본 경로 사용)
+    if args.checkpoint is not None or args.resume:
+        interval = args.checkpoint_interval
+        if interval is None:
+            interval = DEFAULT_CHECKPOINT_INTERVAL
+        for position, (file_path, engine) in enumerate(engines):
+            if args.checkpoint:
+                checkpoint_path = get_output_path(args.checkpoint, position, len(engines))
+            else:
+                checkpoint_path = get_checkpoint_path(file_path)
+            engine.set_checkpoint(checkpoint_path, interval)
+
+    if args.trace_out:
+        for position, (file_path, engine) in enumerate(engines):
+            engine.set_trace(file_path=get_output_path(args.trace_out, position, len(engines)))
+
+    for file_path, engine in engines:
+        engine.start(resume=args.resume)
+        if engine.thread is None:
+            # 실행 계획 생성 실패 등으로 실행 스레드가 시작되지 않음
+            app_logger.error(f"매크로를 시작할 수 없음: {file_path}")
+            for _, started in engines:
+                started.stop()
+                started.wait()
+            return 1
+
+    exit_code = 0
+    try:
+        # 짧은 간격으로 대기해야 Ctrl+C(KeyboardInterrupt)가 메인 스레드에 전달됨
+        for _, engine in engines:
+            while not engine.wait(0.2):
+                pass
+    except KeyboardInterrupt:
+        app_logger.info("Ctrl+C 입력으로 매크로 중지")
+        for _, engine in engines:
+            engine.stop()
+        for _, engine in engines:
+            engine.wait()
+        exit_code = 130
+
+    if args.backend == "recording":
+        app_logger.info(f"기록된 입력 이벤트: {len(backend.events)}개")
+
+    # 중지된 경우에도 그때까지의 프로파일은 출력
+    for position, (file_path, engine) in enumerate(engines):
+        profiler = engine.get_profile()
+        if args.profile:
+            if len(engines) > 1:
+                print(f"# {file_path}")
+            print(profiler.to_text())
+        if args.profile_out:
+            if not profiler.save(get_output_path(args.profile_out, position, len(engines))):
+                exit_code = exit_code or 1
+
+    return exit_code
+
+
+def convert_macro_file(args):
+    """
+    convert 명령 처리: 매크로 파일을 다른 형식으로 변환
+    """
+    from core.macro_format import convert_macro
+
+    if not os.path.exists(args.source):
+        app_logger.error(f"매크로 파일을 찾을 수 없음: {args.source}")
+        return 1
+    try:
+        count = convert_macro(args.source, args.target)
+    except Exception as e:
+        app_logger.error(f"매크로 파일 변환 실패: {args.source} - {str(e)}", exc_info=True)
+        return 1
+    print(f"{args.source} -> {args.target} ({count}개 동작)")
+    return 0
+
+
+def show_trace(args):
+    """
+    trace 명령 처리: 실행 기록 파일 요약 출력 또는 CSV 변환
+    """
+    from core.trace import read_trace, trace_to_text, trace_to_csv
+
+    if not os.path.exists(args.file):
+        app_logger.error(f"실행 기록 파일을 찾을 수 없음: {args.file}")
+        return 1
+    try:
+        meta, records = read_trace(args.file)
+        if args.csv:
+            with open(args.csv, 'w', encoding='utf-8', newline='') as f:
+                f.write(trace_to_csv(meta, records))
+            print(f"{args.file} -> {args.csv} ({len(records)}개 기록)")
+            return 0
+    except Exception as e:
+        app_logger.error(f"실행 기록 파일 처리 실패: {args.file} - {str(e)}", exc_info=True)
+        return 1
+    print(trace_to_text(meta, records, None if args.last < 0 else args.last))
+    return 0
+
+
+def main(argv=None):
+    """
+    헤드리스 실행기 진입점
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        return run_macro(args)
+    if args.command == "convert":
+        return convert_macro_file(args)
+    if args.command == "trace":
+        return show_trace(args)
+
+    parser.print_help()
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,38 +2,73 @@
 # -*- coding: utf-8 -*-
 # core/actions.py
 
-from PyQt5.QtWidgets import QListWidgetItem
-from PyQt5.QtCore import QObject
+import os
+import inspect
 from utils.logger import app_logger
+from core.plan import (ExecutionContext, FLOW_LABEL, FLOW_JUMP, FLOW_REPEAT_START, FLOW_REPEAT_END,
+                       FLOW_IF, FLOW_ELSE, FLOW_END_IF)
+from core.clipboard_utils import get_change_token, wait_for_change, read_clipboard
+from core.text_source import open_text_source
+from core.text_input import (INPUT_MODE_AUTO, INPUT_MODE_NAMES, DEFAULT_KEY_INTERVAL,
+                             choose_input_mode, make_text_writer)
 
-class MacroAction(QObject):
+class MacroAction:
     """
     매크로 동작의 기본 추상 클래스
+    
+    수만 개의 동작을 불러올 수 있도록 Qt 객체를 상속하지 않고 __slots__ 로
+    속성만 보관한다. 하위 클래스도 자신의 속성을 __slots__ 에 선언한다.
     """
+    __slots__ = ("name", "pre_delay", "post_delay")
+    
+    # from_dict 가 생성자에 전달할 (인자 이름, 기본값) 목록 (register_action 에서 설정)
+    init_params = ()
+    
+    # 순수 대기 동작 여부 (True 이면 엔진이 get_wait_seconds() 만큼 직접 대기)
+    is_wait = False
+    
+    # 실제 마우스/키보드 입력을 발생시키는지 여부 (True 이면 입력 중재자의 잠금을 얻고 실행)
+    uses_input = True
+    
+    # 흐름 제어 종류 (흐름 제어 동작에서만 설정, 일반 동작은 None)
+    flow = None
+    
     def __init__(self, name="동작"):
-        super().__init__()
         self.name = name
-        
-        # PyAutoGUI FailSafe 비활성화
-        try:
-            import pyautogui
-            pyautogui.FAILSAFE = False
-        except:
-            pass
+        # 동작 실행 전/후 추가 대기 시간 (ms, 동작 간 공통 지연 시간과 별도)
+        self.pre_delay = 0
+        self.post_delay = 0
     
-    def execute(self):
+    def execute(self, context=None):
         """
         동작 실행 메서드 (하위 클래스에서 구현)
+        
+        context: 실행 환경 (ExecutionContext), 생략 시 기본 환경 사용
         """
         raise NotImplementedError("서브클래스에서 구현해야 합니다.")
     
-    def to_list_item(self):
+    def compile(self, context):
+        """
+        실행 계획용 호출 객체 반환 (하위 클래스에서 구현)
+        
+        매크로 시작 시 한 번 호출되며, 좌표/키/백엔드 함수 등을 미리 바인딩한
+        인자 없는 함수를 반환한다. 입력은 반드시 context.backend 를 통해 발생시킨다. 반환된 함수는 성공 여부(bool)를 반환하며,
+        오류 시 예외를 그대로 전달한다. 대기가 필요한 경우 반드시
+        context.control 을 통해 대기해야 중지/일시 정지가 즉시 반영된다.
+        """
+        return lambda: self.execute(context)
+    
+    def get_wait_seconds(self):
+        """
+        엔진이 대신 수행할 대기 시간(초) 반환 (대기 동작에서 구현)
+        """
+        return 0.0
+    
+    def copies_to_clipboard(self):
         """
-        리스트 위젯 아이템으로 변환
+        실행 시 클립보드에 복사하는 동작인지 여부 (복사 동작에서 구현)
         """
-        item = QListWidgetItem(self.name)
-        item.setToolTip(self.get_description())
-        return item
+        return False
     
     def get_description(self):
         """
@@ -47,103 +82,98 @@ class MacroAction(QObject):
         """
         return {
             "type": self.__class__.__name__,
-            "name": self.name
+            "name": self.name,
+            "pre_delay": self.pre_delay,
+            "post_delay": self.post_delay
         }
     
     @staticmethod
     def from_dict(data):
         """
         딕셔너리에서 동작 객체 생성 (JSON 로드용)
+        
+        "type" 값으로 등록된 동작 클래스를 찾아, 생성자 인자와 이름이 같은 키의
+        값을 생성자에 전달한다. 없는 키는 생성자 기본값을 사용한다.
         """
-        action_type = data.get("type", "")
-        
-        if action_type == "MouseMoveAction":
-            return MouseMoveAction(
-                name=data.get("name", "마우스 이동"),
-                x=data.get("x", 0),
-                y=data.get("y", 0)
-            )
-        elif action_type == "MouseClickAction":
-            return MouseClickAction(
-                name=data.get("name", "마우스 클릭"),
-                x=data.get("x", 0),
-                y=data.get("y", 0),
-                button=data.get("button", 0)
-            )
-        elif action_type == "MouseScrollAction":
-            return MouseScrollAction(
-                name=data.get("name", "마우스 스크롤"),
-                x=data.get("x", 0),
-                y=data.get("y", 0),
-                direction=data.get("direction", 0),
-                clicks=data.get("clicks", 1)
-            )
-        elif action_type == "MouseDragDropAction":
-            return MouseDragDropAction(
-                name=data.get("name", "드래그 & 드롭"),
-                start_x=data.get("start_x", 0),
-                start_y=data.get("start_y", 0),
-                end_x=data.get("end_x", 0),
-                end_y=data.get("end_y", 0)
-            )
-        elif action_type == "KeyboardInputAction":
-            return KeyboardInputAction(
-                name=data.get("name", "키보드 입력"),
-                text=data.get("text", "")
-            )
-        elif action_type == "KeyCombinationAction":
-            return KeyCombinationAction(
-                name=data.get("name", "키 조합"),
-                key_combination=data.get("key_combination", "")
-            )
-        elif action_type == "TextListInputAction":
-            return TextListInputAction(
-                name=data.get("name", "텍스트 리스트 입력"),
-                text_list=data.get("text_list", [])
-            )
-        elif action_type == "DelayAction":
-            return DelayAction(
-                name=data.get("name", "지연 시간"),
-                delay=data.get("delay", 1000)
-            )
-        elif action_type == "ClipboardSaveAction":
-            return ClipboardSaveAction(
-                name=data.get("name", "클립보드 저장"),
-                output_file=data.get("output_file", "")
-            )
-        elif action_type == "FolderMonitorAction":
-            action = FolderMonitorAction(
-                name=data.get("name", "폴더 모니터링"),
-                folder_path=data.get("folder_path", "")
-            )
-            action.filename_template = data.get("filename_template", "clipboard.txt")
-            return action
-        else:
+        get = data.get
+        action_type = get("type", "")
+        action_class = ACTION_TYPES.get(action_type)
+        if action_class is None:
             app_logger.warning(f"알 수 없는 동작 유형: {action_type}")
             return None
+        
+        action = action_class(*[get(key, default) for key, default in action_class.init_params])
+        action.pre_delay = get("pre_delay", 0)
+        action.post_delay = get("post_delay", 0)
+        return action
+
 
+# 동작 유형 이름 -> 동작 클래스 (from_dict 에서 사용)
+ACTION_TYPES = {}
+
+def register_action(action_class):
+    """
+    동작 클래스 등록 (클래스 데코레이터, 플러그인 동작도 같은 방식으로 등록)
+    
+    to_dict 의 "type" 값은 클래스 이름이며, to_dict 의 나머지 키 이름은
+    생성자 인자 이름과 같아야 from_dict 로 다시 만들 수 있다. 생성자 인자는
+    모두 기본값이 있어야 한다 (저장 파일에 없는 키는 기본값 사용).
+    """
+    init_params = []
+    parameters = list(inspect.signature(action_class.__init__).parameters.values())[1:]
+    for parameter in parameters:
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            continue
+        if parameter.kind != parameter.POSITIONAL_OR_KEYWORD or parameter.default is parameter.empty:
+            raise TypeError(f"{action_class.__name__}: 생성자 인자 '{parameter.name}' 에 기본값이 필요합니다")
+        init_params.append((parameter.name, parameter.default))
+    action_class.init_params = tuple(init_params)
+    ACTION_TYPES[action_class.__name__] = action_class
+    return action_class
+
+def get_action_types():
+    """
+    등록된 동작 유형 이름 목록 반환
+    """
+    return list(ACTION_TYPES)
+
+@register_action
 class MouseMoveAction(MacroAction):
     """
     마우스 이동 동작
     """
+    __slots__ = ("x", "y")
+    
     def __init__(self, x=0, y=0, name="마우스 이동"):
         super().__init__(name)
         self.x = x
         self.y = y
     
-    def execute(self):
+    def execute(self, context=None):
         """
         마우스를 지정된 좌표로 이동
         """
         try:
-            import pyautogui
-            app_logger.debug(f"마우스 이동: ({self.x}, {self.y})")
-            pyautogui.moveTo(self.x, self.y)
-            return True
+            return self.compile(context or ExecutionContext())()
         except Exception as e:
             app_logger.error(f"마우스 이동 실패: {str(e)}", exc_info=True)
             return False
     
+    def compile(self, context):
+        """
+        좌표를 미리 바인딩한 마우스 이동 함수 반환
+        """
+        move_to = context.backend.move_to
+        x, y = self.x, self.y
+        move_msg = f"마우스 이동: ({x}, {y})"
+        
+        def run():
+            app_logger.action_debug(move_msg)
+            move_to(x, y)
+            return True
+        
+        return run
+    
     def get_description(self):
         """
         동작 설명 반환
@@ -162,10 +192,13 @@ class MouseMoveAction(MacroAction):
         return data
 
 
+@register_action
 class MouseClickAction(MacroAction):
     """
     마우스 클릭 동작
     """
+    __slots__ = ("x", "y", "button")
+    
     def __init__(self, x=0, y=0, button=0, name="마우스 클릭"):
         """
         button: 0=좌클릭, 1=우클릭, 2=더블클릭
@@ -175,33 +208,48 @@ class MouseClickAction(MacroAction):
         self.y = y
         self.button = button
     
-    def execute(self):
+    def execute(self, context=None):
         """
         지정된 위치에서 마우스 클릭 실행
         """
         try:
-            import pyautogui
-            button_names = ["left", "right", "double"]
-            button_type = button_names[self.button] if self.button < len(button_names) else "left"
-            
-            app_logger.debug(f"마우스 이동: ({self.x}, {self.y})")
-            pyautogui.moveTo(self.x, self.y)
-            
-            if self.button == 0:  # 좌클릭
-                app_logger.debug("좌클릭 실행")
-                pyautogui.click(button='left')
-            elif self.button == 1:  # 우클릭
-                app_logger.debug("우클릭 실행")
-                pyautogui.click(button='right')
-            elif self.button == 2:  # 더블클릭
-                app_logger.debug("더블클릭 실행")
-                pyautogui.doubleClick()
-            
-            return True
+            return self.compile(context or ExecutionContext())()
         except Exception as e:
             app_logger.error(f"마우스 클릭 실패: {str(e)}", exc_info=True)
             return False
     
+    def compile(self, context):
+        """
+        좌표와 버튼 종류를 미리 바인딩한 마우스 클릭 함수 반환
+        """
+        backend = context.backend
+        move_to = backend.move_to
+        x, y = self.x, self.y
+        move_msg = f"마우스 이동: ({x}, {y})"
+        
+        if self.button == 0:  # 좌클릭
+            click_msg = "좌클릭 실행"
+            click = lambda: backend.click(button='left')
+        elif self.button == 1:  # 우클릭
+            click_msg = "우클릭 실행"
+            click = lambda: backend.click(button='right')
+        elif self.button == 2:  # 더블클릭
+            click_msg = "더블클릭 실행"
+            click = backend.double_click
+        else:
+            click_msg = None
+            click = None
+        
+        def run():
+            app_logger.action_debug(move_msg)
+            move_to(x, y)
+            if click is not None:
+                app_logger.action_debug(click_msg)
+                click()
+            return True
+        
+        return run
+    
     def get_description(self):
         """
         동작 설명 반환
@@ -223,10 +271,13 @@ class MouseClickAction(MacroAction):
         return data
 
 
+@register_action
 class MouseDragDropAction(MacroAction):
     """
     마우스 드래그 앤 드롭 동작
     """
+    __slots__ = ("start_x", "start_y", "end_x", "end_y")
+    
     def __init__(self, start_x=0, start_y=0, end_x=0, end_y=0, name="드래그 & 드롭"):
         super().__init__(name)
         self.start_x = start_x
@@ -234,25 +285,41 @@ class MouseDragDropAction(MacroAction):
         self.end_x = end_x
         self.end_y = end_y
     
-    def execute(self):
+    def execute(self, context=None):
         """
         드래그 앤 드롭 실행
         """
         try:
-            import pyautogui
-            app_logger.debug(f"드래그 시작: ({self.start_x}, {self.start_y})")
-            pyautogui.moveTo(self.start_x, self.start_y)
-            pyautogui.mouseDown(button='left')
-            
-            app_logger.debug(f"드래그 종료: ({self.end_x}, {self.end_y})")
-            pyautogui.moveTo(self.end_x, self.end_y)
-            pyautogui.mouseUp(button='left')
-            
-            return True
+            return self.compile(context or ExecutionContext())()
         except Exception as e:
             app_logger.error(f"드래그 앤 드롭 실패: {str(e)}", exc_info=True)
             return False
     
+    def compile(self, context):
+        """
+        시작/끝 좌표를 미리 바인딩한 드래그 앤 드롭 함수 반환
+        """
+        backend = context.backend
+        move_to = backend.move_to
+        mouse_down = backend.mouse_down
+        mouse_up = backend.mouse_up
+        start_x, start_y = self.start_x, self.start_y
+        end_x, end_y = self.end_x, self.end_y
+        start_msg = f"드래그 시작: ({start_x}, {start_y})"
+        end_msg = f"드래그 종료: ({end_x}, {end_y})"
+        
+        def run():
+            app_logger.action_debug(start_msg)
+            move_to(start_x, start_y)
+            mouse_down(button='left')
+            
+            app_logger.action_debug(end_msg)
+            move_to(end_x, end_y)
+            mouse_up(button='left')
+            return True
+        
+        return run
+    
     def get_description(self):
         """
         동작 설명 반환
@@ -273,31 +340,53 @@ class MouseDragDropAction(MacroAction):
         return data
 
 
+@register_action
 class KeyboardInputAction(MacroAction):
     """
     키보드 입력 동작
     """
-    def __init__(self, text="", name="키보드 입력"):
+    __slots__ = ("text", "input_mode", "key_interval")
+    
+    def __init__(self, text="", name="키보드 입력", input_mode=INPUT_MODE_AUTO,
+                 key_interval=DEFAULT_KEY_INTERVAL):
+        """
+        input_mode: 입력 방식 (auto: 자동, type: 타이핑, paste: 붙여넣기)
+        key_interval: 타이핑 시 글자 간 간격 (ms)
+        """
         super().__init__(name)
         self.text = text
+        self.input_mode = input_mode
+        self.key_interval = key_interval
     
-    def execute(self):
+    def execute(self, context=None):
         """
         텍스트 입력 실행
         """
         try:
-            import pyautogui
-            preview = self.text[:20] + "..." if len(self.text) > 20 else self.text
-            app_logger.debug(f"키보드 입력: {preview}")
-            
-            # issue 5
-            # 입력 딜레이 설정 - 너무 빠른 입력으로 인한 중복 문제 해결
-            pyautogui.PAUSE = 0.05
-            pyautogui.write(self.text, interval=0.05)
-            return True
+            return self.compile(context or ExecutionContext())()
         except Exception as e:
             app_logger.error(f"키보드 입력 실패: {str(e)}", exc_info=True)
             return False
+    
+    def compile(self, context):
+        """
+        입력할 텍스트를 미리 바인딩한 키보드 입력 함수 반환
+        """
+        input_text = make_text_writer(context)
+        text = self.text
+        # 텍스트가 고정되어 있으므로 입력 방식도 미리 결정
+        input_mode = choose_input_mode(text, self.input_mode)
+        preview = text[:20] + "..." if len(text) > 20 else text
+        input_msg = f"키보드 입력 ({INPUT_MODE_NAMES[input_mode]}): {preview}"
+        
+        interval = self.key_interval / 1000.0
+        
+        def run():
+            app_logger.action_debug(input_msg)
+            input_text(text, input_mode, interval)
+            return True
+        
+        return run
         
     def to_dict(self):
         """
@@ -305,50 +394,79 @@ class KeyboardInputAction(MacroAction):
         """
         data = super().to_dict()
         data.update({
-            "text": self.text
+            "text": self.text,
+            "input_mode": self.input_mode,
+            "key_interval": self.key_interval
         })
         return data
 
+@register_action
 class KeyCombinationAction(MacroAction):
     """
     키 조합 입력 동작
     """
+    __slots__ = ("key_combination",)
+    
     def __init__(self, key_combination="", name="키 조합"):
         super().__init__(name)
         self.key_combination = key_combination
     
-    def execute(self):
+    def execute(self, context=None):
         """
         키 조합 입력 실행
         """
         try:
-            import pyautogui
-            import time
-            import pyperclip
-            
-            keys = self.key_combination.split('+')
-            keys = [key.strip().lower() for key in keys]  # 모든 키를 소문자로 변환
-            
-            app_logger.debug(f"키 조합 입력: {self.key_combination}")
-            
-            # Ctrl+C 처리 - 클립보드 클리어 하지 않음
-            if len(keys) == 2 and keys[0] in ['ctrl', 'control'] and keys[1] == 'c':
-                app_logger.debug("복사(Ctrl+C) 동작 감지")
-                # 키 조합 실행
-                pyautogui.hotkey(*keys)
-                # 클립보드 복사가 완료될 때까지 잠시 대기
-                time.sleep(0.5)  # 500ms 대기
-                
-            # Ctrl+V 또는 기타 키 조합 처리
-            else:
-                # 키 조합 실행
-                pyautogui.hotkey(*keys)
-            
-            return True
+            return self.compile(context or ExecutionContext())()
         
         except Exception as e:
             app_logger.error(f"키 조합 입력 실패: {str(e)}", exc_info=True)
             return False
+    
+    def compile(self, context):
+        """
+        분해된 키 목록을 미리 바인딩한 키 조합 입력 함수 반환
+        """
+        control = context.control
+        timeout = context.clipboard_timeout
+        hotkey = context.backend.hotkey
+        keys = self._get_keys()
+        combo_msg = f"키 조합 입력: {self.key_combination}"
+        
+        # Ctrl+C 처리 - 클립보드 클리어 하지 않음
+        if self.copies_to_clipboard():
+            def run():
+                app_logger.action_debug(combo_msg)
+                app_logger.action_debug("복사(Ctrl+C) 동작 감지")
+                previous = get_change_token()
+                # 키 조합 실행
+                hotkey(*keys)
+                # 클립보드가 바뀌는 즉시 반환 (최대 timeout 초, 중지 시 즉시 반환)
+                if not wait_for_change(previous, timeout, control):
+                    app_logger.debug("복사 후 %s초 안에 클립보드 변경이 감지되지 않음", timeout)
+                return True
+        
+        # Ctrl+V 또는 기타 키 조합 처리
+        else:
+            def run():
+                app_logger.action_debug(combo_msg)
+                # 키 조합 실행
+                hotkey(*keys)
+                return True
+        
+        return run
+    
+    def _get_keys(self):
+        """
+        키 조합 문자열을 소문자 키 이름 튜플로 분해
+        """
+        return tuple(key.strip().lower() for key in self.key_combination.split('+'))
+    
+    def copies_to_clipboard(self):
+        """
+        복사(Ctrl+C) 키 조합인지 여부
+        """
+        keys = self._get_keys()
+        return len(keys) == 2 and keys[0] in ('ctrl', 'control') and keys[1] == 'c'
         
     def get_description(self):
         """
@@ -367,42 +485,78 @@ class KeyCombinationAction(MacroAction):
         return data
 
 
+@register_action
 class TextListInputAction(MacroAction):
     """
     텍스트 리스트 입력 동작
     """
-    def __init__(self, text_list=None, name="텍스트 리스트 입력"):
+    __slots__ = ("text_list", "current_index", "input_mode", "key_interval", "text_file")
+    
+    def __init__(self, text_list=None, name="텍스트 리스트 입력", input_mode=INPUT_MODE_AUTO,
+                 key_interval=DEFAULT_KEY_INTERVAL, text_file=""):
+        """
+        input_mode: 입력 방식 (auto: 항목마다 자동 선택, type: 타이핑, paste: 붙여넣기)
+        key_interval: 타이핑 시 글자 간 간격 (ms)
+        text_file: 항목을 읽어 올 텍스트 파일 경로 (지정하면 text_list 대신 파일의 각 줄 사용)
+        """
         super().__init__(name)
         self.text_list = text_list or []
         self.current_index = 0
+        self.input_mode = input_mode
+        self.key_interval = key_interval
+        self.text_file = text_file
     
-    def execute(self):
+    def get_source(self):
+        """
+        항목 원본 반환 (파일 참조면 FileTextSource, 아니면 text_list)
+        """
+        if self.text_file:
+            return open_text_source(self.text_file)
+        return self.text_list
+    
+    def execute(self, context=None):
         """
         텍스트 리스트에서 다음 항목 입력 실행
         """
         try:
-            import pyautogui
-            
-            if not self.text_list or self.current_index >= len(self.text_list):
+            return self.compile(context or ExecutionContext())()
+        except Exception as e:
+            app_logger.error(f"텍스트 리스트 입력 실패: {str(e)}", exc_info=True)
+            return False
+    
+    def compile(self, context):
+        """
+        텍스트 리스트 입력 함수 반환 (현재 인덱스는 실행 시점에 참조)
+        """
+        input_text = make_text_writer(context)
+        input_mode = self.input_mode
+        interval = self.key_interval / 1000.0
+        # 파일 참조는 컴파일 시점의 색인에서 항목을 한 줄씩 읽음 (파일이 바뀌었으면 색인 재생성)
+        # 실행 계획이 색인을 잡고 있는 동안만 파일이 열려 있음
+        text_list = self.get_source()
+        if self.text_file:
+            text_list = text_list.open()
+        count = len(text_list)
+        
+        def run():
+            index = self.current_index
+            if index >= count:
                 app_logger.warning("텍스트 리스트가 비어 있거나 모든 항목을 사용했습니다.")
                 return False
             
             # 현재 인덱스의 텍스트 가져오기
-            text = self.text_list[self.current_index]
-            preview = text[:20] + "..." if len(text) > 20 else text
-            app_logger.debug(f"텍스트 리스트 입력: [{self.current_index}] {preview}")
+            text = text_list[index]
+            app_logger.action_debug("텍스트 리스트 입력: [%d] %.20s%s", index, text, "..." if len(text) > 20 else "")
             
             # 텍스트 입력
-            pyautogui.PAUSE = 0.05
-            pyautogui.write(text, interval=0.05)
+            input_text(text, input_mode, interval)
             
             # 다음 항목으로 인덱스 증가
-            self.current_index += 1
+            self.current_index = index + 1
             
             return True
-        except Exception as e:
-            app_logger.error(f"텍스트 리스트 입력 실패: {str(e)}", exc_info=True)
-            return False
+        
+        return run
         
     def reset(self):
         """
@@ -415,6 +569,10 @@ class TextListInputAction(MacroAction):
         """
         동작 설명 반환
         """
+        # 파일 참조는 설명 표시만으로 파일 전체를 읽지 않도록 경로만 표시
+        if self.text_file:
+            return f"텍스트 리스트 파일: {os.path.basename(self.text_file)}"
+        
         if not self.text_list:
             return "텍스트 리스트: (비어 있음)"
         
@@ -430,9 +588,13 @@ class TextListInputAction(MacroAction):
     
     def get_items_count(self):
         """
-        텍스트 리스트 항목 개수 반환
+        텍스트 리스트 항목 개수 반환 (파일을 읽을 수 없으면 0)
         """
-        return len(self.text_list)
+        try:
+            return len(self.get_source())
+        except OSError as e:
+            app_logger.warning(f"텍스트 리스트 파일을 읽을 수 없음: {str(e)}")
+            return 0
     
     def to_dict(self):
         """
@@ -440,32 +602,58 @@ class TextListInputAction(MacroAction):
         """
         data = super().to_dict()
         data.update({
-            "text_list": self.text_list
+            "text_list": [] if self.text_file else self.text_list,
+            "text_file": self.text_file,
+            "input_mode": self.input_mode,
+            "key_interval": self.key_interval
         })
         return data
 
+@register_action
 class DelayAction(MacroAction):
     """
     지연 시간 동작
     """
-    def __init__(self, delay=1000, name="지연"):
+    __slots__ = ("delay",)
+    
+    is_wait = True
+    uses_input = False
+    
+    def __init__(self, delay=1000, name="지연 시간"):
         super().__init__(name)
         self.delay = delay  # ms
     
-    def execute(self):
+    def execute(self, context=None):
         """
         지연 시간 실행
         """
         try:
-            import time
-            delay_sec = self.delay / 1000.0
-            app_logger.debug(f"지연 시간 실행: {self.delay}ms ({delay_sec:.2f}초)")
-            time.sleep(delay_sec)
-            return True
+            return self.compile(context or ExecutionContext())()
         except Exception as e:
             app_logger.error(f"지연 시간 실행 실패: {str(e)}", exc_info=True)
             return False
     
+    def compile(self, context):
+        """
+        초 단위로 변환된 지연 시간을 미리 바인딩한 대기 함수 반환
+        """
+        wait = context.control.wait
+        delay_sec = self.delay / 1000.0
+        delay_msg = f"지연 시간 실행: {self.delay}ms ({delay_sec:.2f}초)"
+        
+        def run():
+            app_logger.action_debug(delay_msg)
+            # 중지 요청 시 즉시 반환 (일시 정지 시간은 지연 시간에 포함하지 않음)
+            return wait(delay_sec)
+        
+        return run
+    
+    def get_wait_seconds(self):
+        """
+        지연 시간을 초 단위로 반환
+        """
+        return self.delay / 1000.0
+    
     def get_description(self):
         """
         동작 설명 반환
@@ -482,16 +670,21 @@ class DelayAction(MacroAction):
         })
         return data
     
+@register_action
 class ClipboardSaveAction(MacroAction):
     """
     클립보드 내용 저장 동작
     """
+    __slots__ = ("output_file", "clipboard_manager")
+    
+    uses_input = False
+    
     def __init__(self, output_file="", name="클립보드 저장"):
         super().__init__(name)
         self.output_file = output_file
         self.clipboard_manager = None
     
-    def execute(self):
+    def execute(self, context=None):
         """
         클립보드 저장 시작
         """
@@ -526,17 +719,22 @@ class ClipboardSaveAction(MacroAction):
         })
         return data
 
+@register_action
 class FolderMonitorAction(MacroAction):
     """
     폴더 모니터링 동작
     """
-    def __init__(self, folder_path="", name="폴더 모니터링"):
+    __slots__ = ("folder_path", "folder_monitor", "filename_template")
+    
+    uses_input = False
+    
+    def __init__(self, folder_path="", name="폴더 모니터링", filename_template="clipboard.txt"):
         super().__init__(name)
         self.folder_path = folder_path
         self.folder_monitor = None
-        self.filename_template = "clipboard.txt"  # 기본 파일명
+        self.filename_template = filename_template  # 저장 파일명
     
-    def execute(self):
+    def execute(self, context=None):
         """
         폴더 모니터링 시작
         """
@@ -592,10 +790,13 @@ class FolderMonitorAction(MacroAction):
         else:
             app_logger.debug("초기화할 폴더 모니터가 없습니다")
 
+@register_action
 class MouseScrollAction(MacroAction):
     """
     마우스 스크롤 동작
     """
+    __slots__ = ("x", "y", "direction", "clicks")
+    
     def __init__(self, x=0, y=0, direction=0, clicks=1, name="마우스 스크롤"):
         """
         direction: 0=아래로, 1=위로
@@ -607,30 +808,44 @@ class MouseScrollAction(MacroAction):
         self.direction = direction
         self.clicks = clicks
     
-    def execute(self):
+    def execute(self, context=None):
         """
         마우스 스크롤 실행
         """
         try:
-            import pyautogui
-            
+            return self.compile(context or ExecutionContext())()
+        except Exception as e:
+            app_logger.error(f"마우스 스크롤 실패: {str(e)}", exc_info=True)
+            return False
+    
+    def compile(self, context):
+        """
+        좌표와 스크롤 값을 미리 바인딩한 마우스 스크롤 함수 반환
+        """
+        backend = context.backend
+        move_to = backend.move_to
+        scroll = backend.scroll
+        x, y = self.x, self.y
+        
+        # 방향에 따라 스크롤 값 결정
+        scroll_value = self.clicks
+        if self.direction == 0:  # 아래로 스크롤
+            scroll_value = -scroll_value
+        
+        move_msg = f"마우스 이동: ({x}, {y})"
+        scroll_msg = f"마우스 스크롤: 방향={self.direction}, 클릭={self.clicks}, 값={scroll_value}"
+        
+        def run():
             # 마우스 위치 이동
-            app_logger.debug(f"마우스 이동: ({self.x}, {self.y})")
-            pyautogui.moveTo(self.x, self.y)
-            
-            # 방향에 따라 스크롤 값 결정
-            scroll_value = self.clicks
-            if self.direction == 0:  # 아래로 스크롤
-                scroll_value = -scroll_value
+            app_logger.action_debug(move_msg)
+            move_to(x, y)
             
             # 스크롤 실행
-            app_logger.debug(f"마우스 스크롤: 방향={self.direction}, 클릭={self.clicks}, 값={scroll_value}")
-            pyautogui.scroll(scroll_value)
-            
+            app_logger.action_debug(scroll_msg)
+            scroll(scroll_value)
             return True
-        except Exception as e:
-            app_logger.error(f"마우스 스크롤 실패: {str(e)}", exc_info=True)
-            return False
+        
+        return run
     
     def get_description(self):
         """
@@ -650,4 +865,326 @@ class MouseScrollAction(MacroAction):
             "direction": self.direction,
             "clicks": self.clicks
         })
-        return data
\ No newline at end of file
+        return data
+
+class FlowAction(MacroAction):
+    """
+    흐름 제어 동작의 기본 클래스
+
+    입력을 발생시키지 않으며, 엔진은 실행 계획 생성 시 계산한 점프 테이블에 따라
+    다음에 실행할 동작을 결정한다. 흐름 제어 동작 뒤에는 동작 간 지연을 넣지 않는다.
+    """
+    __slots__ = ()
+    
+    uses_input = False
+    
+    def execute(self, context=None):
+        """
+        단독 실행 시에는 아무 동작도 하지 않음 (흐름 제어는 엔진이 수행)
+        """
+        return True
+
+
+@register_action
+class LabelAction(FlowAction):
+    """
+    라벨 동작 (라벨로 이동 동작의 대상)
+    """
+    __slots__ = ("label",)
+    
+    flow = FLOW_LABEL
+    
+    def __init__(self, label="", name="라벨"):
+        super().__init__(name)
+        self.label = label
+    
+    def get_description(self):
+        """
+        동작 설명 반환
+        """
+        return f"라벨: {self.label}"
+    
+    def to_dict(self):
+        """
+        동작을 딕셔너리로 변환
+        """
+        data = super().to_dict()
+        data.update({
+            "label": self.label
+        })
+        return data
+
+
+@register_action
+class JumpAction(FlowAction):
+    """
+    라벨로 이동 동작
+    """
+    __slots__ = ("label",)
+    
+    flow = FLOW_JUMP
+    
+    def __init__(self, label="", name="라벨로 이동"):
+        super().__init__(name)
+        self.label = label
+    
+    def get_description(self):
+        """
+        동작 설명 반환
+        """
+        return f"라벨로 이동: {self.label}"
+    
+    def to_dict(self):
+        """
+        동작을 딕셔너리로 변환
+        """
+        data = super().to_dict()
+        data.update({
+            "label": self.label
+        })
+        return data
+
+
+@register_action
+class RepeatStartAction(FlowAction):
+    """
+    반복 블록 시작 동작 (반복 끝 동작까지를 count 회 반복)
+    """
+    __slots__ = ("count",)
+    
+    flow = FLOW_REPEAT_START
+    
+    def __init__(self, count=2, name="반복 시작"):
+        """
+        count: 반복 횟수 (0 이하는 무한 반복)
+        """
+        super().__init__(name)
+        self.count = count
+    
+    def get_description(self):
+        """
+        동작 설명 반환
+        """
+        if self.count <= 0:
+            return "반복 시작: 무한 반복"
+        return f"반복 시작: {self.count}회"
+    
+    def to_dict(self):
+        """
+        동작을 딕셔너리로 변환
+        """
+        data = super().to_dict()
+        data.update({
+            "count": self.count
+        })
+        return data
+
+
+@register_action
+class RepeatEndAction(FlowAction):
+    """
+    반복 블록 끝 동작
+    """
+    __slots__ = ()
+    
+    flow = FLOW_REPEAT_END
+    
+    def __init__(self, name="반복 끝"):
+        super().__init__(name)
+
+
+@register_action
+class IfAction(FlowAction):
+    """
+    조건 블록 시작 동작
+
+    조건이 참이면 다음 동작을, 거짓이면 조건 아니면(없으면 조건 끝) 다음 동작을 실행한다.
+    """
+    __slots__ = ("condition", "value", "negate")
+    
+    flow = FLOW_IF
+    
+    # 조건 종류
+    CONDITION_CLIPBOARD_CONTAINS = "clipboard_contains"
+    CONDITION_CLIPBOARD_EMPTY = "clipboard_empty"
+    CONDITION_FILE_EXISTS = "file_exists"
+    CONDITIONS = (CONDITION_CLIPBOARD_CONTAINS, CONDITION_CLIPBOARD_EMPTY, CONDITION_FILE_EXISTS)
+    CONDITION_NAMES = {
+        CONDITION_CLIPBOARD_CONTAINS: "클립보드에 텍스트 포함",
+        CONDITION_CLIPBOARD_EMPTY: "클립보드가 비어 있음",
+        CONDITION_FILE_EXISTS: "파일/폴더 존재",
+    }
+    
+    def __init__(self, condition=CONDITION_CLIPBOARD_CONTAINS, value="", negate=False, name="조건 시작"):
+        """
+        condition: 조건 종류
+        value: 조건 값 (포함 여부를 확인할 텍스트 또는 파일 경로)
+        negate: True 이면 조건 결과를 반대로 사용
+        """
+        super().__init__(name)
+        self.condition = condition
+        self.value = value
+        self.negate = negate
+    
+    def execute(self, context=None):
+        """
+        조건 평가 결과 반환
+        """
+        try:
+            return self.compile(context or ExecutionContext())()
+        except Exception as e:
+            app_logger.error(f"조건 평가 실패: {str(e)}", exc_info=True)
+            return False
+    
+    def compile(self, context):
+        """
+        조건 값을 미리 바인딩한 조건 평가 함수 반환 (평가 오류는 거짓으로 처리)
+        """
+        value = self.value
+        if self.condition == self.CONDITION_CLIPBOARD_CONTAINS:
+            check = lambda: value in (read_clipboard() or "")
+        elif self.condition == self.CONDITION_CLIPBOARD_EMPTY:
+            check = lambda: not read_clipboard()
+        elif self.condition == self.CONDITION_FILE_EXISTS:
+            check = lambda: os.path.exists(value)
+        else:
+            raise ValueError(f"알 수 없는 조건: {self.condition}")
+        
+        negate = self.negate
+        condition_msg = f"조건 평가: {self.get_description()}"
+        
+        def run():
+            try:
+                result = bool(check()) != negate
+            except Exception as e:
+                app_logger.warning(f"조건 평가 중 오류 발생 (거짓으로 처리): {str(e)}")
+                result = False
+            app_logger.action_debug("%s -> %s", condition_msg, result)
+            return result
+        
+        return run
+    
+    def get_description(self):
+        """
+        동작 설명 반환
+        """
+        description = self.CONDITION_NAMES.get(self.condition, self.condition)
+        if self.condition != self.CONDITION_CLIPBOARD_EMPTY:
+            description += f" ({self.value})"
+        if self.negate:
+            description += " 이 아니면"
+        return f"조건: {description}"
+    
+    def to_dict(self):
+        """
+        동작을 딕셔너리로 변환
+        """
+        data = super().to_dict()
+        data.update({
+            "condition": self.condition,
+            "value": self.value,
+            "negate": self.negate
+        })
+        return data
+
+
+@register_action
+class ElseAction(FlowAction):
+    """
+    조건 블록의 아니면 동작 (조건이 거짓일 때 실행할 구간의 시작)
+    """
+    __slots__ = ()
+    
+    flow = FLOW_ELSE
+    
+    def __init__(self, name="조건 아니면"):
+        super().__init__(name)
+
+
+@register_action
+class EndIfAction(FlowAction):
+    """
+    조건 블록 끝 동작
+    """
+    __slots__ = ()
+    
+    flow = FLOW_END_IF
+    
+    def __init__(self, name="조건 끝"):
+        super().__init__(name)
+
+
+@register_action
+class CallMacroAction(MacroAction):
+    """
+    하위 매크로 호출 동작
+
+    다른 매크로 파일의 동작 목록을 현재 위치에서 한 번 실행한다 (하위 매크로의
+    반복 횟수 설정은 사용하지 않고, 동작 간 지연은 하위 매크로 파일의 설정을 따른다).
+    파일 파싱 결과는 공용 매크로 캐시에 보관되고 실행 계획은 매크로 시작 시 한 번만
+    만들어지므로, 반복 호출해도 파일을 다시 읽거나 파싱하지 않는다. 하위 동작 객체는
+    컴파일할 때마다 새로 만들어 sub_actions 에 두므로 텍스트 리스트 위치 같은 상태가
+    다른 엔진과 공유되지 않으며, 체크포인트에도 함께 저장된다.
+    호출 단계 자체는 입력 잠금을 잡지 않고, 입력 중재자를 사용할 때 하위 매크로의
+    입력 단계마다 잠금을 얻으므로 하위 매크로의 지연 중에는 다른 엔진이 입력할 수 있다.
+    """
+    __slots__ = ("file_path", "sub_actions")
+    
+    uses_input = False
+    
+    def __init__(self, file_path="", name="하위 매크로 호출"):
+        super().__init__(name)
+        self.file_path = file_path
+        self.sub_actions = []  # 마지막으로 컴파일한 하위 동작 목록 (실행 상태 포함)
+    
+    def execute(self, context=None):
+        """
+        하위 매크로 실행
+        """
+        try:
+            return self.compile(context or ExecutionContext())()
+        except Exception as e:
+            app_logger.error(f"하위 매크로 호출 실패: {str(e)}", exc_info=True)
+            return False
+    
+    def compile(self, context):
+        """
+        하위 매크로를 실행 계획으로 변환해 바인딩한 호출 함수 반환
+        
+        상대 경로는 호출한 매크로 파일이 있는 디렉토리 기준으로 찾는다.
+        같은 파일을 다시 호출하는 재귀 구조는 ValueError 를 발생시킨다.
+        """
+        from core.macro_cache import get_macro_cache
+        from core.plan import compile_plan, run_plan
+        
+        macro = get_macro_cache().get(context.resolve_path(self.file_path))
+        sub_context = context.for_call(macro.path)
+        
+        # 상태를 가진 하위 동작이 호출/엔진 간에 공유되지 않도록 매번 새로 생성
+        actions = macro.create_actions()
+        plan = compile_plan(actions, sub_context)
+        self.sub_actions = actions
+        delay_sec = macro.delay / 1000.0
+        call_msg = f"하위 매크로 호출: {macro.path} ({len(plan)}단계)"
+        
+        def run():
+            app_logger.action_debug(call_msg)
+            return run_plan(plan, sub_context, delay_sec)
+        
+        return run
+    
+    def get_description(self):
+        """
+        동작 설명 반환
+        """
+        return f"하위 매크로 호출: {self.file_path}"
+    
+    def to_dict(self):
+        """
+        동작을 딕셔너리로 변환
+        """
+        data = super().to_dict()
+        data.update({
+            "file_path": self.file_path
+        })
+        return data
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/checkpoint.py
+
+import os
+import json
+import time
+import hashlib
+from utils.logger import app_logger
+from core.macro_cache import get_macro_cache
+from core.actions import CallMacroAction
+from core.plan import resolve_macro_path
+
+CHECKPOINT_VERSION = 1
+
+# 실행 중 체크포인트 저장 간격 (초)
+DEFAULT_CHECKPOINT_INTERVAL = 5.0
+
+def compute_actions_digest(actions):
+    """
+    동작 목록 자체의 해시 (매크로 크기에 비례하므로 편집이 없으면 재사용)
+    """
+    data = json.dumps([action.to_dict() for action in actions], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def _collect_sub_macro_keys(action_dicts, caller_path, keys, visited):
+    """
+    하위 매크로 호출이 가리키는 파일의 캐시 키를 중첩된 호출까지 keys 에 추가
+    """
+    for action_data in action_dicts:
+        if action_data.get("type") != "CallMacroAction":
+            continue
+        file_path = resolve_macro_path(action_data.get("file_path", ""), caller_path)
+        try:
+            macro = get_macro_cache().get(file_path)
+        except Exception:
+            # 읽을 수 없는 파일은 경로만 기록 (실행 시 호출이 실패함)
+            keys.append((file_path, None))
+            continue
+        keys.append(macro.key)
+        if macro.path not in visited:
+            visited.add(macro.path)
+            _collect_sub_macro_keys(macro.action_dicts, macro.path, keys, visited)
+
+def compute_macro_hash(actions, actions_digest=None, macro_path=None):
+    """
+    동작 목록의 식별 해시 반환 (동작 구성이 바뀌면 이전 체크포인트로 재개하지 않음)
+
+    하위 매크로 파일의 (경로, 수정 시각, 크기)도 포함하므로 하위 매크로가
+    바뀌면 "호출/하위" 텍스트 위치를 다른 동작에 적용하지 않는다. 반복 횟수나
+    지연 시간 같은 실행 설정은 포함하지 않으므로 재개할 때 반복 횟수를 늘려도
+    같은 매크로로 취급한다. actions_digest 는 미리 계산한 compute_actions_digest 값이고,
+    macro_path 는 하위 매크로 상대 경로의 기준이 되는 매크로 파일이다.
+    """
+    if actions_digest is None:
+        actions_digest = compute_actions_digest(actions)
+    keys = []
+    calls = [action.to_dict() for action in actions if isinstance(action, CallMacroAction)]
+    _collect_sub_macro_keys(calls, macro_path, keys, set())
+    digest = hashlib.sha256(actions_digest.encode('utf-8'))
+    for key in keys:
+        digest.update(repr(key).encode('utf-8'))
+    return digest.hexdigest()
+
+def collect_text_actions(actions, prefix=""):
+    """
+    체크포인트에 진행 위치를 저장할 동작 목록 [(키, 동작)] 반환
+
+    키는 동작 인덱스 문자열이며, 하위 매크로 호출 안의 동작은
+    "호출 동작 인덱스/하위 동작 인덱스" 형식이다.
+    """
+    result = []
+    for index, action in enumerate(actions):
+        key = f"{prefix}{index}"
+        if hasattr(action, 'current_index'):
+            result.append((key, action))
+        sub_actions = getattr(action, 'sub_actions', None)
+        if sub_actions:
+            result.extend(collect_text_actions(sub_actions, key + "/"))
+    return result
+
+def make_checkpoint(macro_hash, loop_counter, pc, text_indexes, repeat_counters):
+    """
+    체크포인트 데이터 생성
+
+    loop_counter: 완료한 반복 횟수
+    pc: 다음에 실행할 단계 번호 (이 단계는 아직 실행되지 않음)
+    text_indexes: {collect_text_actions 키: 텍스트 리스트 현재 인덱스}
+    repeat_counters: {반복 시작 동작 인덱스: 완료한 반복 횟수}
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "macro_hash": macro_hash,
+        "loop_counter": loop_counter,
+        "pc": pc,
+        "text_indexes": {str(key): value for key, value in text_indexes.items()},
+        "repeat_counters": {str(index): value for index, value in repeat_counters.items()},
+        "saved_at": time.time()
+    }
+
+def save_checkpoint(path, checkpoint):
+    """
+    체크포인트를 원자적으로 저장 (성공 시 True)
+
+    같은 디렉토리의 임시 파일에 기록하고 디스크에 반영(fsync)한 뒤
+    os.replace 로 교체하므로, 저장 도중 프로그램이 종료되어도 이전
+    체크포인트나 새 체크포인트 중 하나는 온전히 남는다.
+    """
+    temp_path = path + ".tmp"
+    try:
+        dir_path = os.path.dirname(path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(checkpoint, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+        return True
+    except Exception as e:
+        app_logger.error(f"체크포인트 저장 실패: {path} - {str(e)}", exc_info=True)
+        return False
+
+def load_checkpoint(path):
+    """
+    체크포인트 불러오기 (없거나 손상되었으면 None)
+    """
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            checkpoint = json.load(f)
+        if checkpoint.get("version") != CHECKPOINT_VERSION:
+            app_logger.warning(f"지원하지 않는 체크포인트 버전: {checkpoint.get('version')}")
+            return None
+        checkpoint["text_indexes"] = {str(key): value
+                                      for key, value in checkpoint.get("text_indexes", {}).items()}
+        checkpoint["repeat_counters"] = {int(index): value
+                                         for index, value in checkpoint.get("repeat_counters", {}).items()}
+        return checkpoint
+    except Exception as e:
+        app_logger.warning(f"체크포인트를 읽을 수 없음: {path} - {str(e)}")
+        return None
+
+def remove_checkpoint(path):
+    """
+    체크포인트 삭제 (매크로가 끝까지 실행된 경우)
+    """
+    try:
+        if path and os.path.exists(path):
+            os.remove(path)
+            app_logger.debug(f"체크포인트 삭제: {path}")
+    except OSError as e:
+        app_logger.warning(f"체크포인트 삭제 실패: {path} - {str(e)}")
+
+def get_checkpoint_path(macro_path):
+    """
+    매크로 파일에 대응하는 기본 체크포인트 경로
+    """
+    return macro_path + ".checkpoint"
@@ -3,15 +3,74 @@
 # core/clipboard_manager.py
 
 import os
-import time
+import queue
 import threading
 import pyperclip
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QGuiApplication
 from utils.logger import app_logger
+from core.scheduler import ExecutionControl
+from core.clipboard_utils import (is_internal_content, read_clipboard, get_sequence_number,
+                                  get_change_token, POLL_BACKOFF)
+
+# 이벤트를 사용할 수 없을 때의 확인 간격 (변경 직후에는 짧게, 변화가 없으면 점점 늘림)
+MONITOR_POLL_MIN = 0.02
+MONITOR_POLL_MAX = 1.0
+
+# GUI 스레드에서 시그널 연결에 실패했을 때 모니터링 스레드를 주기적 확인으로 전환하는 표시
+_POLL_FALLBACK = object()
+
+
+class _GuiThreadInvoker(QObject):
+    """
+    다른 스레드에서 요청한 함수를 GUI 스레드에서 실행
+
+    GUI 스레드로 옮긴 객체의 슬롯에 시그널을 보내므로 요청은 GUI 스레드의
+    이벤트 큐를 거쳐 요청한 순서대로 실행된다.
+    """
+    requested = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.requested.connect(self._run)
+
+    @pyqtSlot(object)
+    def _run(self, function):
+        function()
+
+
+_invoker = None
+_invoker_lock = threading.Lock()
+
+def _call_in_gui_thread(function):
+    """
+    GUI 스레드에서 function 실행 (GUI 스레드에서 호출하면 바로 실행, 아니면 이벤트 큐로 전달)
+    """
+    global _invoker
+    app = QGuiApplication.instance()
+    if app is None:
+        return
+    if QThread.currentThread() == app.thread():
+        function()
+        return
+    with _invoker_lock:
+        if _invoker is None:
+            invoker = _GuiThreadInvoker()
+            invoker.moveToThread(app.thread())
+            _invoker = invoker
+    _invoker.requested.emit(function)
+
 
 class ClipboardManager(QObject):
     """
     클립보드 내용을 모니터링하고 파일에 저장하는 클래스
+    
+    Qt 애플리케이션이 있으면 QClipboard.dataChanged 시그널로 변경을 바로
+    받는다. 시그널 연결/해제는 항상 GUI 스레드에서 하며(동작이 실행 스레드에서
+    시작하면 GUI 스레드로 전달), 시그널은 GUI 스레드에서 내용을 읽어 큐에
+    넣기만 한다. 파일 저장은 모니터링 스레드가 하므로 변경이 연달아 일어나도 빠짐없이
+    저장된다. Qt 애플리케이션이 없으면(헤드리스 실행) 클립보드 변경 순번
+    (Windows) 또는 내용을 확인하되, 변화가 없을수록 확인 간격을 늘린다.
     """
     # 상태 변화 시그널
     status_changed = pyqtSignal(str)
@@ -25,6 +84,13 @@ class ClipboardManager(QObject):
         self.thread = None
         self.last_content = ""
         
+        # 클립보드 변경 이벤트 (이벤트를 사용할 때만 설정, 변경된 내용 또는 깨우기용 None)
+        self.clipboard = None
+        self.events = None
+        
+        # 중지 요청 시 대기 중인 모니터링 스레드를 즉시 깨우기 위한 제어 객체
+        self.control = ExecutionControl()
+        
         app_logger.info("클립보드 매니저 초기화 완료")
     
     def set_output_file(self, file_path):
@@ -49,14 +115,20 @@ class ClipboardManager(QObject):
             return
         
         # 클립보드 초기 상태 저장
-        self.last_content = pyperclip.paste()
+        self.last_content = read_clipboard() or ""
         app_logger.debug(f"클립보드 초기 상태 저장 (길이: {len(self.last_content)})")
         
         self.monitoring = True
+        self.control.reset()
+        
+        # 변경 이벤트를 받을 수 있으면 이벤트, 아니면 주기적 확인
+        use_events = self._connect_events()
+        target = self._monitor_events if use_events else self._monitor_clipboard
         
         # 모니터링 스레드 시작
-        app_logger.info(f"클립보드 모니터링 시작 (출력 파일: {self.output_file})")
-        self.thread = threading.Thread(target=self._monitor_clipboard)
+        app_logger.info(f"클립보드 모니터링 시작 (출력 파일: {self.output_file}, "
+                        f"{'변경 이벤트' if use_events else '주기적 확인'})")
+        self.thread = threading.Thread(target=target)
         self.thread.daemon = True
         self.thread.start()
         
@@ -72,6 +144,8 @@ class ClipboardManager(QObject):
         
         app_logger.info("클립보드 모니터링 중지")
         self.monitoring = False
+        self.control.stop()
+        self._disconnect_events()
         
         # 스레드 종료 대기
         if self.thread and self.thread.is_alive():
@@ -81,6 +155,75 @@ class ClipboardManager(QObject):
         
         self.status_changed.emit("클립보드 모니터링 중지됨")
     
+    def _connect_events(self):
+        """
+        QClipboard.dataChanged 시그널 연결 요청 (Qt 애플리케이션이 없으면 False)
+        
+        실제 연결은 GUI 스레드에서 _connect_clipboard 가 한다. 연결에 실패하면
+        모니터링 스레드가 주기적 확인으로 전환한다.
+        """
+        if QGuiApplication.instance() is None:
+            return False
+        self.events = queue.SimpleQueue()
+        _call_in_gui_thread(self._connect_clipboard)
+        return True
+    
+    def _connect_clipboard(self):
+        """
+        GUI 스레드에서 시그널 연결
+        
+        이 객체는 이벤트 루프가 없는 실행 스레드에서 만들어질 수 있으므로 직접
+        연결을 사용해 시그널을 보낸 GUI 스레드에서 바로 _on_clipboard_changed 를 호출한다.
+        """
+        if not self.monitoring or self.clipboard is not None:
+            return
+        try:
+            clipboard = QGuiApplication.clipboard()
+            clipboard.dataChanged.connect(self._on_clipboard_changed, Qt.DirectConnection)
+            self.clipboard = clipboard
+        except Exception as e:
+            app_logger.debug(f"클립보드 변경 이벤트를 사용할 수 없어 주기적으로 확인: {str(e)}")
+            self.events.put(_POLL_FALLBACK)
+    
+    def _disconnect_events(self):
+        """
+        시그널 연결 해제 요청 및 대기 중인 모니터링 스레드 깨우기
+        """
+        if self.events is None:
+            return
+        _call_in_gui_thread(self._disconnect_clipboard)
+        self.events.put(None)
+    
+    def _disconnect_clipboard(self):
+        """
+        GUI 스레드에서 시그널 연결 해제
+        """
+        clipboard = self.clipboard
+        if clipboard is None:
+            return
+        self.clipboard = None
+        try:
+            clipboard.dataChanged.disconnect(self._on_clipboard_changed)
+        except (TypeError, RuntimeError) as e:
+            app_logger.debug(f"클립보드 변경 이벤트 연결 해제 실패: {str(e)}")
+    
+    def _on_clipboard_changed(self):
+        """
+        클립보드 변경 시그널 처리 (GUI 스레드, 내용만 읽어 큐에 넣음)
+        """
+        clipboard = self.clipboard
+        if clipboard is not None:
+            self.events.put(clipboard.text())
+    
+    def _handle_content(self, current_content):
+        """
+        새로운 내용이 있고 이전과 다른 경우에만 저장 (붙여넣기 입력용으로 넣은 내용은 제외)
+        """
+        if current_content and current_content != self.last_content:
+            if not is_internal_content(current_content):
+                self.save_clipboard_content(current_content)
+            self.last_content = current_content
+    
     def _clear_clipboard(self):
         """
         클립보드 내용 초기화
@@ -115,24 +258,56 @@ class ClipboardManager(QObject):
             self.status_changed.emit(error_msg)
             return False
     
+    def _monitor_events(self):
+        """
+        클립보드 모니터링 스레드 함수 (변경 이벤트 사용, 변경이 없으면 대기만 함)
+        """
+        try:
+            app_logger.debug("클립보드 모니터링 스레드 시작 (변경 이벤트)")
+            events = self.events
+            
+            while self.monitoring:
+                current_content = events.get()
+                if current_content is None:
+                    continue
+                if current_content is _POLL_FALLBACK:
+                    self._monitor_clipboard()
+                    return
+                self._handle_content(current_content)
+            
+            app_logger.debug("클립보드 모니터링 스레드 종료")
+        
+        except Exception as e:
+            error_msg = f"클립보드 모니터링 중 오류 발생: {str(e)}"
+            app_logger.error(error_msg, exc_info=True)
+            self.monitoring = False
+            self.status_changed.emit(error_msg)
+    
     def _monitor_clipboard(self):
         """
-        클립보드 모니터링 스레드 함수
+        클립보드 모니터링 스레드 함수 (주기적 확인)
+        
+        Windows 에서는 내용 대신 변경 순번을 확인하고 바뀌었을 때만 내용을
+        읽는다. 변화가 없으면 확인 간격을 MONITOR_POLL_MAX 까지 늘리고,
+        변경을 발견하면 다시 MONITOR_POLL_MIN 부터 확인한다.
         """
         try:
-            app_logger.debug("클립보드 모니터링 스레드 시작")
+            app_logger.debug("클립보드 모니터링 스레드 시작 (주기적 확인)")
+            use_sequence = get_sequence_number() is not None
+            last_token = get_change_token()
+            interval = MONITOR_POLL_MIN
             
             while self.monitoring:
-                # 현재 클립보드 내용 가져오기
-                current_content = pyperclip.paste()
-                
-                # 새로운 내용이 있고 이전과 다른 경우에만 저장
-                if current_content and current_content != self.last_content:
-                    self.save_clipboard_content(current_content)
-                    self.last_content = current_content
+                token = get_change_token()
+                if token != last_token:
+                    last_token = token
+                    self._handle_content(read_clipboard() if use_sequence else token)
+                    interval = MONITOR_POLL_MIN
+                else:
+                    interval = min(interval * POLL_BACKOFF, MONITOR_POLL_MAX)
                 
-                # 잠시 대기
-                time.sleep(0.5)
+                # 잠시 대기 (중지 요청 시 즉시 깨어남)
+                self.control.wait(interval)
             
             app_logger.debug("클립보드 모니터링 스레드 종료")
         
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/clipboard_utils.py
+
+import sys
+import time
+import pyperclip
+from utils.logger import app_logger
+
+# 복사 후 클립보드 변경을 기다리는 기본 최대 시간 (초, 기존 고정 대기 시간과 동일)
+DEFAULT_CLIPBOARD_TIMEOUT = 0.5
+
+# 변경 확인 간격 (처음에는 짧게 확인하다가 점점 늘림)
+POLL_INTERVAL_MIN = 0.001
+POLL_INTERVAL_MAX = 0.05
+POLL_BACKOFF = 1.5
+
+_sequence_function = None
+_sequence_checked = False
+
+# 매크로가 입력을 위해 임시로 클립보드에 넣은 내용 (클립보드 저장 기능에서 제외)
+_internal_content = None
+
+def get_sequence_number():
+    """
+    클립보드 변경 순번 반환 (Windows 전용, 지원하지 않으면 None)
+
+    GetClipboardSequenceNumber 는 클립보드 내용이 바뀔 때마다 증가하므로
+    내용을 읽지 않고도 변경 여부를 확인할 수 있다.
+    """
+    global _sequence_function, _sequence_checked
+    if not _sequence_checked:
+        _sequence_checked = True
+        if sys.platform == "win32":
+            try:
+                import ctypes
+                _sequence_function = ctypes.windll.user32.GetClipboardSequenceNumber
+            except Exception as e:
+                app_logger.debug(f"클립보드 변경 순번을 사용할 수 없음: {str(e)}")
+    if _sequence_function is None:
+        return None
+    return _sequence_function()
+
+def read_clipboard():
+    """
+    클립보드 텍스트 반환 (읽을 수 없으면 None)
+    """
+    try:
+        return pyperclip.paste()
+    except Exception as e:
+        app_logger.debug(f"클립보드 읽기 실패: {str(e)}")
+        return None
+
+def write_clipboard(text):
+    """
+    입력용 텍스트를 클립보드에 넣기 (클립보드 모니터링에서 저장하지 않도록 표시)
+    """
+    global _internal_content
+    _internal_content = text
+    pyperclip.copy(text)
+
+def restore_clipboard(text):
+    """
+    입력 전에 보관한 사용자 클립보드 내용 복원 (매크로 입력용 표시를 하지 않음)
+
+    write_clipboard 로 복원하면 사용자의 원래 내용이 입력용으로 표시되어,
+    이후 사용자가 같은 내용을 다시 복사해도 클립보드 저장에서 제외된다.
+    """
+    pyperclip.copy(text)
+
+def is_internal_content(content):
+    """
+    매크로가 입력을 위해 클립보드에 넣은 내용인지 확인
+    """
+    return content is not None and content == _internal_content
+
+def get_change_token():
+    """
+    현재 클립보드 상태 식별값 반환 (변경 순번, 미지원 환경에서는 내용)
+    """
+    sequence = get_sequence_number()
+    if sequence is not None:
+        return sequence
+    return read_clipboard()
+
+def wait_for_change(previous, timeout=DEFAULT_CLIPBOARD_TIMEOUT, control=None):
+    """
+    클립보드 상태가 previous(get_change_token 값)와 달라질 때까지 대기
+
+    처음에는 1ms 간격으로 확인하고 간격을 점점 늘려 최대 50ms 간격으로 확인한다.
+    변경되면 즉시 True, timeout 초가 지나거나 중지 요청(control)이 있으면 False 를 반환한다.
+    """
+    perf_counter = time.perf_counter
+    deadline = perf_counter() + timeout
+    interval = POLL_INTERVAL_MIN
+    while True:
+        if get_change_token() != previous:
+            return True
+        remaining = deadline - perf_counter()
+        if remaining <= 0:
+            return False
+        sleep_time = min(interval, remaining)
+        if control is not None:
+            if not control.wait(sleep_time):
+                return False
+        else:
+            time.sleep(sleep_time)
+        interval = min(interval * POLL_BACKOFF, POLL_INTERVAL_MAX)
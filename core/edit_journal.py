@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/edit_journal.py
+
+import os
+import json
+import hashlib
+import threading
+from utils.logger import app_logger
+from core.macro_format import write_macro_data
+
+JOURNAL_VERSION = 1
+
+# 저널 항목이 이 수 이상 쌓이면 백그라운드에서 기준 파일로 합침
+DEFAULT_COMPACT_ENTRIES = 500
+
+# 기준 파일 갱신 표시 항목 (편집 항목이 아님)
+_OP_COMPACTED = "compacted"
+
+def get_journal_path(macro_path):
+    """
+    매크로 파일에 대응하는 편집 저널 경로
+    """
+    return macro_path + ".journal"
+
+def _file_hash(path):
+    """
+    파일 내용의 SHA-256 (파일이 없으면 None)
+    """
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _fsync_path(path):
+    """
+    이미 기록된 파일을 디스크에 반영
+    """
+    with open(path, 'rb+') as f:
+        os.fsync(f.fileno())
+
+def read_journal(macro_path):
+    """
+    복구할 편집 항목 목록 반환 (저널이 없거나 기준 파일과 맞지 않으면 None)
+
+    저널 첫 줄의 기준 해시가 현재 매크로 파일과 같으면 모든 항목을,
+    기준 파일 갱신 도중 종료된 경우에는 현재 파일과 해시가 같은 갱신 표시
+    이후의 항목만 반환한다. 마지막 줄이 기록 도중 잘렸으면 그 줄은 버린다.
+    """
+    journal_path = get_journal_path(macro_path)
+    if not os.path.exists(journal_path):
+        return None
+
+    with open(journal_path, 'r', encoding='utf-8') as f:
+        lines = f.read().splitlines()
+
+    try:
+        header = json.loads(lines[0]) if lines else {}
+    except ValueError:
+        header = {}
+    if header.get("journal") != JOURNAL_VERSION:
+        app_logger.warning(f"지원하지 않는 편집 저널: {journal_path}")
+        return None
+
+    entries = []
+    markers = []  # (기준 해시, 해당 기준 파일에 이미 포함된 항목 수)
+    for line_number, line in enumerate(lines[1:], 2):
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            app_logger.warning(f"편집 저널 {line_number}번째 줄이 손상되어 이후 항목 무시: {journal_path}")
+            break
+        if entry.get("op") == _OP_COMPACTED:
+            markers.append((entry.get("base"), entry.get("count", 0)))
+        else:
+            entries.append(entry)
+
+    current = _file_hash(macro_path)
+    if current == header.get("base"):
+        return entries
+    for base, count in reversed(markers):
+        if base == current:
+            return entries[count:]
+
+    app_logger.warning(f"편집 저널의 기준 파일이 바뀌어 복구하지 않음: {journal_path}")
+    return None
+
+def remove_journal(macro_path):
+    """
+    편집 저널 파일 삭제
+    """
+    journal_path = get_journal_path(macro_path)
+    try:
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+            app_logger.debug(f"편집 저널 삭제: {journal_path}")
+    except OSError as e:
+        app_logger.warning(f"편집 저널 삭제 실패: {journal_path} - {str(e)}")
+
+
+class EditJournal:
+    """
+    매크로 편집 내용을 저널 파일에 덧붙여 기록 (자동 저장)
+
+    편집할 때마다 바뀐 동작 하나만 JSON 한 줄로 기록하므로 저장 비용은
+    매크로 크기와 무관하다. 항목이 compact_entries 개 이상 쌓이면 백그라운드
+    스레드가 전체 매크로를 기준 파일(macro_path)로 저장하고 저널을 비운다.
+
+    저널 첫 줄에는 기준 파일의 해시를 기록한다. 기준 파일을 바꾸기 직전에는
+    새 해시와 그때까지의 항목 수를 담은 갱신 표시를 저널에 덧붙이므로,
+    갱신 도중 어느 시점에 종료되어도 read_journal 로 빠짐없이 복구할 수 있다.
+
+    snapshot 은 (설정 딕셔너리, 동작 목록, 기록된 항목 수 entry_count) 를
+    반환하는 함수로, 편집과 동시에 호출되지 않도록 호출하는 쪽이 잠가야 한다.
+    목록에 들어간 동작 객체는 바꾸지 않고 새 객체로 교체한다고 가정한다.
+    """
+    def __init__(self, macro_path, snapshot, compact_entries=DEFAULT_COMPACT_ENTRIES):
+        self.macro_path = macro_path
+        self.journal_path = get_journal_path(macro_path)
+        self.snapshot = snapshot
+        self.compact_entries = max(1, compact_entries)
+        self.entry_count = 0   # 열린 뒤 기록된 편집 항목 수
+        self._lock = threading.Lock()
+        self._compact_lock = threading.Lock()
+        self._file = None
+        self._lines = []       # 현재 저널 파일의 편집 항목 (기준 파일 이후)
+        self._base_count = 0   # _lines[0] 이전까지 기준 파일에 반영된 항목 수
+        self._thread = None
+        self._pending = False  # 합치는 도중 다시 요청되면 끝난 뒤 한 번 더 합침
+
+    def open(self):
+        """
+        현재 매크로를 기준 파일로 저장하고 새 저널 시작
+        """
+        dir_path = os.path.dirname(self.macro_path)
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+        self.compact()
+        app_logger.info(f"편집 저널 시작: {self.journal_path}")
+
+    def append(self, entry):
+        """
+        편집 항목 기록 (항목이 충분히 쌓이면 백그라운드 합치기 시작)
+        """
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+            self._lines.append(line)
+            self.entry_count += 1
+            pending = len(self._lines)
+        if pending >= self.compact_entries:
+            self.compact_async()
+
+    def compact_async(self):
+        """
+        백그라운드 스레드에서 합치기 (이미 진행 중이면 끝난 뒤 한 번 더 합침)
+        """
+        with self._lock:
+            self._pending = True
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._compact_worker, name="EditJournalCompactor",
+                                            daemon=True)
+            self._thread.start()
+
+    def _compact_worker(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                self._pending = False
+            try:
+                self.compact()
+            except Exception as e:
+                app_logger.error(f"편집 저널 합치기 실패: {self.journal_path} - {str(e)}", exc_info=True)
+
+    def compact(self):
+        """
+        현재 매크로 전체를 기준 파일로 저장하고 이후 항목만 남긴 저널로 교체
+        """
+        with self._compact_lock:
+            settings, actions, count = self.snapshot()
+            data = dict(settings)
+            data["actions"] = [action.to_dict() for action in actions]
+
+            # 확장자로 형식을 고르므로 임시 파일도 같은 확장자 사용
+            base, extension = os.path.splitext(self.macro_path)
+            temp_path = base + ".tmp" + extension
+            write_macro_data(temp_path, data)
+            _fsync_path(temp_path)
+            new_hash = _file_hash(temp_path)
+
+            with self._lock:
+                if self._file is not None:
+                    marker = {"op": _OP_COMPACTED, "base": new_hash, "count": count - self._base_count}
+                    self._file.write(json.dumps(marker) + "\n")
+                    self._file.flush()
+                    os.fsync(self._file.fileno())
+            os.replace(temp_path, self.macro_path)
+
+            with self._lock:
+                remaining = self._lines[count - self._base_count:]
+                journal_temp = self.journal_path + ".tmp"
+                with open(journal_temp, 'w', encoding='utf-8') as f:
+                    f.write(json.dumps({"journal": JOURNAL_VERSION, "base": new_hash}) + "\n")
+                    for line in remaining:
+                        f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                if self._file is not None:
+                    self._file.close()
+                os.replace(journal_temp, self.journal_path)
+                self._file = open(self.journal_path, 'a', encoding='utf-8')
+                self._lines = remaining
+                self._base_count = count
+
+        app_logger.debug(f"편집 저널 합치기 완료: {len(actions)}개 동작 저장, 남은 항목 {len(remaining)}개")
+
+    def close(self, compact=True):
+        """
+        저널 닫기
+
+        compact 가 True 이면 남은 항목을 기준 파일에 합치고 저널 파일을 삭제한다.
+        False 이면 저널 파일을 그대로 두어 다음에 read_journal 로 복구할 수 있다.
+        """
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+        if compact and self._file is not None:
+            self.compact()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        if compact:
+            remove_journal(self.macro_path)
+        app_logger.info(f"편집 저널 닫기: {self.journal_path}")
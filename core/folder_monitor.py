@@ -11,6 +11,7 @@ from PyQt5.QtCore import QObject, pyqtSignal
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 from utils.logger import app_logger
+from core.clipboard_utils import DEFAULT_CLIPBOARD_TIMEOUT, get_change_token, wait_for_change
 
 class FolderEventHandler(FileSystemEventHandler):
     """
@@ -44,6 +45,8 @@ class FolderMonitor(QObject):
         self.monitoring = False
         self.observer = None
         self.initial_folders = []  # 시작 시 폴더 목록
+        self.last_saved_content = None  # 마지막으로 새 폴더에 저장한 클립보드 내용
+        self.clipboard_timeout = DEFAULT_CLIPBOARD_TIMEOUT  # 클립보드 변경 대기 최대 시간 (초)
         
         app_logger.info("폴더 모니터 초기화 완료")
     
@@ -153,13 +156,18 @@ class FolderMonitor(QObject):
             return
         
         try:
-            # 클립보드 내용 캡처하기 전 잠시 대기 (복사 작업이 완료될 시간)
-            import time
-            time.sleep(0.5)  # 500ms 대기
-            
             # 클립보드 내용 가져오기
+            previous = get_change_token()
             clipboard_content = pyperclip.paste()
             
+            # 마지막으로 저장한 내용과 같으면 아직 복사가 끝나지 않은 것으로 보고
+            # 클립보드가 바뀔 때까지만 대기 (이미 새 내용이면 대기하지 않음)
+            if self.last_saved_content is not None and clipboard_content == self.last_saved_content:
+                if wait_for_change(previous, self.clipboard_timeout):
+                    clipboard_content = pyperclip.paste()
+                else:
+                    app_logger.debug("새 폴더 감지 후 클립보드 변경이 감지되지 않음, 현재 내용 저장")
+            
             # 내용이 있는 경우 파일에 저장
             if clipboard_content:
                 # 저장할 파일 경로 생성 (사용자 지정 파일명 또는 기본값)
@@ -173,6 +181,7 @@ class FolderMonitor(QObject):
                 # 파일에 내용 저장
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(clipboard_content)
+                self.last_saved_content = clipboard_content
                 
                 app_logger.debug(f"저장된 파일 경로: {file_path}")
                 
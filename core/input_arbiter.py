@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/input_arbiter.py
+
+import heapq
+import itertools
+import threading
+from utils.logger import app_logger
+
+# 입력 우선순위 (값이 작을수록 먼저 입력 장치를 사용)
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 10
+PRIORITY_LOW = 20   # 백그라운드 매크로
+
+class InputArbiter:
+    """
+    여러 매크로 엔진이 공유하는 마우스/키보드 입력 중재자
+
+    실제 입력을 발생시키는 단계만 이 객체의 잠금을 얻은 뒤 실행되고, 대기나
+    클립보드 저장 같은 나머지 작업은 엔진끼리 자유롭게 겹쳐 실행된다.
+    잠금은 우선순위가 높은(값이 작은) 요청부터, 같은 우선순위에서는 요청한
+    순서대로 넘겨주므로 백그라운드 매크로가 대화형 매크로를 오래 막지 않는다.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._queue = []          # (우선순위, 요청 순번) 힙
+        self._counter = itertools.count()
+        self._owner = None        # 잠금을 가진 요청 (우선순위, 요청 순번)
+
+    def acquire(self, priority=PRIORITY_NORMAL, control=None):
+        """
+        입력 잠금 획득 (차례가 올 때까지 대기)
+
+        control(ExecutionControl)이 중지되면 대기를 포기하고 False 를 반환한다.
+        일시 정지되면 대기열에서 빠져 다른 엔진이 먼저 입력하게 하고, 재개되면
+        원래 순번으로 다시 기다린다 (일시 정지 중에는 잠금을 얻지 않는다).
+        대기 중에는 control 의 상태 변화가 이 객체의 조건 변수도 바로 깨운다.
+        """
+        ticket = (priority, next(self._counter))
+        if control is None:
+            with self._cond:
+                heapq.heappush(self._queue, ticket)
+                while self._owner is not None or self._queue[0] != ticket:
+                    self._cond.wait()
+                heapq.heappop(self._queue)
+                self._owner = ticket
+                return True
+
+        control.link(self._cond)
+        try:
+            while True:
+                if control.paused and not control.wait_while_paused():
+                    return False
+                with self._cond:
+                    heapq.heappush(self._queue, ticket)
+                    while True:
+                        if control.stopped or control.paused:
+                            self._queue.remove(ticket)
+                            heapq.heapify(self._queue)
+                            # 대기열 맨 앞이 바뀌었을 수 있으므로 다른 대기자를 깨움
+                            self._cond.notify_all()
+                            break
+                        if self._owner is None and self._queue[0] == ticket:
+                            heapq.heappop(self._queue)
+                            self._owner = ticket
+                            return True
+                        self._cond.wait()
+                if control.stopped:
+                    return False
+        finally:
+            control.unlink(self._cond)
+
+    def release(self):
+        """
+        입력 잠금 해제
+        """
+        with self._cond:
+            if self._owner is None:
+                app_logger.warning("입력 잠금을 가지고 있지 않은 상태에서 해제 요청")
+                return
+            self._owner = None
+            self._cond.notify_all()
+
+    def waiting_count(self):
+        """
+        잠금을 기다리는 요청 수 반환
+        """
+        with self._cond:
+            return len(self._queue)
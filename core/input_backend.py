@@ -0,0 +1,323 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/input_backend.py
+
+import time
+import threading
+from utils.logger import app_logger
+
+class InputBackend:
+    """
+    마우스/키보드 입력 백엔드 인터페이스
+
+    모든 매크로 동작은 이 인터페이스를 통해서만 입력을 발생시킨다.
+    버튼 이름은 'left' / 'right' 이며 항상 키워드 인자(button=...)로 전달한다.
+    키 이름은 pyautogui 표기(ctrl, alt, f1 등)를 따른다.
+    """
+    name = "base"
+
+    def move_to(self, x, y):
+        """
+        마우스를 지정된 좌표로 이동
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def click(self, button='left'):
+        """
+        현재 위치에서 클릭
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def double_click(self):
+        """
+        현재 위치에서 더블클릭
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def mouse_down(self, button='left'):
+        """
+        마우스 버튼 누르기
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def mouse_up(self, button='left'):
+        """
+        마우스 버튼 떼기
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def scroll(self, clicks):
+        """
+        스크롤 (양수: 위로, 음수: 아래로)
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def write(self, text, interval=0.0):
+        """
+        텍스트 입력 (interval: 글자 간 간격, 초)
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def hotkey(self, *keys):
+        """
+        키 조합 입력 (순서대로 누른 뒤 역순으로 뗌)
+        """
+        raise NotImplementedError("서브클래스에서 구현해야 합니다.")
+
+    def set_pause(self, seconds):
+        """
+        입력 호출마다 백엔드가 자동으로 넣는 대기 시간 설정 (지원하는 경우)
+        """
+        pass
+
+    def create_key_listener(self, on_press):
+        """
+        중지 키 감지용 키보드 리스너 생성 (start/stop/is_alive 제공, 미지원 시 None)
+        """
+        return None
+
+
+class PyAutoGuiBackend(InputBackend):
+    """
+    pyautogui 기반 입력 백엔드 (기본값)
+    """
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        # PyAutoGUI FailSafe 비활성화
+        pyautogui.FAILSAFE = False
+        self._pyautogui = pyautogui
+
+        # 래퍼 호출 비용을 없애기 위해 pyautogui 함수를 그대로 바인딩
+        self.move_to = pyautogui.moveTo
+        self.click = pyautogui.click
+        self.double_click = pyautogui.doubleClick
+        self.mouse_down = pyautogui.mouseDown
+        self.mouse_up = pyautogui.mouseUp
+        self.scroll = pyautogui.scroll
+        self.write = pyautogui.write
+        self.hotkey = pyautogui.hotkey
+
+    def set_pause(self, seconds):
+        """
+        pyautogui.PAUSE 설정
+        """
+        self._pyautogui.PAUSE = seconds
+
+    def create_key_listener(self, on_press):
+        """
+        pynput 키보드 리스너 생성 (pyautogui 에는 리스너가 없음)
+        """
+        from pynput import keyboard
+        return keyboard.Listener(on_press=on_press)
+
+
+class PynputBackend(InputBackend):
+    """
+    pynput 컨트롤러 기반 입력 백엔드
+    """
+    name = "pynput"
+
+    # pyautogui 키 이름 -> pynput Key 속성 이름
+    KEY_ALIASES = {
+        "control": "ctrl", "ctrlleft": "ctrl_l", "ctrlright": "ctrl_r",
+        "altleft": "alt_l", "altright": "alt_r",
+        "shiftleft": "shift_l", "shiftright": "shift_r",
+        "win": "cmd", "winleft": "cmd_l", "winright": "cmd_r", "command": "cmd",
+        "return": "enter", "escape": "esc", "del": "delete",
+        "pageup": "page_up", "pagedown": "page_down", "pgup": "page_up", "pgdn": "page_down",
+        "capslock": "caps_lock", "numlock": "num_lock", "scrolllock": "scroll_lock",
+        "printscreen": "print_screen", "prntscrn": "print_screen",
+    }
+
+    def __init__(self):
+        from pynput import mouse, keyboard
+        self._keyboard_module = keyboard
+        self._Button = mouse.Button
+        self._Key = keyboard.Key
+        self._KeyCode = keyboard.KeyCode
+        self._mouse = mouse.Controller()
+        self._keyboard = keyboard.Controller()
+        self._key_cache = {}
+
+    def _button(self, button):
+        return self._Button.right if button == 'right' else self._Button.left
+
+    def _key(self, name):
+        """
+        키 이름을 pynput 키 객체로 변환 (결과는 캐시)
+        """
+        key = self._key_cache.get(name)
+        if key is None:
+            attr = self.KEY_ALIASES.get(name, name)
+            key = getattr(self._Key, attr, None)
+            if key is None:
+                if len(name) != 1:
+                    raise ValueError(f"지원하지 않는 키 이름: {name}")
+                key = self._KeyCode.from_char(name)
+            self._key_cache[name] = key
+        return key
+
+    def move_to(self, x, y):
+        self._mouse.position = (x, y)
+
+    def click(self, button='left'):
+        self._mouse.click(self._button(button), 1)
+
+    def double_click(self):
+        self._mouse.click(self._Button.left, 2)
+
+    def mouse_down(self, button='left'):
+        self._mouse.press(self._button(button))
+
+    def mouse_up(self, button='left'):
+        self._mouse.release(self._button(button))
+
+    def scroll(self, clicks):
+        self._mouse.scroll(0, clicks)
+
+    def write(self, text, interval=0.0):
+        if interval <= 0:
+            self._keyboard.type(text)
+            return
+        for char in text:
+            self._keyboard.type(char)
+            time.sleep(interval)
+
+    def hotkey(self, *keys):
+        pressed = []
+        try:
+            for name in keys:
+                key = self._key(name)
+                self._keyboard.press(key)
+                pressed.append(key)
+        finally:
+            for key in reversed(pressed):
+                self._keyboard.release(key)
+
+    def create_key_listener(self, on_press):
+        return self._keyboard_module.Listener(on_press=on_press)
+
+
+class RecordingBackend(InputBackend):
+    """
+    실제 입력 없이 호출 내역만 메모리에 기록하는 백엔드
+
+    디스플레이가 없는 환경에서 엔진의 처리량과 동작 순서를 검증할 때 사용한다.
+    events 에는 (단조 시각, 동작 이름, 인자 튜플) 형태로 기록된다.
+    """
+    name = "recording"
+
+    def __init__(self):
+        self.events = []
+        self.pause = 0.0
+        self._lock = threading.Lock()
+
+    def _record(self, op, *args):
+        with self._lock:
+            self.events.append((time.perf_counter(), op, args))
+
+    def clear(self):
+        """
+        기록 초기화
+        """
+        with self._lock:
+            self.events = []
+
+    def get_operations(self):
+        """
+        시각을 제외한 (동작 이름, 인자) 목록 반환
+        """
+        with self._lock:
+            return [(op, args) for _, op, args in self.events]
+
+    def move_to(self, x, y):
+        self._record("move_to", x, y)
+
+    def click(self, button='left'):
+        self._record("click", button)
+
+    def double_click(self):
+        self._record("double_click")
+
+    def mouse_down(self, button='left'):
+        self._record("mouse_down", button)
+
+    def mouse_up(self, button='left'):
+        self._record("mouse_up", button)
+
+    def scroll(self, clicks):
+        self._record("scroll", clicks)
+
+    def write(self, text, interval=0.0):
+        self._record("write", text, interval)
+
+    def hotkey(self, *keys):
+        self._record("hotkey", *keys)
+
+    def set_pause(self, seconds):
+        self.pause = seconds
+
+
+class NullBackend(InputBackend):
+    """
+    아무 동작도 하지 않는 백엔드 (엔진 자체의 오버헤드 측정용)
+    """
+    name = "null"
+
+    def move_to(self, x, y):
+        pass
+
+    def click(self, button='left'):
+        pass
+
+    def double_click(self):
+        pass
+
+    def mouse_down(self, button='left'):
+        pass
+
+    def mouse_up(self, button='left'):
+        pass
+
+    def scroll(self, clicks):
+        pass
+
+    def write(self, text, interval=0.0):
+        pass
+
+    def hotkey(self, *keys):
+        pass
+
+
+# 이름으로 선택 가능한 백엔드 목록
+BACKENDS = {
+    PyAutoGuiBackend.name: PyAutoGuiBackend,
+    PynputBackend.name: PynputBackend,
+    RecordingBackend.name: RecordingBackend,
+    NullBackend.name: NullBackend,
+}
+
+DEFAULT_BACKEND = PyAutoGuiBackend.name
+
+_default_backend = None
+
+def create_backend(name=DEFAULT_BACKEND):
+    """
+    이름으로 입력 백엔드 생성
+    """
+    backend_class = BACKENDS.get(name)
+    if backend_class is None:
+        raise ValueError(f"알 수 없는 입력 백엔드: {name}")
+    app_logger.debug(f"입력 백엔드 생성: {name}")
+    return backend_class()
+
+def get_default_backend():
+    """
+    공용 기본 백엔드 반환 (최초 사용 시 생성)
+    """
+    global _default_backend
+    if _default_backend is None:
+        _default_backend = create_backend(DEFAULT_BACKEND)
+    return _default_backend
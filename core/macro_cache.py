@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/macro_cache.py
+
+import os
+import threading
+from collections import OrderedDict
+from utils.logger import app_logger
+from core.macro_format import read_macro_data
+from core.actions import MacroAction, ACTION_TYPES
+
+class CachedMacro:
+    """
+    파싱이 끝난 매크로 파일 내용 (동작 딕셔너리 목록과 실행 설정)
+
+    동작 객체는 실행 상태(텍스트 리스트 위치 등)를 가지므로 캐시에 두고
+    공유하지 않는다. 호출하는 쪽이 create_actions() 로 매번 새 객체를 만든다.
+    """
+    __slots__ = ("path", "key", "action_dicts", "delay")
+
+    def __init__(self, path, key, action_dicts, delay):
+        self.path = path
+        self.key = key
+        self.action_dicts = action_dicts
+        self.delay = delay
+
+    def create_actions(self):
+        """
+        캐시된 딕셔너리로 새 동작 객체 목록 생성
+        """
+        from_dict = MacroAction.from_dict
+        return [from_dict(action_data) for action_data in self.action_dicts]
+
+
+class MacroCache:
+    """
+    매크로 파일 파싱 결과 LRU 캐시
+
+    (절대 경로, 수정 시각, 크기)를 키로 사용하므로 파일이 바뀌지 않는 한
+    파일을 다시 읽거나 파싱하지 않는다.
+    파일이 바뀌면 다음 조회 시 자동으로 다시 불러온다.
+    """
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # 절대 경로 -> CachedMacro
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, file_path):
+        """
+        매크로 파일의 파싱 결과 반환 (파일이 없거나 형식이 잘못되면 예외 발생)
+        """
+        path = os.path.abspath(file_path)
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry.key == key:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return entry
+
+        # 파일 읽기와 파싱은 잠금 밖에서 수행
+        entry = self._load(path, key)
+
+        with self._lock:
+            self.misses += 1
+            self._entries[path] = entry
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                app_logger.debug(f"매크로 캐시에서 제거: {evicted}")
+        return entry
+
+    def _load(self, path, key):
+        """
+        매크로 파일을 읽어 동작 딕셔너리 목록 보관 (알 수 없는 동작 유형은 제외)
+        """
+        app_logger.debug(f"매크로 캐시에 불러오기: {path}")
+        data = read_macro_data(path)
+        action_dicts = []
+        for action_data in data.get("actions", []):
+            if action_data.get("type", "") in ACTION_TYPES:
+                action_dicts.append(action_data)
+            else:
+                app_logger.warning(f"알 수 없는 동작 유형: {action_data.get('type', '')} ({path})")
+        return CachedMacro(path, key, action_dicts, data.get("delay", 100))
+
+    def invalidate(self, file_path=None):
+        """
+        캐시 항목 제거 (경로를 생략하면 전체 제거)
+        """
+        with self._lock:
+            if file_path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(os.path.abspath(file_path), None)
+
+
+_macro_cache = MacroCache()
+
+def get_macro_cache():
+    """
+    공용 매크로 캐시 반환
+    """
+    return _macro_cache
@@ -2,12 +2,31 @@
 # -*- coding: utf-8 -*-
 # core/macro_engine.py
 
+import os
+import time
 import threading
 import json
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot, QTimer
-from pynput import keyboard
-from utils.logger import app_logger
+from utils.logger import app_logger, DEBUG, INFO
 from core.actions import MacroAction, FolderMonitorAction
+from core.plan import compile_plan, ExecutionContext
+from core.profiler import ActionProfiler
+from core.progress import ExecutionProgress
+from core.trace import ExecutionTrace, RESULT_OK, RESULT_FAILED, RESULT_ERROR, RESULT_WAIT
+from core.input_arbiter import PRIORITY_NORMAL
+from core.optimizer import optimize_actions
+from core.macro_format import load_macro_file, write_macro_data
+from core.edit_journal import EditJournal, read_journal
+from core.checkpoint import (DEFAULT_CHECKPOINT_INTERVAL, compute_actions_digest, compute_macro_hash, make_checkpoint,
+                             save_checkpoint, load_checkpoint, remove_checkpoint,
+                             collect_text_actions)
+from core.clipboard_utils import (DEFAULT_CLIPBOARD_TIMEOUT, get_change_token,
+                                  wait_for_change, read_clipboard)
+from core.scheduler import (ExecutionControl, DeadlineScheduler,
+                            SCHEDULE_RELATIVE, SCHEDULE_DEADLINE, SCHEDULE_MODES)
+
+# 동작별 실행 로그 표본 간격 (첫 반복과 이후 N번째 반복마다 기록)
+DEFAULT_LOG_EVERY = 10
 
 class MacroEngine(QObject):
     """
@@ -17,16 +36,33 @@ class MacroEngine(QObject):
     status_changed = pyqtSignal(str)
     macro_finished = pyqtSignal()
     
-    def __init__(self):
+    def __init__(self, backend=None):
+        """
+        backend: 입력 백엔드 (InputBackend), 생략 시 공용 기본 백엔드(pyautogui) 사용
+        """
         super().__init__()
         
         # 매크로 동작 목록
         self.actions = []
+        self.edit_version = 0  # 동작 목록이 바뀔 때마다 증가 (실행 목록과 해시 재사용 판단)
+        self._run_cache = None  # ((편집 번호, 최적화 여부), 실행 동작 목록, 동작 해시)
+        self.macro_path = None  # 불러오거나 저장한 매크로 파일 (하위 매크로 상대 경로의 기준)
+        
+        # 입력 백엔드 (실행 시 동작에 주입됨)
+        self.backend = backend
         
         # 실행 설정
         self.delay = 100  # ms
         self.loop_count = 1
         self.stop_key = "f12"
+        self.schedule_mode = SCHEDULE_RELATIVE
+        self.clipboard_timeout = DEFAULT_CLIPBOARD_TIMEOUT  # 복사 후 클립보드 변경 대기 최대 시간 (초)
+        self.optimize = False  # 실행 시 동작 목록 최적화 (원본 목록은 변경하지 않음)
+        self.log_every = DEFAULT_LOG_EVERY  # 동작별 실행 로그를 남길 반복 간격 (1 이면 매 반복)
+        
+        # 여러 엔진이 동시에 실행될 때 입력 단계를 직렬화하는 공유 중재자 (없으면 단독 실행)
+        self.arbiter = None
+        self.input_priority = PRIORITY_NORMAL
         
         # 실행 상태
         self.running = False
@@ -34,6 +70,38 @@ class MacroEngine(QObject):
         self.thread = None
         self.keyboard_listener = None
         
+        # 중지/일시 정지 제어 (엔진과 동작의 모든 대기가 이 객체를 통해 이루어짐)
+        self.control = ExecutionControl()
+        
+        # 실행 계획 (start 시 동작 목록으로부터 생성)
+        self.run_actions = []  # 실제 실행하는 동작 목록 (최적화 사용 시 최적화된 목록)
+        self.plan = []
+        
+        # 절대 마감 시각 스케줄러 (deadline 모드에서 사용, 지각 시간 기록)
+        self.scheduler = DeadlineScheduler(self.control)
+        
+        # 동작별 실행/대기 시간 기록 (실행 종료 후 보고서 출력)
+        self.profiler = ActionProfiler()
+        
+        # 실행 진행 상태 (실행 스레드가 기록하고 UI 가 주기적으로 읽음, 시그널 없음)
+        self.progress = ExecutionProgress()
+        
+        # 최근 실행 단계 링 버퍼 (항상 기록, 중지/오류 시 파일로 저장)
+        self.trace = ExecutionTrace()
+        self.trace_dir = None   # 자동 저장 디렉토리 (없으면 로그 디렉토리)
+        self.trace_path = None  # 지정하면 실행이 끝날 때마다 이 파일로 저장
+        
+        # 체크포인트 (경로가 설정되면 실행 위치를 주기적으로 저장하고 재개에 사용)
+        self.checkpoint_path = None
+        self.checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+        self.macro_hash = None
+        self.resume_position = (0, 0)  # (완료한 반복 횟수, 시작 단계 번호)
+        self.repeat_counters = {}      # 반복 블록별 완료 횟수 (실행 계획과 공유)
+        
+        # 편집 저널 (설정되면 동작 편집을 저널 파일에 바로 기록, 자동 저장)
+        self.journal = None
+        self.edit_lock = threading.RLock()  # 편집과 저널 합치기용 스냅샷을 직렬화
+        
         app_logger.info("매크로 엔진 초기화 완료")
     
     def add_action(self, action):
@@ -41,7 +109,9 @@ class MacroEngine(QObject):
         매크로 동작 추가
         """
         app_logger.debug(f"매크로 동작 추가: {action.name}")
-        self.actions.append(action)
+        with self.edit_lock:
+            self.actions.append(action)
+            self._record_edit({"op": "add", "action": action.to_dict()})
     
     def replace_action(self, index, action):
         """
@@ -50,7 +120,9 @@ class MacroEngine(QObject):
         if 0 <= index < len(self.actions):
             old_action = self.actions[index]
             app_logger.debug(f"매크로 동작 교체: [{index}] {old_action.name} -> {action.name}")
-            self.actions[index] = action
+            with self.edit_lock:
+                self.actions[index] = action
+                self._record_edit({"op": "replace", "index": index, "action": action.to_dict()})
     
     def remove_action(self, index):
         """
@@ -59,7 +131,9 @@ class MacroEngine(QObject):
         if 0 <= index < len(self.actions):
             action = self.actions[index]
             app_logger.debug(f"매크로 동작 제거: [{index}] {action.name}")
-            del self.actions[index]
+            with self.edit_lock:
+                del self.actions[index]
+                self._record_edit({"op": "remove", "index": index})
     
     def move_action_up(self, index):
         """
@@ -67,7 +141,9 @@ class MacroEngine(QObject):
         """
         if 0 < index < len(self.actions):
             app_logger.debug(f"매크로 동작 위로 이동: [{index}] {self.actions[index].name}")
-            self.actions[index], self.actions[index-1] = self.actions[index-1], self.actions[index]
+            with self.edit_lock:
+                self.actions[index], self.actions[index-1] = self.actions[index-1], self.actions[index]
+                self._record_edit({"op": "move", "index": index, "to": index - 1})
     
     def move_action_down(self, index):
         """
@@ -75,7 +151,9 @@ class MacroEngine(QObject):
         """
         if 0 <= index < len(self.actions) - 1:
             app_logger.debug(f"매크로 동작 아래로 이동: [{index}] {self.actions[index].name}")
-            self.actions[index], self.actions[index+1] = self.actions[index+1], self.actions[index]
+            with self.edit_lock:
+                self.actions[index], self.actions[index+1] = self.actions[index+1], self.actions[index]
+                self._record_edit({"op": "move", "index": index, "to": index + 1})
     
     def get_action(self, index):
         """
@@ -90,7 +168,109 @@ class MacroEngine(QObject):
         모든 매크로 동작 제거
         """
         app_logger.debug("모든 매크로 동작 제거")
-        self.actions.clear()
+        with self.edit_lock:
+            self.actions.clear()
+            self._record_edit({"op": "clear"})
+    
+    def set_actions(self, actions):
+        """
+        동작 목록 전체 교체 (최적화 결과 적용 등, 저널에는 한 항목으로 기록)
+        """
+        app_logger.debug(f"매크로 동작 목록 교체: {len(actions)}개 동작")
+        with self.edit_lock:
+            self.actions[:] = actions
+            if self.journal is not None:
+                self._record_edit({"op": "set", "actions": [action.to_dict() for action in actions]})
+    
+    def _record_edit(self, entry):
+        """
+        편집 번호 증가 및 편집 저널이 설정되어 있으면 편집 항목 기록 (edit_lock 안에서 호출)
+        """
+        self.edit_version += 1
+        if self.journal is not None:
+            self.journal.append(entry)
+    
+    def _apply_edit(self, entry):
+        """
+        저널의 편집 항목 하나를 동작 목록에 적용 (복구용, 다시 기록하지 않음)
+        """
+        op = entry.get("op")
+        index = entry.get("index", 0)
+        if op == "add":
+            action = MacroAction.from_dict(entry["action"])
+            if action:
+                self.actions.append(action)
+        elif op == "replace":
+            action = MacroAction.from_dict(entry["action"])
+            if action and 0 <= index < len(self.actions):
+                self.actions[index] = action
+        elif op == "remove":
+            if 0 <= index < len(self.actions):
+                del self.actions[index]
+        elif op == "move":
+            to = entry.get("to", index)
+            if 0 <= index < len(self.actions) and 0 <= to < len(self.actions):
+                self.actions[index], self.actions[to] = self.actions[to], self.actions[index]
+        elif op == "clear":
+            self.actions.clear()
+        elif op == "set":
+            self.actions[:] = [action for action in map(MacroAction.from_dict, entry["actions"]) if action]
+        else:
+            app_logger.warning(f"알 수 없는 편집 저널 항목: {op}")
+    
+    def _journal_snapshot(self):
+        """
+        저널 합치기용 (설정, 동작 목록 복사본, 기록된 항목 수) 반환
+        """
+        with self.edit_lock:
+            return self._get_settings_data(), list(self.actions), self.journal.entry_count
+    
+    def set_journal(self, file_path, recover=False):
+        """
+        편집 저널 설정 (file_path 가 None 이면 해제, 성공 시 True)
+        
+        설정하면 동작 편집이 <file_path>.journal 에 바로 기록되고, 쌓인 항목은
+        백그라운드에서 file_path 로 합쳐진다. recover 가 True 이면 먼저 file_path 와
+        남아 있는 저널을 읽어 비정상 종료 전 편집 상태를 복구한다. False 이면
+        현재 동작 목록으로 file_path 를 새로 저장한다.
+        """
+        try:
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            if file_path is None:
+                return True
+            
+            if recover:
+                # 자동 저장 파일은 매크로 파일이 아니므로 하위 매크로 경로 기준은 유지
+                macro_path = self.macro_path
+                if os.path.exists(file_path) and not self.load_from_file(file_path):
+                    return False
+                self.macro_path = macro_path
+                entries = read_journal(file_path) or []
+                with self.edit_lock:
+                    for entry in entries:
+                        self._apply_edit(entry)
+                    self.edit_version += 1
+                app_logger.info(f"편집 저널 복구: {len(entries)}개 항목 적용, {len(self.actions)}개 동작")
+            
+            journal = EditJournal(file_path, self._journal_snapshot)
+            self.journal = journal
+            journal.open()
+            return True
+        
+        except Exception as e:
+            app_logger.error(f"편집 저널 설정 실패: {file_path} - {str(e)}", exc_info=True)
+            self.journal = None
+            return False
+    
+    def close_journal(self, compact=True):
+        """
+        편집 저널 닫기 (compact 가 False 이면 저널 파일을 남겨 다음에 복구 가능)
+        """
+        if self.journal is not None:
+            self.journal.close(compact)
+            self.journal = None
     
     def set_delay(self, delay):
         """
@@ -109,6 +289,161 @@ class MacroEngine(QObject):
             app_logger.debug(f"매크로 반복 횟수 설정: {count}회")
         self.loop_count = count
     
+    def set_log_every(self, loops):
+        """
+        동작별 실행 로그를 남길 반복 간격 설정 (1 이하면 매 반복 기록)
+        
+        첫 반복과 이후 loops 번째 반복마다 동작 실행 로그를 남기고, 나머지
+        반복에서는 동작 로그를 만들지 않는다. 실패/오류 로그는 항상 남긴다.
+        """
+        app_logger.debug(f"동작 로그 표본 간격 설정: {loops}회 반복마다")
+        self.log_every = max(1, loops)
+    
+    def set_backend(self, backend):
+        """
+        입력 백엔드 설정 (다음 실행부터 적용)
+        """
+        app_logger.debug(f"매크로 입력 백엔드 설정: {backend.name if backend else '기본값'}")
+        self.backend = backend
+    
+    def set_arbiter(self, arbiter, priority=PRIORITY_NORMAL):
+        """
+        입력 중재자 설정 (다음 실행부터 적용)
+        
+        같은 중재자를 공유하는 엔진끼리는 실제 입력 단계만 차례로 실행되고
+        나머지 단계는 동시에 진행된다. priority 값이 작을수록 먼저 입력한다.
+        """
+        app_logger.debug(f"매크로 입력 중재자 설정: {'사용' if arbiter else '사용 안 함'} (우선순위: {priority})")
+        self.arbiter = arbiter
+        self.input_priority = priority
+    
+    def set_schedule_mode(self, mode):
+        """
+        스케줄 모드 설정 (relative: 실행 후 지연, deadline: 절대 마감 시각 기준)
+        """
+        if mode not in SCHEDULE_MODES:
+            app_logger.warning(f"알 수 없는 스케줄 모드: {mode}")
+            return
+        app_logger.debug(f"매크로 스케줄 모드 설정: {mode}")
+        self.schedule_mode = mode
+    
+    def set_clipboard_timeout(self, seconds):
+        """
+        복사 후 클립보드 변경을 기다리는 최대 시간(초) 설정
+        """
+        app_logger.debug(f"클립보드 변경 대기 시간 설정: {seconds}초")
+        self.clipboard_timeout = max(0.0, float(seconds))
+    
+    def set_optimize(self, enabled):
+        """
+        실행 시 동작 목록 최적화 사용 여부 설정
+        """
+        app_logger.debug(f"동작 최적화 설정: {'사용' if enabled else '사용 안 함'}")
+        self.optimize = bool(enabled)
+    
+    def _get_run_actions(self):
+        """
+        실제 실행할 동작 목록 반환 (최적화를 사용하면 최적화된 새 목록)
+        """
+        if not self.optimize:
+            return list(self.actions)
+        actions, report = optimize_actions(self.actions)
+        report.log()
+        return actions
+    
+    def _prepare_run_actions(self):
+        """
+        실행할 동작 목록과 동작 해시 반환
+
+        동작 목록을 편집하지 않았으면 이전 결과를 재사용하므로, 재개 확인과
+        실행 시작이 이어져도 최적화와 전체 해시 계산은 한 번만 한다.
+        """
+        key = (self.edit_version, self.optimize)
+        cached = self._run_cache
+        if cached is None or cached[0] != key:
+            run_actions = self._get_run_actions()
+            cached = (key, run_actions, compute_actions_digest(run_actions))
+            self._run_cache = cached
+        return cached[1], cached[2]
+    
+    def set_checkpoint(self, path, interval=DEFAULT_CHECKPOINT_INTERVAL):
+        """
+        체크포인트 파일 경로와 저장 간격(초) 설정 (path 가 None 이면 사용 안 함)
+        """
+        app_logger.debug(f"체크포인트 설정: {path} ({interval}초 간격)")
+        self.checkpoint_path = path
+        self.checkpoint_interval = max(0.0, float(interval))
+    
+    def get_resume_checkpoint(self):
+        """
+        현재 동작 목록으로 재개할 수 있는 체크포인트 반환 (없거나 동작이 바뀌었으면 None)
+        """
+        checkpoint = load_checkpoint(self.checkpoint_path)
+        if checkpoint is None:
+            return None
+        run_actions, actions_digest = self._prepare_run_actions()
+        if checkpoint.get("macro_hash") != compute_macro_hash(run_actions, actions_digest, self.macro_path):
+            app_logger.warning(f"매크로 동작이 변경되어 체크포인트를 사용할 수 없음: {self.checkpoint_path}")
+            return None
+        return checkpoint
+    
+    def _apply_checkpoint(self, checkpoint):
+        """
+        체크포인트의 실행 위치와 텍스트 리스트 인덱스 복원 (하위 매크로 포함, 컴파일 후 호출)
+        """
+        text_actions = dict(collect_text_actions(self.run_actions))
+        for key, value in checkpoint["text_indexes"].items():
+            action = text_actions.get(key)
+            if action is not None:
+                action.current_index = value
+        self.repeat_counters.update(checkpoint["repeat_counters"])
+        self.resume_position = (checkpoint.get("loop_counter", 0), checkpoint.get("pc", 0))
+        app_logger.info(f"체크포인트에서 재개: 반복 {self.resume_position[0]}회 완료, 단계 {self.resume_position[1]}부터")
+    
+    def _save_checkpoint(self, loop_counter, pc, text_actions):
+        """
+        현재 실행 위치를 체크포인트로 저장 (pc 단계는 아직 실행되지 않은 상태)
+        """
+        text_indexes = {key: action.current_index for key, action in text_actions}
+        checkpoint = make_checkpoint(self.macro_hash, loop_counter, pc, text_indexes, self.repeat_counters)
+        if save_checkpoint(self.checkpoint_path, checkpoint):
+            app_logger.debug(f"체크포인트 저장: 반복 {loop_counter}, 단계 {pc}")
+    
+    def get_timing_stats(self):
+        """
+        deadline 모드의 단계별 지각 시간 통계 반환 (밀리초 단위)
+        """
+        return self.scheduler.get_stats()
+    
+    def get_profile(self):
+        """
+        마지막(또는 현재) 실행의 동작별 시간 프로파일러 반환
+        """
+        return self.profiler
+    
+    def set_trace(self, capacity=None, directory=None, file_path=None):
+        """
+        실행 기록 설정 (보관할 기록 수, 자동 저장 디렉토리, 실행 종료 시 항상 저장할 파일)
+        """
+        if capacity is not None and capacity != self.trace.capacity:
+            self.trace.set_capacity(capacity)
+        if directory is not None:
+            self.trace_dir = directory
+        if file_path is not None:
+            self.trace_path = file_path
+        app_logger.debug(f"실행 기록 설정: {self.trace.capacity}개, 저장 위치 {self.trace_path or self.trace_dir or app_logger.log_dir}")
+    
+    def dump_trace(self, reason="manual"):
+        """
+        최근 실행 기록을 파일로 저장하고 경로 반환 (실패하면 None)
+        
+        trace_path 가 지정되어 있으면 그 파일에, 아니면 자동 저장 디렉토리에
+        trace_<시각>_<이유>.mtrace 로 저장한다.
+        """
+        if self.trace_path:
+            return self.trace_path if self.trace.dump(self.trace_path, reason) else None
+        return self.trace.dump_to_dir(self.trace_dir or app_logger.log_dir, reason)
+    
     def set_stop_key(self, key):
         """
         중지 키 설정
@@ -147,32 +482,91 @@ class MacroEngine(QObject):
         
         return True  # 다른 키는 무시
     
-    def start(self):
+    def _start_keyboard_listener(self, backend):
+        """
+        중지 키 리스너 시작 (중지 키가 비어 있거나 백엔드가 지원하지 않으면 생략)
+        """
+        if not self.stop_key:
+            app_logger.info("중지 키가 설정되지 않아 키보드 리스너를 시작하지 않음")
+            return
+        
+        try:
+            # 리스너는 백엔드가 제공 (pynput 은 필요할 때만 로드됨)
+            self.keyboard_listener = backend.create_key_listener(self.on_key_press)
+            if self.keyboard_listener is None:
+                app_logger.info(f"입력 백엔드({backend.name})가 키보드 리스너를 지원하지 않음 (중지 키 비활성)")
+                return
+            app_logger.info(f"키보드 리스너 시작 (중지 키: {self.stop_key})")
+            self.keyboard_listener.start()
+        except Exception as e:
+            app_logger.warning(f"키보드 리스너를 시작할 수 없음 (중지 키 비활성): {str(e)}")
+            self.keyboard_listener = None
+    
+    def start(self, resume=False):
         """
         매크로 실행 시작
+        
+        resume 이 True 이면 체크포인트가 있는 경우 저장된 위치부터 이어서 실행한다.
         """
         if self.running:
             app_logger.warning("매크로가 이미 실행 중입니다")
             return
         
+        # 이전 실행 스레드가 아직 종료 중인 경우 (비동기 중지 직후)
+        if self.thread and self.thread.is_alive():
+            app_logger.warning("이전 매크로 실행이 아직 종료되지 않았습니다")
+            self.status_changed.emit("이전 매크로 실행이 종료되는 중입니다.")
+            return
+        
         if not self.actions:
             app_logger.warning("실행할 매크로 동작이 없습니다")
             self.status_changed.emit("실행할 매크로 동작이 없습니다.")
             return
         
+        # 실행할 동작 목록 결정 (체크포인트의 단계 번호도 이 목록 기준)
+        self.run_actions, actions_digest = self._prepare_run_actions()
+        
+        # 텍스트 리스트 동작과 폴더 모니터링 동작 인덱스 초기화 (재사용하는 최적화 목록의 동작 포함)
+        for action in self.run_actions:
+            if hasattr(action, 'reset'):
+                action.reset()
+        
+        # 실행 계획 생성 (반복마다 반복되는 준비 작업을 시작 시 1회로 제한)
+        self.repeat_counters = {}
+        try:
+            context = ExecutionContext(self.control, self.backend, self.clipboard_timeout,
+                                       arbiter=self.arbiter, input_priority=self.input_priority,
+                                       macro_path=self.macro_path)
+            self.plan = compile_plan(self.run_actions, context, self.repeat_counters)
+        except Exception as e:
+            error_msg = f"실행 계획 생성 중 오류 발생: {str(e)}"
+            app_logger.error(error_msg, exc_info=True)
+            self.status_changed.emit(error_msg)
+            return
+        
+        # 체크포인트 재개 위치 복원 (재개하지 않으면 처음부터, 하위 매크로 동작은 컴파일 후 생성됨)
+        self.resume_position = (0, 0)
+        if self.checkpoint_path:
+            self.macro_hash = compute_macro_hash(self.run_actions, actions_digest, self.macro_path)
+            if resume:
+                checkpoint = self.get_resume_checkpoint()
+                if checkpoint is not None:
+                    self._apply_checkpoint(checkpoint)
+                else:
+                    app_logger.info("재개할 체크포인트가 없어 처음부터 실행")
+        elif resume:
+            app_logger.warning("체크포인트 경로가 설정되지 않아 처음부터 실행")
+        
         # 실행 상태 초기화
         self.running = True
         self.paused = False
+        self.control.reset()
         
-        # 중지 키 리스너 시작
-        app_logger.info(f"키보드 리스너 시작 (중지 키: {self.stop_key})")
-        self.keyboard_listener = keyboard.Listener(on_press=self.on_key_press)
-        self.keyboard_listener.start()
+        # 백엔드가 입력마다 자동으로 넣는 대기를 끔 (모든 대기는 엔진과 동작이 직접 관리)
+        context.backend.set_pause(0)
         
-        # 텍스트 리스트 동작과 폴더 모니터링 동작 인덱스 초기화
-        for action in self.actions:
-            if hasattr(action, 'reset'):
-                action.reset()
+        # 중지 키 리스너 시작
+        self._start_keyboard_listener(context.backend)
         
         # 매크로 실행 스레드 시작
         app_logger.info("매크로 실행 스레드 시작")
@@ -189,6 +583,7 @@ class MacroEngine(QObject):
         if self.running and not self.paused:
             app_logger.info("매크로 일시 정지")
             self.paused = True
+            self.control.pause()
             self.status_changed.emit("매크로 일시 정지됨")
     
     def resume(self):
@@ -198,11 +593,15 @@ class MacroEngine(QObject):
         if self.running and self.paused:
             app_logger.info("매크로 실행 재개")
             self.paused = False
+            self.control.resume()
             self.status_changed.emit("매크로 다시 실행 중")
     
     def stop(self):
         """
-        매크로 실행 중지
+        매크로 실행 중지 (비동기)
+        
+        중지 요청만 전달하고 즉시 반환한다. 진행 중인 대기는 바로 깨어나며,
+        실행 스레드가 종료되면 macro_finished 시그널이 발생한다.
         """
         if not self.running:
             app_logger.debug("매크로가 실행 중이 아닙니다")
@@ -211,108 +610,290 @@ class MacroEngine(QObject):
         app_logger.info("매크로 실행 중지")
         self.running = False
         self.paused = False
+        self.control.stop()
         
         # 키보드 리스너 중지
         if self.keyboard_listener and self.keyboard_listener.is_alive():
             app_logger.debug("키보드 리스너 중지")
             self.keyboard_listener.stop()
             self.keyboard_listener = None
-        
-        # 스레드 종료 대기 - 현재 스레드가 아닌 경우에만 join 시도
-        if self.thread and self.thread.is_alive() and self.thread != threading.current_thread():
-            app_logger.debug("매크로 스레드 종료 대기")
-            try:
-                self.thread.join(1.0)  # 최대 1초간 대기
-                if self.thread.is_alive():
-                    app_logger.warning("매크로 스레드가 1초 내에 종료되지 않았습니다")
-            except Exception as e:
-                app_logger.error(f"스레드 종료 대기 중 오류: {str(e)}", exc_info=True)
-        self.thread = None
-        
-        self.status_changed.emit("매크로 중지됨")
-        self.macro_finished.emit()
 
+    def wait(self, timeout=None):
+        """
+        실행 스레드가 종료될 때까지 대기 (헤드리스 실행용)
+        
+        timeout 내에 종료되면 True, 아직 실행 중이면 False 반환
+        """
+        thread = self.thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+    
     def _run_macro(self):
         """
         매크로 실행 스레드 함수
         """
+        # 실행 기록 저장 이유 (정상 완료이고 오류가 없으면 None)
+        trace_reason = None
         try:
-            # 실행 전 클립보드 내용 확인
-            import pyperclip
-            import time
-            initial_clipboard = pyperclip.paste()
-            app_logger.debug(f"매크로 시작 시 클립보드 내용 (길이: {len(initial_clipboard)})")
+            # 실행 전 클립보드 내용 확인 (로그용이므로 클립보드를 사용할 수 없는 환경에서도 계속 진행)
+            initial_clipboard = read_clipboard()
+            if initial_clipboard is not None:
+                app_logger.debug(f"매크로 시작 시 클립보드 내용 (길이: {len(initial_clipboard)})")
             
-            # 무한 반복 또는 지정된 횟수만큼 반복
-            loop_counter = 0
+            # 무한 반복 또는 지정된 횟수만큼 반복 (체크포인트에서 재개하면 저장된 위치부터)
+            loop_counter, start_pc = self.resume_position
+            resume_pc = start_pc
             infinite_loop = (self.loop_count <= 0)
             
-            app_logger.info(f"매크로 실행 시작: {'무한 반복' if infinite_loop else f'{self.loop_count}회 반복'}")
+            # 반복 중 변하지 않는 값은 루프 밖에서 한 번만 준비
+            plan = self.plan
+            plan_length = len(plan)
+            delay_sec = self.delay / 1000.0
+            control = self.control
+            clipboard_timeout = self.clipboard_timeout
+            arbiter = self.arbiter
+            input_priority = self.input_priority
+            
+            # deadline 모드에서는 절대 마감 시각 기준으로 대기 (실행 시간이 누적되지 않음)
+            use_deadline = (self.schedule_mode == SCHEDULE_DEADLINE)
+            scheduler = self.scheduler
+            wait = scheduler.wait_for if use_deadline else control.wait
+            scheduler.start()
+            
+            # 단계별 시간 기록 (실행 시간 + 이어지는 대기 시간)
+            perf_counter = time.perf_counter
+            profiler = self.profiler
+            record = profiler.record
+            profiler.start(plan)
+            
+            # 체크포인트 저장 준비 (텍스트 리스트처럼 진행 위치를 가진 동작만 기록)
+            checkpoint_path = self.checkpoint_path
+            checkpoint_interval = self.checkpoint_interval
+            next_checkpoint = perf_counter() + checkpoint_interval
+            text_actions = collect_text_actions(self.run_actions)
+            
+            # 진행 상태 (단계마다 속성만 바꾸고 UI 가 10Hz 로 읽음)
+            progress = self.progress
+            progress.start(len(self.run_actions), self.loop_count, loop_counter)
+            
+            # 실행 기록 (단계마다 고정 길이 레코드 하나를 링 버퍼에 덮어씀)
+            trace = self.trace
+            trace.start(self.run_actions, self.loop_count)
+            trace_record = trace.record
+            step_errors = 0
+            
+            # 동작별 로그 표본 추출 (수준이 꺼져 있으면 반복마다 확인하지 않음)
+            log_every = self.log_every
+            info_enabled = app_logger.is_enabled(INFO)
+            debug_enabled = app_logger.is_enabled(DEBUG)
+            
+            app_logger.info(f"매크로 실행 시작: {'무한 반복' if infinite_loop else f'{self.loop_count}회 반복'} ({self.schedule_mode} 모드)")
             
             while self.running and (infinite_loop or loop_counter < self.loop_count):
-                # 각 동작 실행
-                action_index = 0
-                for action in self.actions:
-                    # 일시정지 상태면 대기
-                    while self.paused and self.running:
-                        time.sleep(0.1)
+                # 실행 계획의 각 단계 실행 (흐름 제어 단계가 다음 단계 번호를 결정)
+                pc = start_pc
+                start_pc = 0
+                interrupted = False
+                
+                # 이번 반복의 동작 로그 기록 여부 (동작 내부 로그도 같은 스레드에서 따름)
+                iteration = progress.loop + 1
+                log_actions = progress.loop % log_every == 0
+                app_logger.set_action_logging(log_actions)
+                log_steps = log_actions and info_enabled
+                log_flow = log_actions and debug_enabled
+                while pc < plan_length:
+                    step = plan[pc]
+                    resume_pc = pc
+                    
+                    # 일시정지 상태면 재개 또는 중지될 때까지 대기
+                    if control.paused:
+                        paused_at = perf_counter()
+                        control.wait_while_paused()
+                        progress.add_paused(perf_counter() - paused_at)
+                        # 일시 정지 시간만큼 밀린 일정은 따라잡지 않고 현재 시각부터 재개
+                        scheduler.rebase()
                     
                     # 중지되었으면 반복 종료
                     if not self.running:
                         app_logger.debug("매크로 중지 감지, 실행 종료")
+                        interrupted = True
+                        break
+                    
+                    # 주기적으로 실행 위치 저장 (현재 단계는 아직 실행 전)
+                    if checkpoint_path and perf_counter() >= next_checkpoint:
+                        self._save_checkpoint(loop_counter, pc, text_actions)
+                        next_checkpoint = perf_counter() + checkpoint_interval
+                    
+                    # 흐름 제어 단계는 점프 테이블에 따라 이동만 함 (동작 간 지연 없음)
+                    if step.flow is not None:
+                        if log_flow:
+                            app_logger.debug("흐름 제어: %s - 반복: %d", step.label, iteration)
+                        pc = step.run()
+                        continue
+                    
+                    pc += 1
+                    progress.action_index = step.index
+                    
+                    # 대기 동작은 스케줄러가 직접 대기
+                    if step.run is None:
+                        if log_steps:
+                            app_logger.info("매크로 동작: %s - 반복: %d", step.label, iteration)
+                        started = perf_counter()
+                        completed = wait(step.pre_wait + step.wait + step.post_wait + delay_sec)
+                        finished = perf_counter()
+                        record(step.index, 0.0, finished - started)
+                        trace_record(step.index, iteration, RESULT_WAIT, started, finished - started)
+                        if not completed:
+                            # 대기 도중 중지되면 재개 시 이 대기 단계부터 다시 실행
+                            app_logger.debug("매크로 중지 감지, 실행 종료")
+                            interrupted = True
+                            break
+                        progress.executed += 1
+                        continue
+                    
+                    # 동작별 실행 전 대기 (입력 잠금을 얻기 전에 대기)
+                    requested = perf_counter()
+                    if step.pre_wait and not wait(step.pre_wait):
+                        app_logger.debug("매크로 중지 감지, 실행 종료")
+                        interrupted = True
+                        break
+                    
+                    # 입력 단계는 입력 중재자가 있으면 차례가 올 때까지 대기 (중지 시 종료, 일시 정지 동안에는 잠금을 내려놓음)
+                    locked = arbiter is not None and step.uses_input
+                    if locked and not control.acquire_input(arbiter, input_priority):
+                        app_logger.debug("매크로 중지 감지, 실행 종료")
+                        interrupted = True
                         break
                     
                     # 동작 실행
+                    started = perf_counter()
                     try:
-                        app_logger.info(f"매크로 동작: [{action_index}] {action.name} - 반복: {loop_counter+1}")
-                        success = action.execute()
+                        if log_steps:
+                            app_logger.info("매크로 동작: %s - 반복: %d", step.label, iteration)
+                        if step.await_clipboard:
+                            previous_clipboard = get_change_token()
+                        success = step.run()
                         
                         # 파일 클립보드 넣기 동작 이후에 클립보드 내용 확인
-                        if action.name == "파일 클립보드 넣기" or "ctrl+c" in getattr(action, 'key_combination', ''):
-                            time.sleep(0.5)  # 복사 동작 후 대기
-                            clipboard_content = pyperclip.paste()
+                        if step.check_clipboard:
+                            # 복사 키 조합은 동작에서 이미 변경을 기다림, 그 외에는 변경될 때까지만 대기
+                            if step.await_clipboard:
+                                wait_for_change(previous_clipboard, clipboard_timeout, control)
+                            clipboard_content = read_clipboard() or ""
                             content_preview = clipboard_content[:50] + "..." if len(clipboard_content) > 50 else clipboard_content
-                            app_logger.debug(f"복사 동작 후 클립보드 내용 (길이: {len(clipboard_content)}): {content_preview}")
+                            app_logger.action_debug("복사 동작 후 클립보드 내용 (길이: %d): %s", len(clipboard_content), content_preview)
                         
-                        if not success:
-                            error_msg = f"동작 실패: {action.name}"
+                        # 실패 메시지는 시그널 대신 진행 상태로 전달 (UI 가 주기적으로 표시)
+                        if success:
+                            result = RESULT_OK
+                        else:
+                            result = RESULT_FAILED
+                            error_msg = f"동작 실패: {step.action.name}"
                             app_logger.warning(error_msg)
-                            self.status_changed.emit(error_msg)
+                            progress.message = error_msg
                     except Exception as e:
+                        result = RESULT_ERROR
+                        step_errors += 1
                         error_msg = f"오류 발생: {str(e)}"
                         app_logger.error(error_msg, exc_info=True)
-                        self.status_changed.emit(error_msg)
+                        progress.message = error_msg
+                    finally:
+                        # 지연 시간 동안에는 다른 엔진이 입력할 수 있도록 즉시 해제
+                        if locked:
+                            control.release_input()
                     
-                    # 지연 시간 대기
-                    time.sleep(self.delay / 1000.0)
-                    action_index += 1
+                    # 지연 시간 대기 (입력 차례를 기다린 시간도 대기 시간으로 기록)
+                    executed = perf_counter()
+                    trace_record(step.index, iteration, result, started, executed - started)
+                    completed = wait(step.post_wait + delay_sec)
+                    record(step.index, executed - started, started - requested + perf_counter() - executed)
+                    progress.executed += 1
+                    if not completed:
+                        # 동작은 이미 실행했으므로 재개 시 다음 단계부터 실행
+                        # (마지막 단계였다면 재개 후 이 반복을 완료로 처리)
+                        app_logger.debug("매크로 중지 감지, 실행 종료")
+                        resume_pc = pc
+                        interrupted = True
+                        break
+                
+                # 반복 도중 중지되었으면 완료 횟수에 포함하지 않음
+                if interrupted:
+                    break
+                resume_pc = 0
+                progress.loop += 1
                 
                 # 반복 카운터 증가
                 if not infinite_loop:
                     loop_counter += 1
-                    app_logger.debug(f"매크로 반복 완료: {loop_counter}/{self.loop_count}")
+                    app_logger.debug("매크로 반복 완료: %d/%d", loop_counter, self.loop_count)
                 elif self.running:
                     # 무한 반복 모드에서만 매 사이클 후 약간의 지연 추가 (CPU 부하 감소)
-                    time.sleep(0.01)  # 10ms 지연
+                    wait(0.01)  # 10ms 지연
+            
+            # 끝까지 실행했으면 체크포인트 삭제, 중지되었으면 중지된 위치 저장
+            if checkpoint_path:
+                if self.running:
+                    remove_checkpoint(checkpoint_path)
+                else:
+                    self._save_checkpoint(loop_counter, resume_pc, text_actions)
+            
+            profiler.finish()
+            profiler.log_report()
+            if use_deadline:
+                scheduler.log_stats()
+            
+            # 중지되었거나 동작 오류가 있었으면 실행 기록 저장
+            if step_errors:
+                trace_reason = "error"
+            elif not self.running:
+                trace_reason = "stop"
                 
             # 정상 종료 시
             if self.running:
                 app_logger.info("매크로 모든 반복 실행 완료")
                 self.status_changed.emit("매크로 실행 완료")
-                
-                # 스레드 내에서 stop 호출 시 current_thread 문제 방지
-                self.running = False
-                self.paused = False
-                self.macro_finished.emit()
+            else:
+                app_logger.info("매크로 실행 스레드 종료 (중지됨)")
+                self.status_changed.emit("매크로 중지됨")
         
         except Exception as e:
             error_msg = f"매크로 실행 중 오류 발생: {str(e)}"
             app_logger.error(error_msg, exc_info=True)
             self.status_changed.emit(error_msg)
+            trace_reason = "error"
+        
+        finally:
+            # 실행 스레드가 종료되는 시점에 한 번만 완료 처리
+            app_logger.set_action_logging(True)
+            self.progress.finish()
+            if trace_reason or self.trace_path:
+                self.dump_trace(trace_reason or "complete")
             self.running = False
             self.paused = False
+            self.control.stop()
+            # 컴파일된 실행 계획이 잡고 있는 참조 파일(텍스트 리스트 파일 등)을 놓음
+            self.plan = []
+            if self.keyboard_listener and self.keyboard_listener.is_alive():
+                self.keyboard_listener.stop()
+            self.keyboard_listener = None
             self.macro_finished.emit()
             
+    def _get_settings_data(self):
+        """
+        파일에 저장하는 실행 설정 딕셔너리 (동작 목록 제외)
+        """
+        return {
+            "version": "1.0",
+            "delay": self.delay,
+            "loop_count": self.loop_count,
+            "stop_key": self.stop_key,
+            "schedule_mode": self.schedule_mode,
+            "clipboard_timeout": self.clipboard_timeout,
+            "optimize": self.optimize
+        }
+    
     def save_to_file(self, file_path):
         """
         매크로 동작 리스트를 파일로 저장
@@ -320,19 +901,20 @@ class MacroEngine(QObject):
         try:
             app_logger.info(f"매크로 동작 리스트 저장: {file_path}")
             
+            # 편집 저널의 기준 파일이면 저널을 합쳐서 저장
+            if self.journal is not None and os.path.abspath(file_path) == os.path.abspath(self.journal.macro_path):
+                self.journal.compact()
+                app_logger.info(f"매크로 저장 완료 (편집 저널 합치기): {len(self.actions)}개 동작")
+                return True
+            
             # 모든 동작을 딕셔너리로 변환
             actions_data = []
             for action in self.actions:
                 actions_data.append(action.to_dict())
             
             # 설정 데이터 준비
-            data = {
-                "version": "1.0",
-                "delay": self.delay,
-                "loop_count": self.loop_count,
-                "stop_key": self.stop_key,
-                "actions": actions_data
-            }
+            data = self._get_settings_data()
+            data["actions"] = actions_data
             
             # 디렉토리 확인 및 생성
             dir_path = os.path.dirname(file_path)
@@ -340,9 +922,9 @@ class MacroEngine(QObject):
                 app_logger.debug(f"저장 디렉토리 생성: {dir_path}")
                 os.makedirs(dir_path)
             
-            # JSON 파일로 저장
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            # 파일로 저장 (확장자가 .macb 이면 바이너리, 그 외는 JSON)
+            write_macro_data(file_path, data)
+            self.macro_path = os.path.abspath(file_path)
             
             app_logger.info(f"매크로 저장 완료: {len(actions_data)}개 동작")
             return True
@@ -367,9 +949,8 @@ class MacroEngine(QObject):
         try:
             app_logger.info(f"매크로 동작 리스트 불러오기: {file_path}")
             
-            # 파일에서 JSON 데이터 불러오기
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # 파일에서 설정과 동작 객체 불러오기 (바이너리 파일은 레코드 단위로 읽음)
+            data, actions = load_macro_file(file_path)
             
             # 버전 확인
             version = data.get("version", "1.0")
@@ -379,16 +960,18 @@ class MacroEngine(QObject):
             self.delay = data.get("delay", 100)
             self.loop_count = data.get("loop_count", 1)
             self.stop_key = data.get("stop_key", "f12")
+            self.set_schedule_mode(data.get("schedule_mode", SCHEDULE_RELATIVE))
+            self.set_clipboard_timeout(data.get("clipboard_timeout", DEFAULT_CLIPBOARD_TIMEOUT))
+            self.set_optimize(data.get("optimize", False))
             
-            # 동작 목록 초기화
-            self.clear_actions()
-            
-            # 동작 객체 생성 및 추가
-            actions_data = data.get("actions", [])
-            for action_data in actions_data:
-                action = MacroAction.from_dict(action_data)
-                if action:
-                    self.add_action(action)
+            # 동작 목록 교체 (동작마다 로그를 남기지 않도록 한 번에 교체)
+            # 편집 저널에는 기록하지 않고 불러온 목록을 백그라운드에서 새 기준 파일로 저장
+            with self.edit_lock:
+                self.actions[:] = actions
+                self.edit_version += 1
+            self.macro_path = os.path.abspath(file_path)
+            if self.journal is not None:
+                self.journal.compact_async()
             
             app_logger.info(f"매크로 불러오기 완료: {len(self.actions)}개 동작")
             return True
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/macro_format.py
+
+import os
+import json
+import struct
+from utils.logger import app_logger
+
+# 바이너리 매크로 파일 확장자 (그 외 확장자는 JSON)
+BINARY_EXTENSION = ".macb"
+
+# 파일 대화상자 필터 (저장 시 선택한 필터로 확장자 결정)
+MACRO_SAVE_FILTER = "매크로 파일 (*.json);;바이너리 매크로 파일 (*.macb);;모든 파일 (*.*)"
+MACRO_OPEN_FILTER = "매크로 파일 (*.json *.macb);;모든 파일 (*.*)"
+
+BINARY_MAGIC = b"MACB"
+BINARY_VERSION = 2
+
+# 헤더 본문과 레코드의 인코딩 (1: UTF-8 JSON, 파이썬 버전과 무관하게 읽을 수 있음)
+PAYLOAD_JSON = 1
+
+# 레코드 하나에 담는 동작 수 (스트리밍 로드 단위)
+RECORD_ACTIONS = 1024
+
+# 파일 헤더: 매직, 형식 버전, 본문 인코딩, 동작 수, 헤더 본문 길이
+_HEADER = struct.Struct("<4sHHII")
+# 레코드 길이 접두사
+_LENGTH = struct.Struct("<I")
+
+
+class MacroFormatError(ValueError):
+    """
+    바이너리 매크로 파일 형식 오류
+    """
+    pass
+
+
+def _encode(value):
+    """
+    헤더 본문/레코드를 공백 없는 UTF-8 JSON 으로 인코딩
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def is_binary_macro(file_path):
+    """
+    확장자로 바이너리 매크로 파일인지 확인
+    """
+    return os.path.splitext(file_path)[1].lower() == BINARY_EXTENSION
+
+
+def write_binary_macro(file_path, data):
+    """
+    매크로 데이터(JSON 파일과 같은 구조의 딕셔너리)를 바이너리 형식으로 저장
+
+    파일 구조:
+      헤더   - 매직 "MACB", 형식 버전, 본문 인코딩, 동작 수, 헤더 본문 길이
+      본문   - 실행 설정(actions 를 제외한 모든 키)과 문자열 표, 동작 구조 표
+      레코드 - [길이 4바이트][동작 최대 RECORD_ACTIONS 개의 행 배열] 반복
+
+    본문과 레코드는 UTF-8 JSON 이다. 동작 유형 이름과 키 이름은 문자열 표에
+    한 번만 저장하고, 각 동작은 키 없이 [구조 번호, 값...] 행으로 저장한다.
+    JSON 으로 다시 변환하면 키 순서까지 원래 데이터와 같다.
+    """
+    actions = data.get("actions", [])
+    settings = {key: value for key, value in data.items() if key != "actions"}
+
+    strings = []        # 문자열 표 (동작 유형, 키 이름)
+    string_index = {}
+    schemas = []        # (유형 문자열 번호, (키 문자열 번호, ...))
+    schema_index = {}
+
+    def intern_string(text):
+        index = string_index.get(text)
+        if index is None:
+            index = string_index[text] = len(strings)
+            strings.append(text)
+        return index
+
+    rows = []
+    for action in actions:
+        # 키 구성이 같아도 유형이 다르면 다른 구조 (예: 조건 끝/그 외)
+        action_type = action.get("type", "")
+        keys = tuple(action)
+        schema_id = schema_index.get((action_type, keys))
+        if schema_id is None:
+            schema_id = schema_index[(action_type, keys)] = len(schemas)
+            schemas.append((intern_string(action_type), tuple(intern_string(key) for key in keys)))
+        row = [schema_id]
+        row.extend(action.values())
+        rows.append(row)
+
+    header = _encode({"settings": settings, "strings": strings, "schemas": schemas})
+
+    with open(file_path, 'wb') as f:
+        f.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, PAYLOAD_JSON, len(rows), len(header)))
+        f.write(header)
+        for start in range(0, len(rows), RECORD_ACTIONS):
+            record = _encode(rows[start:start + RECORD_ACTIONS])
+            f.write(_LENGTH.pack(len(record)))
+            f.write(record)
+
+    app_logger.debug(f"바이너리 매크로 저장: {file_path} ({len(rows)}개 동작, 구조 {len(schemas)}개)")
+
+
+class BinaryMacroReader:
+    """
+    바이너리 매크로 파일 순차 읽기
+
+    헤더만 먼저 읽어 설정과 동작 수를 알려 주고, 동작은 레코드 단위로
+    필요할 때 읽는다. with 문으로 사용하거나 close() 로 닫는다.
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._file = open(file_path, 'rb')
+        try:
+            self._read_header()
+        except Exception:
+            self._file.close()
+            raise
+
+    def _read_header(self):
+        raw = self._file.read(_HEADER.size)
+        if len(raw) != _HEADER.size:
+            raise MacroFormatError(f"바이너리 매크로 헤더가 잘렸습니다: {self.file_path}")
+        magic, version, encoding, action_count, header_length = _HEADER.unpack(raw)
+        if magic != BINARY_MAGIC:
+            raise MacroFormatError(f"바이너리 매크로 파일이 아닙니다: {self.file_path}")
+        if version != BINARY_VERSION or encoding != PAYLOAD_JSON:
+            raise MacroFormatError(f"지원하지 않는 바이너리 매크로 버전: {version} (인코딩 {encoding})")
+
+        header = self._load(self._file.read(header_length), dict)
+        self.action_count = action_count
+        self.settings = header["settings"]
+        strings = header["strings"]
+        # 구조 번호 -> (동작 유형, 키 이름 튜플)
+        self.schemas = [(strings[type_index], tuple(strings[index] for index in key_indexes))
+                        for type_index, key_indexes in header["schemas"]]
+
+    def _load(self, payload, expected_type):
+        """
+        JSON 본문 복원 (예상한 자료형이 아니면 형식 오류)
+        """
+        try:
+            value = json.loads(payload.decode("utf-8"))
+        except ValueError as e:
+            raise MacroFormatError(f"바이너리 매크로 데이터가 손상되었습니다: {str(e)}")
+        if not isinstance(value, expected_type):
+            raise MacroFormatError("바이너리 매크로 데이터 형식이 잘못되었습니다")
+        return value
+
+    def iter_records(self):
+        """
+        레코드 단위로 [구조 번호, 값...] 행 목록 반환
+        """
+        read = self._file.read
+        remaining = self.action_count
+        while remaining > 0:
+            raw = read(_LENGTH.size)
+            if len(raw) != _LENGTH.size:
+                raise MacroFormatError(f"바이너리 매크로가 잘렸습니다 (남은 동작 {remaining}개)")
+            (length,) = _LENGTH.unpack(raw)
+            rows = self._load(read(length), list)
+            remaining -= len(rows)
+            yield rows
+
+    def iter_action_dicts(self):
+        """
+        동작을 JSON 과 같은 딕셔너리로 하나씩 반환
+        """
+        schemas = self.schemas
+        for rows in self.iter_records():
+            for row in rows:
+                yield dict(zip(schemas[row[0]][1], row[1:]))
+
+    def iter_actions(self):
+        """
+        동작 객체를 하나씩 반환 (딕셔너리를 거치지 않음)
+
+        구조마다 생성자 인자가 행의 몇 번째 값인지 한 번만 계산해 두고
+        행에서 바로 생성자 인자를 꺼낸다. 결과는 MacroAction.from_dict 와
+        같으며, 등록되지 않은 동작 유형은 경고 후 건너뛴다.
+        """
+        from core.actions import ACTION_TYPES
+
+        builders = []
+        for action_type, keys in self.schemas:
+            action_class = ACTION_TYPES.get(action_type)
+            if action_class is None:
+                app_logger.warning(f"알 수 없는 동작 유형: {action_type}")
+                builders.append(None)
+                continue
+            # 키 이름 -> 행 위치 (0 은 구조 번호 자리이므로 "값 없음" 으로 사용)
+            positions = {key: position for position, key in enumerate(keys, 1)}
+            params = tuple((positions.get(name, 0), default) for name, default in action_class.init_params)
+            builders.append((action_class, params,
+                             positions.get("pre_delay", 0), positions.get("post_delay", 0)))
+
+        for rows in self.iter_records():
+            for row in rows:
+                builder = builders[row[0]]
+                if builder is None:
+                    continue
+                action_class, params, pre_position, post_position = builder
+                action = action_class(*[row[position] if position else default
+                                        for position, default in params])
+                action.pre_delay = row[pre_position] if pre_position else 0
+                action.post_delay = row[post_position] if post_position else 0
+                yield action
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_macro_data(file_path):
+    """
+    매크로 파일 전체를 JSON 과 같은 구조의 딕셔너리로 읽기 (확장자로 형식 선택)
+    """
+    if is_binary_macro(file_path):
+        with BinaryMacroReader(file_path) as reader:
+            data = dict(reader.settings)
+            data["actions"] = list(reader.iter_action_dicts())
+        return data
+
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def load_macro_file(file_path):
+    """
+    매크로 파일에서 (설정 딕셔너리, 동작 객체 목록) 읽기 (확장자로 형식 선택)
+
+    바이너리 파일은 레코드 단위로 읽으면서 바로 동작 객체를 만들므로
+    동작 딕셔너리 목록 전체를 메모리에 만들지 않는다.
+    """
+    if is_binary_macro(file_path):
+        with BinaryMacroReader(file_path) as reader:
+            return dict(reader.settings), list(reader.iter_actions())
+
+    from core.actions import MacroAction
+
+    data = read_macro_data(file_path)
+    actions = []
+    for action_data in data.pop("actions", []):
+        action = MacroAction.from_dict(action_data)
+        if action:
+            actions.append(action)
+    return data, actions
+
+
+def write_macro_data(file_path, data):
+    """
+    매크로 데이터를 파일로 저장 (확장자로 형식 선택)
+    """
+    if is_binary_macro(file_path):
+        write_binary_macro(file_path, data)
+        return
+
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def convert_macro(source_path, target_path):
+    """
+    매크로 파일 형식 변환 (JSON <-> 바이너리, 내용은 그대로 유지)
+    """
+    data = read_macro_data(source_path)
+    write_macro_data(target_path, data)
+    app_logger.info(f"매크로 파일 변환: {source_path} -> {target_path} ({len(data.get('actions', []))}개 동작)")
+    return len(data.get("actions", []))
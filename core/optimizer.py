@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/optimizer.py
+
+from utils.logger import app_logger
+from core.plan import CLIPBOARD_CHECK_ACTION_NAME
+from core.text_input import choose_input_mode
+from core.actions import (MacroAction, MouseMoveAction, MouseClickAction, MouseScrollAction,
+                          MouseDragDropAction, KeyboardInputAction, DelayAction)
+
+class OptimizationReport:
+    """
+    동작 목록 최적화 결과 (변경 내역과 줄어든 동작 수)
+    """
+    def __init__(self, original_count):
+        self.original_count = original_count
+        self.optimized_count = original_count
+        self.changes = []  # (원래 동작 인덱스, 설명)
+
+    def add(self, index, message):
+        self.changes.append((index, message))
+
+    @property
+    def removed_count(self):
+        return self.original_count - self.optimized_count
+
+    def to_text(self):
+        """
+        사람이 읽기 쉬운 보고서 문자열 반환
+        """
+        lines = [f"동작 최적화: {self.original_count}개 -> {self.optimized_count}개 "
+                 f"({self.removed_count}개 감소)"]
+        for index, message in self.changes:
+            lines.append(f"  [{index}] {message}")
+        return "\n".join(lines)
+
+    def log(self):
+        """
+        보고서를 로그로 출력
+        """
+        if self.changes:
+            app_logger.info(self.to_text())
+        else:
+            app_logger.info("동작 최적화: 변경 사항 없음")
+
+
+def _target_position(action):
+    """
+    동작이 실행 시 먼저 마우스를 옮기는 좌표 반환 (해당 없으면 None)
+    """
+    if isinstance(action, (MouseClickAction, MouseScrollAction)):
+        return (action.x, action.y)
+    if isinstance(action, MouseDragDropAction):
+        return (action.start_x, action.start_y)
+    return None
+
+def _is_plain(action):
+    """
+    제거/병합해도 되는 동작인지 확인
+
+    동작별 실행 전/후 대기가 있거나 엔진이 이름으로 특별 취급하는
+    동작(파일 클립보드 넣기)은 건드리지 않는다.
+    """
+    return (action.pre_delay == 0 and action.post_delay == 0
+            and action.name != CLIPBOARD_CHECK_ACTION_NAME)
+
+def _can_merge_text(previous, action):
+    """
+    연속 키보드 입력을 합쳐도 입력 방식이 바뀌지 않는지 확인
+
+    자동 모드는 텍스트 길이와 문자 종류로 타이핑/붙여넣기를 고르므로, 각각은
+    타이핑되던 텍스트가 합친 뒤 붙여넣기로 바뀌면(클립보드 덮어쓰기, 타이밍
+    변경) 합치지 않는다.
+    """
+    if action.input_mode != previous.input_mode or action.key_interval != previous.key_interval:
+        return False
+    mode = choose_input_mode(previous.text, previous.input_mode)
+    return (choose_input_mode(action.text, action.input_mode) == mode
+            and choose_input_mode(previous.text + action.text, previous.input_mode) == mode)
+
+def _copy(action):
+    """
+    원본 동작 목록을 바꾸지 않도록 병합할 동작 복사
+    """
+    return MacroAction.from_dict(action.to_dict())
+
+def optimize_actions(actions):
+    """
+    동작 목록에서 결과가 같은 불필요한 단계를 줄인 새 목록과 보고서 반환
+
+    - 연속된 지연 시간 동작은 하나로 합친다 (실행 전/후 대기 포함).
+    - 마우스 이동 직후 같은 좌표에서 클릭/스크롤/드래그하면 이동을 제거한다
+      (해당 동작이 같은 좌표로 먼저 이동함).
+    - 연속된 마우스 이동은 마지막 이동만 남긴다.
+    - 입력 방식과 글자 간격이 같은 연속 키보드 입력은 하나로 합친다
+      (합친 텍스트도 같은 방식으로 입력되는 경우만).
+
+    비교는 바로 이웃한 동작끼리만 하므로 흐름 제어 동작(라벨, 반복, 조건)을
+    사이에 둔 동작은 합쳐지지 않는다. 원본 목록과 동작 객체는 변경하지 않으며,
+    변경되지 않은 동작은 같은 객체를 그대로 사용한다.
+    """
+    report = OptimizationReport(len(actions))
+    result = []
+    # result 의 각 항목이 원본 목록에서 몇 번째 동작이었는지 (보고서용)
+    origins = []
+
+    for index, action in enumerate(actions):
+        previous = result[-1] if result else None
+
+        if previous is not None:
+            # 연속 지연 시간 합치기
+            if isinstance(action, DelayAction) and isinstance(previous, DelayAction):
+                merged = previous if previous is not actions[origins[-1]] else _copy(previous)
+                merged.delay += action.delay
+                merged.pre_delay += action.pre_delay
+                merged.post_delay += action.post_delay
+                result[-1] = merged
+                report.add(index, f"지연 시간을 [{origins[-1]}]에 합침 (합계 {merged.delay}ms)")
+                continue
+
+            # 이어지는 이동이 덮어쓰는 마우스 이동 제거
+            if isinstance(previous, MouseMoveAction) and _is_plain(previous):
+                if isinstance(action, MouseMoveAction):
+                    report.add(origins[-1], f"다음 마우스 이동 [{index}]에 합침")
+                    result[-1] = action
+                    origins[-1] = index
+                    continue
+                if _target_position(action) == (previous.x, previous.y):
+                    report.add(origins[-1], f"같은 좌표에서 실행되는 [{index}] {action.name} 앞의 이동 제거")
+                    result[-1] = action
+                    origins[-1] = index
+                    continue
+
+            # 연속 키보드 입력 합치기
+            if (isinstance(action, KeyboardInputAction) and isinstance(previous, KeyboardInputAction)
+                    and _is_plain(action) and _is_plain(previous)
+                    and _can_merge_text(previous, action)):
+                merged = previous if previous is not actions[origins[-1]] else _copy(previous)
+                merged.text += action.text
+                result[-1] = merged
+                report.add(index, f"키보드 입력을 [{origins[-1]}]에 합침")
+                continue
+
+        result.append(action)
+        origins.append(index)
+
+    report.optimized_count = len(result)
+    return result, report
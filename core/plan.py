@@ -0,0 +1,301 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/plan.py
+
+import os
+from utils.logger import app_logger
+from core.scheduler import ExecutionControl
+from core.input_backend import get_default_backend
+from core.clipboard_utils import DEFAULT_CLIPBOARD_TIMEOUT, get_change_token, wait_for_change
+
+# 실행 후 클립보드 내용을 확인하는 동작 이름
+CLIPBOARD_CHECK_ACTION_NAME = "파일 클립보드 넣기"
+
+# 흐름 제어 동작 종류
+FLOW_LABEL = "label"
+FLOW_JUMP = "jump"
+FLOW_REPEAT_START = "repeat_start"
+FLOW_REPEAT_END = "repeat_end"
+FLOW_IF = "if"
+FLOW_ELSE = "else"
+FLOW_END_IF = "end_if"
+
+def resolve_macro_path(file_path, caller_path=None):
+    """
+    하위 매크로 경로를 절대 경로로 변환
+
+    상대 경로는 호출한 매크로 파일(caller_path)이 있는 디렉토리 기준이며,
+    호출한 파일을 모르면(저장하지 않은 매크로) 현재 작업 디렉토리 기준이다.
+    """
+    if os.path.isabs(file_path):
+        return os.path.normpath(file_path)
+    base_dir = os.path.dirname(os.path.abspath(caller_path)) if caller_path else os.getcwd()
+    return os.path.normpath(os.path.join(base_dir, file_path))
+
+class ExecutionContext:
+    """
+    동작 컴파일 시 주입되는 실행 환경
+
+    control: 중지/일시 정지를 반영하는 대기 제어 객체 (ExecutionControl)
+    backend: 마우스/키보드 입력 백엔드 (InputBackend), 생략 시 공용 기본 백엔드
+    clipboard_timeout: 복사 후 클립보드 변경을 기다리는 최대 시간 (초)
+    call_stack: 현재 컴파일 중인 하위 매크로 파일 경로 (재귀 호출 확인용)
+    arbiter / input_priority: 입력 중재자와 우선순위 (하위 매크로의 입력 단계도 단계마다 잠금)
+    macro_path: 최상위 매크로 파일 경로 (하위 매크로 상대 경로의 기준, 없으면 작업 디렉토리)
+    """
+    def __init__(self, control=None, backend=None, clipboard_timeout=DEFAULT_CLIPBOARD_TIMEOUT,
+                 call_stack=(), arbiter=None, input_priority=None, macro_path=None):
+        self.control = control or ExecutionControl()
+        self.backend = backend or get_default_backend()
+        self.clipboard_timeout = clipboard_timeout
+        self.call_stack = call_stack
+        self.arbiter = arbiter
+        self.input_priority = input_priority
+        self.macro_path = macro_path
+
+    def resolve_path(self, file_path):
+        """
+        하위 매크로 경로를 지금 컴파일 중인 매크로 파일 기준 절대 경로로 변환
+        """
+        caller_path = self.call_stack[-1] if self.call_stack else self.macro_path
+        return resolve_macro_path(file_path, caller_path)
+
+    def for_call(self, path):
+        """
+        하위 매크로 컴파일용 실행 환경 반환 (이미 호출 중인 파일이면 ValueError)
+        """
+        if path in self.call_stack:
+            chain = " -> ".join(self.call_stack + (path,))
+            raise ValueError(f"하위 매크로 재귀 호출: {chain}")
+        return ExecutionContext(self.control, self.backend, self.clipboard_timeout,
+                                self.call_stack + (path,), self.arbiter, self.input_priority,
+                                self.macro_path)
+
+
+class PlanStep:
+    """
+    실행 계획의 단일 단계
+
+    동작 객체, 미리 바인딩된 실행 함수, 로그 라벨, 실행 후 처리 여부를
+    매크로 시작 시점에 한 번만 계산하여 보관한다. 대기 동작은 run 이 None 이고
+    wait 에 대기 시간(초)이 들어가며, 실제 대기는 엔진의 스케줄러가 수행한다.
+    await_clipboard 가 True 인 단계는 실행 후 엔진이 클립보드 변경을 기다린다
+    (복사 키 조합은 동작 자체가 변경을 기다리므로 False).
+    uses_input 이 True 인 단계는 입력 중재자가 있으면 잠금을 얻은 뒤 실행된다.
+    흐름 제어 단계는 flow 에 종류가 들어가며, run 은 다음에 실행할 단계 번호를 반환한다.
+    pre_wait / post_wait 는 동작별 실행 전/후 추가 대기 시간(초)이다.
+    """
+    __slots__ = ("index", "action", "run", "wait", "label", "check_clipboard", "await_clipboard",
+                 "uses_input", "flow", "pre_wait", "post_wait")
+
+    def __init__(self, index, action, run, wait=0.0, check_clipboard=False, await_clipboard=False):
+        self.index = index
+        self.flow = action.flow
+        self.action = action
+        self.run = run
+        self.wait = wait
+        self.label = f"[{index}] {action.name}"
+        self.check_clipboard = check_clipboard
+        self.await_clipboard = await_clipboard
+        self.uses_input = action.uses_input
+        self.pre_wait = action.pre_delay / 1000.0
+        self.post_wait = action.post_delay / 1000.0
+
+
+def compile_plan(actions, context, repeat_counters=None):
+    """
+    동작 목록을 실행 계획(PlanStep 리스트)으로 변환
+
+    repeat_counters: 반복 블록별 완료 횟수를 기록할 딕셔너리
+    (체크포인트 저장/재개를 위해 엔진이 전달, 생략 시 내부에서 생성)
+    """
+    # 블록 짝과 라벨 위치를 미리 계산 (잘못된 구조는 실행 전에 오류)
+    targets = resolve_flow(actions)
+    if repeat_counters is None:
+        repeat_counters = {}
+
+    plan = []
+    for index, action in enumerate(actions):
+        # 흐름 제어 동작은 다음 단계 번호를 반환하는 함수로 변환
+        if action.flow is not None:
+            run = _compile_flow(actions, index, targets, repeat_counters, context)
+            plan.append(PlanStep(index, action, run))
+            continue
+
+        # 대기 동작은 엔진이 직접 대기하도록 실행 함수 없이 대기 시간만 기록
+        if action.is_wait:
+            plan.append(PlanStep(index, action, None, action.get_wait_seconds()))
+            continue
+
+        run = action.compile(context)
+
+        # 파일 클립보드 넣기 / Ctrl+C 동작은 실행 후 클립보드 내용 확인
+        is_copy = action.copies_to_clipboard()
+        check_clipboard = action.name == CLIPBOARD_CHECK_ACTION_NAME or is_copy
+
+        plan.append(PlanStep(index, action, run, check_clipboard=check_clipboard,
+                             await_clipboard=check_clipboard and not is_copy))
+
+    app_logger.debug(f"실행 계획 생성 완료: {len(plan)}단계")
+    return plan
+
+
+def resolve_flow(actions):
+    """
+    흐름 제어 동작의 점프 테이블 생성 ({동작 인덱스: 대상 동작 인덱스})
+
+    - 반복 시작 <-> 반복 끝은 서로를 가리킨다.
+    - 조건 시작은 조건이 거짓일 때 이동할 조건 아니면(없으면 조건 끝)을,
+      조건 아니면은 조건 끝을 가리킨다.
+    - 라벨로 이동은 대상 라벨을 가리킨다.
+
+    블록 짝이 맞지 않거나 라벨이 중복/누락되면 ValueError 를 발생시킨다.
+    """
+    targets = {}
+    labels = {}
+    stack = []  # [종류, 시작 인덱스, 조건 아니면 인덱스]
+
+    for index, action in enumerate(actions):
+        flow = action.flow
+        if flow is None:
+            continue
+
+        if flow == FLOW_LABEL:
+            if action.label in labels:
+                raise ValueError(f"[{index}] 중복된 라벨: {action.label} (처음 정의: [{labels[action.label]}])")
+            labels[action.label] = index
+
+        elif flow in (FLOW_REPEAT_START, FLOW_IF):
+            stack.append([flow, index, None])
+
+        elif flow == FLOW_REPEAT_END:
+            if not stack or stack[-1][0] != FLOW_REPEAT_START:
+                raise ValueError(f"[{index}] 반복 끝에 대응하는 반복 시작이 없습니다")
+            _, start, _ = stack.pop()
+            targets[start] = index
+            targets[index] = start
+
+        elif flow == FLOW_ELSE:
+            if not stack or stack[-1][0] != FLOW_IF or stack[-1][2] is not None:
+                raise ValueError(f"[{index}] 조건 아니면에 대응하는 조건 시작이 없습니다")
+            stack[-1][2] = index
+
+        elif flow == FLOW_END_IF:
+            if not stack or stack[-1][0] != FLOW_IF:
+                raise ValueError(f"[{index}] 조건 끝에 대응하는 조건 시작이 없습니다")
+            _, start, else_index = stack.pop()
+            if else_index is None:
+                targets[start] = index
+            else:
+                targets[start] = else_index
+                targets[else_index] = index
+
+    if stack:
+        kind, start, _ = stack[-1]
+        block_name = "반복" if kind == FLOW_REPEAT_START else "조건"
+        raise ValueError(f"[{start}] {block_name} 블록이 닫히지 않았습니다")
+
+    for index, action in enumerate(actions):
+        if action.flow == FLOW_JUMP:
+            if action.label not in labels:
+                raise ValueError(f"[{index}] 이동할 라벨이 없습니다: {action.label}")
+            targets[index] = labels[action.label]
+
+    return targets
+
+
+def _compile_flow(actions, index, targets, repeat_counters, context):
+    """
+    흐름 제어 동작 1개를 다음 단계 번호를 반환하는 함수로 변환
+    """
+    action = actions[index]
+    flow = action.flow
+    next_pc = index + 1
+
+    if flow == FLOW_JUMP or flow == FLOW_ELSE:
+        # 대상(라벨 / 조건 끝) 다음 단계로 이동
+        target_pc = targets[index] + 1
+        return lambda: target_pc
+
+    if flow == FLOW_IF:
+        condition = action.compile(context)
+        false_pc = targets[index] + 1
+        return lambda: next_pc if condition() else false_pc
+
+    if flow == FLOW_REPEAT_START:
+        def run():
+            # 블록에 처음 들어올 때 반복 횟수 초기화
+            repeat_counters[index] = 0
+            return next_pc
+        return run
+
+    if flow == FLOW_REPEAT_END:
+        start = targets[index]
+        count = actions[start].count
+        body_pc = start + 1
+        def run():
+            done = repeat_counters.get(start, 0) + 1
+            repeat_counters[start] = done
+            # 0 이하는 무한 반복
+            if count <= 0 or done < count:
+                return body_pc
+            return next_pc
+        return run
+
+    # 라벨 / 조건 끝은 표시만 하고 다음 단계로 진행
+    return lambda: next_pc
+
+
+def run_plan(plan, context, delay_sec):
+    """
+    실행 계획을 현재 스레드에서 처음부터 끝까지 한 번 실행 (하위 매크로 호출용)
+
+    엔진 루프와 같은 방식으로 흐름 제어, 대기 동작, 동작 간 지연을 처리하고,
+    입력 중재자가 있으면 입력 단계마다 잠금을 얻는다 (지연 중에는 다른 엔진이 입력).
+    개별 동작의 실패나 오류는 기록만 하고 계속 진행하며, 중지되면 False 를 반환한다.
+    """
+    control = context.control
+    wait = control.wait
+    arbiter = context.arbiter
+    input_priority = context.input_priority
+    clipboard_timeout = context.clipboard_timeout
+    plan_length = len(plan)
+    pc = 0
+    while pc < plan_length:
+        if control.paused:
+            control.wait_while_paused()
+        if control.stopped:
+            return False
+
+        step = plan[pc]
+        if step.flow is not None:
+            pc = step.run()
+            continue
+        pc += 1
+
+        if step.run is None:
+            if not wait(step.pre_wait + step.wait + step.post_wait + delay_sec):
+                return False
+            continue
+
+        if step.pre_wait and not wait(step.pre_wait):
+            return False
+        locked = arbiter is not None and step.uses_input
+        if locked and not control.acquire_input(arbiter, input_priority):
+            return False
+        try:
+            if step.await_clipboard:
+                previous_clipboard = get_change_token()
+            if not step.run():
+                app_logger.warning(f"하위 매크로 동작 실패: {step.label}")
+            if step.await_clipboard:
+                wait_for_change(previous_clipboard, clipboard_timeout, control)
+        except Exception as e:
+            app_logger.error(f"하위 매크로 동작 오류: {step.label} - {str(e)}", exc_info=True)
+        finally:
+            if locked:
+                control.release_input()
+
+        if not wait(step.post_wait + delay_sec):
+            return False
+    return True
@@ -0,0 +1,284 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/profiler.py
+
+import io
+import csv
+import json
+import math
+import time
+import threading
+import unicodedata
+from utils.logger import app_logger
+
+def _display_width(text):
+    """
+    고정폭 글꼴에서의 표시 폭 (한글 등 전각 문자는 2칸)
+    """
+    return sum(2 if unicodedata.east_asian_width(char) in ('W', 'F') else 1 for char in text)
+
+def _pad(text, width, right=False):
+    """
+    표시 폭 기준으로 공백을 채워 정렬
+    """
+    padding = " " * max(0, width - _display_width(text))
+    return padding + text if right else text + padding
+
+
+class LatencyHistogram:
+    """
+    로그 간격 버킷 기반 지연 시간 히스토그램
+
+    샘플을 보관하지 않고 버킷별 개수만 세므로 장시간 실행에서도 메모리가
+    늘지 않는다. 버킷 폭은 RATIO 배씩 커지며 백분위 오차는 약 5% 이내이다.
+    """
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    MIN_SECONDS = 1e-6   # 1µs 이하는 첫 번째 버킷에 기록
+    RATIO = 1.05
+    _LOG_RATIO = math.log(RATIO)
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self.buckets = {}
+
+    def add(self, seconds):
+        """
+        샘플 1개 기록 (초 단위)
+        """
+        if self.count == 0 or seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+        self.count += 1
+        self.total += seconds
+
+        if seconds > self.MIN_SECONDS:
+            bucket = int(math.log(seconds / self.MIN_SECONDS) / self._LOG_RATIO) + 1
+        else:
+            bucket = 0
+        buckets = self.buckets
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+
+    def percentile(self, p):
+        """
+        백분위 값 반환 (초 단위, 버킷 상한 기준이며 최소/최대값 범위로 제한)
+        """
+        if not self.count:
+            return 0.0
+        target = max(1, int(math.ceil(self.count * p)))
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= target:
+                upper = self.MIN_SECONDS * (self.RATIO ** bucket)
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+
+class _StepStats:
+    """
+    실행 계획 단계(또는 동작 유형) 하나의 누적 시간 기록
+    """
+    __slots__ = ("index", "name", "type", "histogram", "exec_total", "wait_total")
+
+    def __init__(self, index, name, type_name):
+        self.index = index
+        self.name = name
+        self.type = type_name
+        self.histogram = LatencyHistogram()
+        self.exec_total = 0.0
+        self.wait_total = 0.0
+
+    def to_dict(self, profiled_total):
+        histogram = self.histogram
+        total = histogram.total
+        return {
+            "index": self.index,
+            "name": self.name,
+            "type": self.type,
+            "count": histogram.count,
+            "min_ms": histogram.min * 1000.0,
+            "p50_ms": histogram.percentile(0.50) * 1000.0,
+            "p95_ms": histogram.percentile(0.95) * 1000.0,
+            "p99_ms": histogram.percentile(0.99) * 1000.0,
+            "max_ms": histogram.max * 1000.0,
+            "total_s": total,
+            "exec_s": self.exec_total,
+            "wait_s": self.wait_total,
+            "share": total / profiled_total if profiled_total > 0 else 0.0
+        }
+
+
+class ActionProfiler:
+    """
+    동작별 실행 시간 프로파일러
+
+    실행 계획의 각 단계마다 동작 실행 시간(execute)과 이어지는 대기 시간
+    (지연 동작 또는 동작 간 지연)을 합산해 단계 인덱스별, 동작 유형별로
+    count/min/p50/p95/p99/max/total 을 기록한다. 실행이 끝나면 어떤 동작이나
+    대기가 시간을 차지했는지 텍스트, JSON, CSV 보고서로 확인할 수 있다.
+    """
+    CSV_FIELDS = ("scope", "index", "name", "type", "count", "min_ms", "p50_ms", "p95_ms",
+                  "p99_ms", "max_ms", "total_s", "exec_s", "wait_s", "share")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.steps = []
+        self.types = {}
+        self.started_at = None
+        self.finished_at = None
+
+    def start(self, plan):
+        """
+        실행 계획 기준으로 기록 초기화 및 측정 시작
+        """
+        with self._lock:
+            self.steps = [_StepStats(step.index, step.action.name, type(step.action).__name__)
+                          for step in plan]
+            self.types = {}
+            for stats in self.steps:
+                if stats.type not in self.types:
+                    self.types[stats.type] = _StepStats(None, stats.type, stats.type)
+            self.started_at = time.perf_counter()
+            self.finished_at = None
+
+    def finish(self):
+        """
+        측정 종료 시각 기록
+        """
+        self.finished_at = time.perf_counter()
+
+    def record(self, position, exec_seconds, wait_seconds):
+        """
+        실행 계획의 position 번째 단계 1회 실행 시간 기록 (초 단위)
+        """
+        with self._lock:
+            stats = self.steps[position]
+            type_stats = self.types[stats.type]
+            elapsed = exec_seconds + wait_seconds
+            stats.histogram.add(elapsed)
+            stats.exec_total += exec_seconds
+            stats.wait_total += wait_seconds
+            type_stats.histogram.add(elapsed)
+            type_stats.exec_total += exec_seconds
+            type_stats.wait_total += wait_seconds
+
+    def get_report(self):
+        """
+        보고서 데이터 반환 (시간 합계 기준 내림차순 정렬)
+        """
+        with self._lock:
+            exec_total = sum(stats.exec_total for stats in self.steps)
+            wait_total = sum(stats.wait_total for stats in self.steps)
+            profiled_total = exec_total + wait_total
+
+            if self.started_at is None:
+                wall_time = 0.0
+            else:
+                wall_time = (self.finished_at or time.perf_counter()) - self.started_at
+
+            steps = [stats.to_dict(profiled_total) for stats in self.steps if stats.histogram.count]
+            types = [stats.to_dict(profiled_total) for stats in self.types.values() if stats.histogram.count]
+
+        steps.sort(key=lambda row: row["total_s"], reverse=True)
+        types.sort(key=lambda row: row["total_s"], reverse=True)
+        return {
+            "summary": {
+                "wall_s": wall_time,
+                "profiled_s": profiled_total,
+                "exec_s": exec_total,
+                "wait_s": wait_total,
+                # 로그, 일시 정지, 반복 사이 처리 등 단계 밖에서 쓰인 시간
+                "other_s": max(0.0, wall_time - profiled_total)
+            },
+            "steps": steps,
+            "types": types
+        }
+
+    def to_json(self):
+        """
+        보고서를 JSON 문자열로 반환
+        """
+        return json.dumps(self.get_report(), ensure_ascii=False, indent=2)
+
+    def to_csv(self):
+        """
+        보고서를 CSV 문자열로 반환 (scope 열: step / type)
+        """
+        report = self.get_report()
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=self.CSV_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        for scope in ("step", "type"):
+            for row in report[scope + "s"]:
+                writer.writerow(dict(row, scope=scope))
+        return output.getvalue()
+
+    def to_text(self, top=20):
+        """
+        "시간이 어디에 쓰였는지" 요약 텍스트 보고서 반환
+        """
+        report = self.get_report()
+        summary = report["summary"]
+
+        def ratio(value):
+            return value / summary["wall_s"] * 100.0 if summary["wall_s"] > 0 else 0.0
+
+        lines = [
+            "=== 매크로 실행 프로파일 ===",
+            f"전체 실행 시간: {summary['wall_s']:.3f}s",
+            f"  동작 실행: {summary['exec_s']:.3f}s ({ratio(summary['exec_s']):.1f}%)",
+            f"  대기/지연: {summary['wait_s']:.3f}s ({ratio(summary['wait_s']):.1f}%)",
+            f"  기타: {summary['other_s']:.3f}s ({ratio(summary['other_s']):.1f}%)",
+            "",
+            "--- 동작 유형별 ---"
+        ]
+
+        header = (_pad("", 24) + _pad("횟수", 8, True) + _pad("p50", 10, True) + _pad("p95", 10, True)
+                  + _pad("p99", 10, True) + _pad("최대", 10, True) + _pad("합계", 10, True)
+                  + _pad("실행", 10, True) + _pad("대기", 10, True) + _pad("비율", 7, True))
+        lines.append(header)
+        for row in report["types"]:
+            lines.append(self._format_row(row["type"], row))
+
+        lines.append("")
+        lines.append(f"--- 시간 합계 상위 단계 (최대 {top}개) ---")
+        lines.append(header)
+        for row in report["steps"][:top]:
+            lines.append(self._format_row(f"[{row['index']}] {row['name']}", row))
+
+        return "\n".join(lines)
+
+    def _format_row(self, label, row):
+        """
+        텍스트 보고서의 한 줄 생성 (시간 값은 ms/s 단위)
+        """
+        while _display_width(label) > 23:
+            label = label[:-2] + "…"
+        return (_pad(label, 24) + f"{row['count']:>8}{row['p50_ms']:>8.2f}ms{row['p95_ms']:>8.2f}ms"
+                f"{row['p99_ms']:>8.2f}ms{row['max_ms']:>8.2f}ms{row['total_s']:>9.2f}s"
+                f"{row['exec_s']:>9.2f}s{row['wait_s']:>9.2f}s{row['share'] * 100.0:>6.1f}%")
+
+    def log_report(self, top=20):
+        """
+        텍스트 보고서를 로그로 출력
+        """
+        app_logger.info("\n" + self.to_text(top))
+
+    def save(self, file_path):
+        """
+        보고서를 파일로 저장 (확장자가 .csv 면 CSV, 그 외에는 JSON)
+        """
+        try:
+            content = self.to_csv() if file_path.lower().endswith('.csv') else self.to_json()
+            with open(file_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(content)
+            app_logger.info(f"실행 프로파일 저장 완료: {file_path}")
+            return True
+        except Exception as e:
+            app_logger.error(f"실행 프로파일 저장 중 오류 발생: {str(e)}", exc_info=True)
+            return False
@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/progress.py
+
+import time
+
+# UI 가 진행 상태를 읽는 간격 (ms, 10Hz)
+PROGRESS_INTERVAL_MS = 100
+
+class ProgressSnapshot:
+    """
+    한 시점의 실행 진행 상태 (UI 표시용)
+    """
+    __slots__ = ("running", "action_index", "action_count", "loop", "loop_count",
+                 "executed", "elapsed", "actions_per_sec", "eta", "message")
+
+    def __init__(self, running, action_index, action_count, loop, loop_count,
+                 executed, elapsed, actions_per_sec, eta, message):
+        self.running = running
+        self.action_index = action_index      # 현재 실행 중인 동작 인덱스 (-1 은 없음)
+        self.action_count = action_count
+        self.loop = loop                      # 현재 반복 (1부터)
+        self.loop_count = loop_count          # 0 이하는 무한 반복
+        self.executed = executed              # 실행한 동작 수
+        self.elapsed = elapsed                # 일시 정지 시간을 뺀 실행 시간 (초)
+        self.actions_per_sec = actions_per_sec
+        self.eta = eta                        # 남은 예상 시간 (초, 알 수 없으면 None)
+        self.message = message                # 마지막 동작 실패/오류 메시지
+
+    def to_text(self):
+        """
+        상태 표시줄용 문자열
+        """
+        loops = f"{self.loop}/{self.loop_count}" if self.loop_count > 0 else f"{self.loop}/무한"
+        text = (f"반복 {loops} · 동작 {self.action_index + 1}/{self.action_count} · "
+                f"{self.actions_per_sec:.1f}개/초")
+        if self.eta is not None:
+            minutes, seconds = divmod(int(self.eta + 0.5), 60)
+            text += f" · 남은 시간 {minutes:02d}:{seconds:02d}"
+        return text
+
+
+class ExecutionProgress:
+    """
+    실행 스레드가 기록하고 UI 가 주기적으로 읽는 공유 진행 상태
+
+    실행 스레드는 단계마다 속성 몇 개만 바꾸고 Qt 시그널을 보내지 않는다.
+    UI 는 QTimer 로 PROGRESS_INTERVAL_MS 마다 snapshot() 을 호출하므로
+    동작이 아무리 빨리 실행되어도 화면 갱신은 초당 10회를 넘지 않는다.
+    값은 한 스레드만 쓰고 각 속성 대입은 원자적이므로 잠금을 쓰지 않는다
+    (스냅샷 속 값들이 서로 한 단계 어긋날 수는 있음).
+    """
+    def __init__(self):
+        self.running = False
+        self.action_index = -1
+        self.action_count = 0
+        self.loop = 0             # 완료한 반복 횟수
+        self.loop_count = 0
+        self.executed = 0
+        self.message = None
+        self.paused_seconds = 0.0
+        self.started_at = 0.0
+        self.finished_at = None
+
+    def start(self, action_count, loop_count, loop=0, action_index=-1):
+        """
+        실행 시작 시 초기화 (체크포인트에서 재개하면 완료한 반복 횟수부터)
+        """
+        self.action_index = action_index
+        self.action_count = action_count
+        self.loop = loop
+        self.loop_count = loop_count
+        self.executed = 0
+        self.message = None
+        self.paused_seconds = 0.0
+        self.finished_at = None
+        self.started_at = time.perf_counter()
+        self.running = True
+
+    def add_paused(self, seconds):
+        """
+        일시 정지 시간 기록 (처리 속도와 남은 시간 계산에서 제외)
+        """
+        self.paused_seconds += seconds
+
+    def finish(self):
+        """
+        실행 종료 시각 기록 (이후 스냅샷의 실행 시간과 처리 속도 고정)
+        """
+        self.finished_at = time.perf_counter()
+        self.running = False
+
+    def snapshot(self):
+        """
+        현재 진행 상태와 처리 속도, 남은 예상 시간 계산
+        """
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        elapsed = max(0.0, end - self.started_at - self.paused_seconds)
+        executed = self.executed
+        action_index = self.action_index
+        action_count = self.action_count
+        loop = self.loop
+        loop_count = self.loop_count
+
+        actions_per_sec = executed / elapsed if elapsed > 0 else 0.0
+
+        # 전체 진행률 = (완료한 반복 + 현재 반복 안의 위치) / 반복 횟수
+        eta = None
+        if loop_count > 0 and action_count > 0 and elapsed > 0:
+            done = (loop + max(0, action_index) / action_count) / loop_count
+            if done > 0:
+                eta = max(0.0, elapsed * (1.0 - done) / done)
+
+        # 현재 반복 번호 (끝까지 실행한 뒤에는 마지막 반복)
+        current_loop = loop + 1 if loop_count <= 0 else min(loop + 1, loop_count)
+        return ProgressSnapshot(self.running, action_index, action_count, current_loop, loop_count,
+                                executed, elapsed, actions_per_sec, eta, self.message)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/scheduler.py
+
+import time
+import threading
+from array import array
+from utils.logger import app_logger
+
+# 스케줄 모드
+SCHEDULE_RELATIVE = "relative"   # 실행 후 지연 시간만큼 대기 (기존 방식)
+SCHEDULE_DEADLINE = "deadline"   # 절대 마감 시각 기준 대기 (드리프트 없음)
+SCHEDULE_MODES = (SCHEDULE_RELATIVE, SCHEDULE_DEADLINE)
+
+class ExecutionControl:
+    """
+    중지/일시 정지 요청을 즉시 반영하는 대기 제어 객체
+
+    엔진과 동작의 모든 대기는 이 객체를 통해 이루어진다. 대기 중인 스레드는
+    조건 변수로 잠들어 있다가 stop/pause/resume 호출 즉시 깨어나므로
+    긴 지연 시간 중에도 중지와 일시 정지가 바로 반영된다.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._paused = False
+        self._linked = []         # 상태 변화 시 함께 깨울 조건 변수 (입력 중재자 대기열)
+        self._input = None        # 실행 스레드가 가진 입력 잠금 (중재자, 우선순위)
+
+    def reset(self):
+        """
+        실행 시작 전 상태 초기화
+        """
+        with self._cond:
+            self._stopped = False
+            self._paused = False
+            self._cond.notify_all()
+        self._notify_linked()
+
+    def stop(self):
+        """
+        중지 요청 - 대기 중인 모든 스레드를 즉시 깨움
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._notify_linked()
+
+    def pause(self):
+        """
+        일시 정지 요청
+        """
+        with self._cond:
+            self._paused = True
+            self._cond.notify_all()
+        self._notify_linked()
+
+    def resume(self):
+        """
+        일시 정지 해제
+        """
+        with self._cond:
+            self._paused = False
+            self._cond.notify_all()
+        self._notify_linked()
+
+    def link(self, condition):
+        """
+        중지/일시 정지/재개 시 condition 에서 기다리는 스레드도 깨우도록 연결
+        """
+        with self._cond:
+            self._linked.append(condition)
+
+    def unlink(self, condition):
+        """
+        link 로 연결한 조건 변수 해제
+        """
+        with self._cond:
+            if condition in self._linked:
+                self._linked.remove(condition)
+
+    def _notify_linked(self):
+        """
+        연결된 조건 변수를 깨움 (자신의 잠금 밖에서 호출해 잠금 순서가 엇갈리지 않게 함)
+        """
+        with self._cond:
+            linked = list(self._linked)
+        for condition in linked:
+            with condition:
+                condition.notify_all()
+
+    @property
+    def stopped(self):
+        return self._stopped
+
+    @property
+    def paused(self):
+        return self._paused
+
+    def acquire_input(self, arbiter, priority):
+        """
+        입력 중재자의 잠금 획득 (중지되면 False)
+
+        잠금을 가진 동안 일시 정지되면 wait_while_paused 가 잠금을 내려놓아
+        다른 엔진이 입력할 수 있게 하고, 재개되면 같은 우선순위로 다시 얻는다.
+        """
+        if not arbiter.acquire(priority, self):
+            return False
+        self._input = (arbiter, priority)
+        return True
+
+    def release_input(self):
+        """
+        acquire_input 으로 얻은 잠금 해제 (일시 정지 중 중지되어 이미 내려놓았으면 무시)
+        """
+        held = self._input
+        self._input = None
+        if held is not None:
+            held[0].release()
+
+    def wait_while_paused(self):
+        """
+        일시 정지 상태인 동안 대기, 중지되지 않았으면 True 반환
+
+        입력 잠금을 가지고 있으면 정지 동안 내려놓았다가 재개 후 다시 얻는다.
+        """
+        held = self._input
+        if held is not None and self._paused:
+            self._input = None
+            held[0].release()
+        with self._cond:
+            while self._paused and not self._stopped:
+                self._cond.wait()
+            if self._stopped:
+                return False
+        if held is not None and self._input is None:
+            return self.acquire_input(*held)
+        return True
+
+    def wait_for_change(self, timeout):
+        """
+        최대 timeout 초 동안 대기하되 상태 변화(중지/일시 정지/재개) 시 즉시 반환
+        """
+        with self._cond:
+            if self._stopped or self._paused:
+                return
+            self._cond.wait(timeout)
+
+    def wait(self, seconds):
+        """
+        실행 시간 기준으로 seconds 초 대기
+
+        일시 정지된 시간은 대기 시간에 포함하지 않으며, 중지되면 즉시
+        False 를 반환한다. 끝까지 대기한 경우 True 를 반환한다.
+        """
+        perf_counter = time.perf_counter
+        end = perf_counter() + seconds
+        while True:
+            with self._cond:
+                while not self._paused:
+                    if self._stopped:
+                        return False
+                    remaining = end - perf_counter()
+                    if remaining <= 0:
+                        return True
+                    self._cond.wait(remaining)
+            # 남은 대기 시간을 보존한 채 재개될 때까지 대기 (입력 잠금은 그동안 내려놓음)
+            remaining = end - perf_counter()
+            if not self.wait_while_paused():
+                return False
+            end = perf_counter() + remaining
+
+
+class DeadlineScheduler:
+    """
+    단조 시계 기반 절대 마감 시각 스케줄러
+
+    각 단계의 마감 시각을 (시작 시각 + 누적 명목 지연 시간)으로 계산하므로
+    동작 실행 시간이 지연 시간에 더해지지 않는다. 대기는 마감 직전까지
+    ExecutionControl 로 잠든 뒤 남은 구간을 spin 으로 채우는 혼합 방식이며,
+    단계마다 실제 시각과 명목 마감 시각의 차이(지각 시간)를 기록한다.
+    """
+    def __init__(self, control=None, spin_threshold=0.002, max_samples=1000000):
+        """
+        control: 중지/일시 정지 제어 객체 (ExecutionControl)
+        spin_threshold: 마감 전 spin 으로 대기할 구간 (초)
+        max_samples: 백분위 계산용으로 보관할 최대 지각 시간 샘플 수
+        """
+        self.control = control or ExecutionControl()
+        self.spin_threshold = spin_threshold
+        self.max_samples = max_samples
+        self.deadline = 0.0
+        self.reset_stats()
+
+    def reset_stats(self):
+        """
+        지각 시간 기록 초기화
+        """
+        self.lateness = array('d')  # 초 단위
+        self.count = 0
+        self.total_lateness = 0.0
+        self.max_lateness = 0.0
+
+    def start(self):
+        """
+        현재 시각을 기준으로 스케줄 시작
+        """
+        self.reset_stats()
+        self.deadline = time.perf_counter()
+
+    def rebase(self):
+        """
+        마감 시각을 현재 시각으로 재설정 (일시 정지 후 재개 시 사용)
+        """
+        self.deadline = time.perf_counter()
+
+    def wait_for(self, seconds):
+        """
+        명목 지연 시간만큼 마감 시각을 전진시킨 뒤 해당 시각까지 대기
+
+        끝까지 대기했으면 True, 중지 요청으로 중단되면 False 를 반환한다.
+        대기 중 일시 정지되면 정지된 시간만큼 마감 시각을 뒤로 민다.
+        """
+        self.deadline += seconds
+        perf_counter = time.perf_counter
+        control = self.control
+        spin_threshold = self.spin_threshold
+
+        # 마감 직전까지는 잠들어서 CPU 를 양보 (상태 변화 시 즉시 깨어남)
+        while True:
+            if control.stopped:
+                return False
+            if control.paused:
+                paused_at = perf_counter()
+                if not control.wait_while_paused():
+                    return False
+                self.deadline += perf_counter() - paused_at
+                continue
+            remaining = self.deadline - perf_counter()
+            if remaining <= spin_threshold:
+                break
+            control.wait_for_change(remaining - spin_threshold)
+
+        # 남은 구간은 spin 으로 정밀 대기
+        deadline = self.deadline
+        now = perf_counter()
+        while now < deadline:
+            if control.stopped:
+                return False
+            now = perf_counter()
+
+        self._record(now - deadline)
+        return True
+
+    def _record(self, lateness):
+        """
+        지각 시간 기록
+        """
+        self.count += 1
+        self.total_lateness += lateness
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        if len(self.lateness) < self.max_samples:
+            self.lateness.append(lateness)
+
+    def get_stats(self):
+        """
+        지각 시간 통계 반환 (밀리초 단위)
+        """
+        if not self.count:
+            return {"count": 0, "mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+
+        samples = sorted(self.lateness)
+        def percentile(p):
+            return samples[min(len(samples) - 1, int(len(samples) * p))] * 1000.0
+
+        return {
+            "count": self.count,
+            "mean_ms": self.total_lateness / self.count * 1000.0,
+            "p50_ms": percentile(0.50),
+            "p99_ms": percentile(0.99),
+            "max_ms": self.max_lateness * 1000.0
+        }
+
+    def log_stats(self):
+        """
+        지각 시간 통계 로깅
+        """
+        stats = self.get_stats()
+        app_logger.info(
+            f"스케줄 정확도: {stats['count']}단계, 평균 지각 {stats['mean_ms']:.3f}ms, "
+            f"p50 {stats['p50_ms']:.3f}ms, p99 {stats['p99_ms']:.3f}ms, 최대 {stats['max_ms']:.3f}ms"
+        )
+        return stats
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/text_input.py
+
+import sys
+from utils.logger import app_logger
+from core.clipboard_utils import read_clipboard, write_clipboard, restore_clipboard
+
+# 텍스트 입력 방식
+INPUT_MODE_AUTO = "auto"     # 길이와 문자 종류에 따라 자동 선택
+INPUT_MODE_TYPE = "type"     # 한 글자씩 타이핑
+INPUT_MODE_PASTE = "paste"   # 클립보드에 넣고 붙여넣기
+INPUT_MODES = (INPUT_MODE_AUTO, INPUT_MODE_TYPE, INPUT_MODE_PASTE)
+INPUT_MODE_NAMES = {
+    INPUT_MODE_AUTO: "자동",
+    INPUT_MODE_TYPE: "타이핑",
+    INPUT_MODE_PASTE: "붙여넣기",
+}
+
+# 자동 모드에서 이 길이를 넘는 텍스트는 붙여넣기로 입력
+PASTE_MIN_LENGTH = 20
+
+# 붙여넣기 후 대상 프로그램이 클립보드를 읽을 때까지 기다린 뒤 원래 내용을 복원 (초)
+PASTE_SETTLE_SECONDS = 0.1
+
+# 타이핑 시 기본 글자 간 간격 (ms, 기존 pyautogui.PAUSE 0.05 초와 같은 속도)
+DEFAULT_KEY_INTERVAL = 50
+
+# 붙여넣기 키 조합
+PASTE_KEYS = ('command', 'v') if sys.platform == 'darwin' else ('ctrl', 'v')
+
+# 타이핑으로 입력할 수 있는 문자 (출력 가능한 ASCII, 줄바꿈, 탭)
+_TYPABLE = frozenset(chr(code) for code in range(0x20, 0x7f)) | {'\n', '\t'}
+
+def is_typable(text):
+    """
+    한 글자씩 타이핑으로 입력할 수 있는 텍스트인지 확인 (한글 등은 타이핑 불가)
+    """
+    return all(char in _TYPABLE for char in text)
+
+def choose_input_mode(text, mode=INPUT_MODE_AUTO):
+    """
+    실제 사용할 입력 방식 결정 (type 또는 paste)
+    """
+    if mode != INPUT_MODE_AUTO:
+        return mode
+    if len(text) > PASTE_MIN_LENGTH or not is_typable(text):
+        return INPUT_MODE_PASTE
+    return INPUT_MODE_TYPE
+
+def make_text_writer(context):
+    """
+    텍스트와 입력 방식을 받아 입력하는 함수 반환
+
+    붙여넣기 방식은 현재 클립보드 내용을 보관한 뒤 텍스트를 클립보드에 넣고
+    붙여넣기 키를 한 번 누르며, 대상 프로그램이 붙여넣을 시간을 기다린 후
+    원래 클립보드 내용을 복원한다. 타이핑 방식은 글자마다 interval 초씩
+    기다린다. 모든 대기는 context.control 을 통해 이루어지므로 중지 요청 시
+    남은 글자를 입력하지 않고 바로 끝난다.
+    """
+    backend = context.backend
+    write = backend.write
+    hotkey = backend.hotkey
+    wait = context.control.wait
+
+    def type_text(text, interval):
+        if interval <= 0:
+            write(text)
+            return
+        # 글자 간 간격 - 너무 빠른 입력으로 인한 중복 문제 해결
+        # (백엔드의 전역 대기 설정을 바꾸지 않고 글자마다 직접 대기)
+        for char in text:
+            write(char)
+            if not wait(interval):
+                return
+
+    def paste_text(text):
+        previous = read_clipboard()
+        write_clipboard(text)
+        hotkey(*PASTE_KEYS)
+        # 붙여넣기가 끝나기 전에 복원하면 이전 내용이 붙여넣어지므로 잠시 대기
+        wait(PASTE_SETTLE_SECONDS)
+        if previous is not None:
+            restore_clipboard(previous)
+
+    def input_text(text, mode=INPUT_MODE_AUTO, interval=DEFAULT_KEY_INTERVAL / 1000.0):
+        if choose_input_mode(text, mode) == INPUT_MODE_PASTE:
+            app_logger.action_debug("붙여넣기로 텍스트 입력 (길이: %d)", len(text))
+            paste_text(text)
+        else:
+            type_text(text, interval)
+
+    return input_text
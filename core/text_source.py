@@ -0,0 +1,136 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/text_source.py
+
+import os
+import mmap
+import weakref
+import threading
+from array import array
+from utils.logger import app_logger
+
+# UTF-8 BOM (메모장 등에서 저장한 파일 앞에 붙음)
+_UTF8_BOM = b'\xef\xbb\xbf'
+
+class TextIndex:
+    """
+    한 시점의 텍스트 파일 내용에 대한 변경되지 않는 색인
+
+    mmap 과 공백이 아닌 줄의 시작/끝 위치 배열을 한 객체로 묶어 두므로
+    읽는 쪽은 이 객체 하나만 잡고 있으면 항상 서로 맞는 값을 사용한다.
+    파일이 바뀌면 새 색인을 만들 뿐 기존 색인은 건드리지 않으며, mmap 은
+    마지막으로 참조하던 쪽(실행 중인 매크로, 편집기 미리보기)이 놓을 때 닫힌다.
+    """
+    __slots__ = ("file_path", "encoding", "stat_key", "_data", "_starts", "_ends", "__weakref__")
+
+    def __init__(self, file_path, encoding, stat_key, data, starts, ends):
+        self.file_path = file_path
+        self.encoding = encoding
+        self.stat_key = stat_key
+        self._data = data
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self):
+        return len(self._starts)
+
+    def __getitem__(self, index):
+        return self._data[self._starts[index]:self._ends[index]].decode(self.encoding, errors='replace').strip()
+
+
+def _file_stat(file_path):
+    stat = os.stat(file_path)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def build_text_index(file_path, encoding='utf-8'):
+    """
+    파일을 mmap 으로 열고 공백이 아닌 줄의 위치 색인 생성 (파일이 없으면 예외 발생)
+    """
+    stat_key = _file_stat(file_path)
+    starts = array('q')
+    ends = array('q')
+
+    # mmap 은 파일 핸들을 따로 복제해 두므로 파일은 바로 닫음
+    with open(file_path, 'rb') as f:
+        data = b''
+        if stat_key[1] > 0:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    size = len(data)
+    pos = len(_UTF8_BOM) if data[:len(_UTF8_BOM)] == _UTF8_BOM else 0
+    find = data.find
+    while pos < size:
+        end = find(b'\n', pos)
+        if end < 0:
+            end = size
+        # 공백만 있는 줄은 건너뜀 (기존 불러오기의 strip 동작과 동일)
+        if end > pos and not data[pos:end].isspace():
+            starts.append(pos)
+            ends.append(end)
+        pos = end + 1
+
+    app_logger.debug(f"텍스트 파일 색인 생성: {file_path} ({len(starts)}줄, {size}바이트)")
+    return TextIndex(file_path, encoding, stat_key, data, starts, ends)
+
+
+class FileTextSource:
+    """
+    텍스트 파일의 각 줄을 항목으로 사용하는 텍스트 원본
+
+    파일 전체를 메모리에 올리지 않고 mmap 으로 연 뒤, 공백이 아닌 줄의
+    시작/끝 위치만 array('q') 색인으로 보관한다. 항목은 요청될 때마다
+    해당 구간만 디코딩하므로 수백만 줄 파일도 메모리 사용량이 색인 크기
+    (줄당 16바이트) 수준으로 유지된다. 기존 파일 불러오기와 같이 각 줄의
+    앞뒤 공백을 제거하고 빈 줄은 건너뛴다.
+
+    open() 이 돌려주는 TextIndex 를 잡고 읽으며, 이 객체는 색인을 약한
+    참조로만 기억한다. 누군가 사용 중인 동안은 같은 색인을 나눠 쓰고,
+    모두 놓으면 mmap 이 닫혀 다른 프로그램이 파일을 덮어쓸 수 있다.
+    """
+    def __init__(self, file_path, encoding='utf-8'):
+        self.file_path = file_path
+        self.encoding = encoding
+        self._lock = threading.Lock()
+        self._index_ref = None
+        self._count = None        # (파일 상태, 항목 수) - 색인 없이 항목 수만 물을 때 사용
+
+    def open(self):
+        """
+        현재 파일 내용의 색인 반환 (파일이 바뀌었으면 새로 만듦)
+        """
+        with self._lock:
+            stat_key = _file_stat(self.file_path)
+            index = self._index_ref() if self._index_ref is not None else None
+            if index is not None and index.stat_key == stat_key:
+                return index
+            if index is not None:
+                app_logger.info(f"텍스트 파일 변경 감지, 색인 재생성: {self.file_path}")
+            index = build_text_index(self.file_path, self.encoding)
+            self._index_ref = weakref.ref(index)
+            self._count = (index.stat_key, len(index))
+            return index
+
+    def __len__(self):
+        count = self._count
+        if count is not None and count[0] == _file_stat(self.file_path):
+            return count[1]
+        return len(self.open())
+
+    def __getitem__(self, index):
+        return self.open()[index]
+
+
+_sources = {}
+_sources_lock = threading.Lock()
+
+def open_text_source(file_path):
+    """
+    경로별 공용 FileTextSource 반환 (편집기와 엔진이 같은 색인을 공유)
+    """
+    path = os.path.abspath(file_path)
+    with _sources_lock:
+        source = _sources.get(path)
+        if source is None:
+            source = FileTextSource(path)
+            _sources[path] = source
+        return source
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# core/trace.py
+
+import io
+import os
+import re
+import csv
+import json
+import time
+import struct
+from datetime import datetime
+from utils.logger import app_logger
+
+# 실행 기록 파일 확장자
+TRACE_EXTENSION = ".mtrace"
+
+# 메모리에 보관하는 최근 실행 기록 수 (레코드당 21바이트, 10만 개 약 2MB)
+DEFAULT_TRACE_CAPACITY = 100000
+
+# 로그 디렉토리에 자동으로 남기는 실행 기록 파일 최대 개수 (오래된 것부터 삭제)
+MAX_TRACE_FILES = 20
+
+TRACE_MAGIC = b"MTRC"
+TRACE_VERSION = 1
+
+# 파일 헤더: 매직, 형식 버전, 레코드 크기, 레코드 수, 전체 기록 수, 메타데이터 길이, 시작 시각
+_HEADER = struct.Struct("<4sHHIQId")
+# 레코드: 시작 후 경과 시간(초), 동작 인덱스, 반복 번호, 결과, 소요 시간(초)
+_RECORD = struct.Struct("<dIIBf")
+RECORD_SIZE = _RECORD.size
+
+# 동작 결과
+RESULT_OK = 0
+RESULT_FAILED = 1
+RESULT_ERROR = 2
+RESULT_WAIT = 3
+
+RESULT_NAMES = {
+    RESULT_OK: "ok",
+    RESULT_FAILED: "failed",
+    RESULT_ERROR: "error",
+    RESULT_WAIT: "wait",
+}
+
+# 자동 저장 파일 이름 (trace_<시각>_<이유>.mtrace)
+_TRACE_FILE_PATTERN = re.compile(r"^trace_\d{8}_\d{6}_\w+\.mtrace$")
+
+
+class TraceFormatError(ValueError):
+    """
+    실행 기록 파일 형식 오류
+    """
+    pass
+
+
+class ExecutionTrace:
+    """
+    최근 실행 단계를 고정 크기 메모리 링 버퍼에 기록하는 실행 기록기
+
+    미리 할당한 bytearray 에 단계마다 고정 길이 레코드 하나를 덮어쓰므로
+    실행 중에는 객체를 만들지 않고 메모리도 늘지 않는다. 텍스트 로그를
+    끈 상태에서도 항상 켜 둘 수 있으며, 실행이 중지되거나 오류가 나면
+    최근 capacity 개의 기록을 파일로 저장해 사후 분석에 사용한다.
+    기록은 실행 스레드만 한다. 실행 중에 dump 하면 가장 오래된 레코드
+    하나가 최신 레코드로 바뀌어 있을 수 있다.
+    """
+    def __init__(self, capacity=DEFAULT_TRACE_CAPACITY):
+        self.capacity = max(1, int(capacity))
+        self._buffer = bytearray(self.capacity * RECORD_SIZE)
+        self._pack_into = _RECORD.pack_into
+        self._position = 0
+        self.total = 0            # 시작 후 기록한 전체 레코드 수 (버퍼 크기를 넘을 수 있음)
+        self.actions = []         # 동작 인덱스가 가리키는 실행 동작 목록 (저장 시 이름 기록)
+        self.loop_count = 0
+        self.started_at = time.perf_counter()
+        self.started_wall = time.time()
+
+    def set_capacity(self, capacity):
+        """
+        보관할 기록 수 변경 (기존 기록은 버림)
+        """
+        self.capacity = max(1, int(capacity))
+        self._buffer = bytearray(self.capacity * RECORD_SIZE)
+        self._position = 0
+        self.total = 0
+
+    def start(self, actions, loop_count):
+        """
+        실행 시작 시 초기화 (버퍼는 다시 할당하지 않음)
+        """
+        self.actions = actions
+        self.loop_count = loop_count
+        self._position = 0
+        self.total = 0
+        self.started_at = time.perf_counter()
+        self.started_wall = time.time()
+
+    def record(self, index, loop, result, started, duration):
+        """
+        단계 1회 실행 기록 (started 는 perf_counter 값, duration 은 초)
+        """
+        position = self._position
+        self._pack_into(self._buffer, position * RECORD_SIZE, started - self.started_at,
+                        index, loop, result, duration)
+        position += 1
+        self._position = position if position < self.capacity else 0
+        self.total += 1
+
+    def snapshot(self):
+        """
+        기록을 오래된 순서로 정렬한 바이트열과 레코드 수 반환
+        """
+        position = self._position
+        total = self.total
+        data = bytes(self._buffer)
+        if total <= self.capacity:
+            count = total
+            return data[:count * RECORD_SIZE], count
+        split = position * RECORD_SIZE
+        return data[split:] + data[:split], self.capacity
+
+    def dump(self, file_path, reason="manual"):
+        """
+        현재 기록을 파일로 저장 (성공하면 True)
+        """
+        try:
+            records, count = self.snapshot()
+            meta = {
+                "reason": reason,
+                "capacity": self.capacity,
+                "loop_count": self.loop_count,
+                "saved_at": datetime.now().isoformat(timespec="seconds"),
+                "actions": [action.name for action in self.actions],
+            }
+            meta_data = json.dumps(meta, ensure_ascii=False).encode("utf-8")
+
+            dir_path = os.path.dirname(file_path)
+            if dir_path and not os.path.exists(dir_path):
+                os.makedirs(dir_path)
+            temp_path = file_path + ".tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION, RECORD_SIZE, count, self.total,
+                                     len(meta_data), self.started_wall))
+                f.write(meta_data)
+                f.write(records)
+            os.replace(temp_path, file_path)
+            app_logger.info(f"실행 기록 저장 완료: {file_path} ({count}개, 이유: {reason})")
+            return True
+        except Exception as e:
+            app_logger.error(f"실행 기록 저장 중 오류 발생: {file_path} - {str(e)}", exc_info=True)
+            return False
+
+    def dump_to_dir(self, directory, reason="manual"):
+        """
+        디렉토리에 trace_<시각>_<이유>.mtrace 로 저장하고 오래된 자동 저장 파일 정리
+
+        저장한 파일 경로 반환 (실패하면 None)
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        file_path = os.path.join(directory, f"trace_{timestamp}_{reason}{TRACE_EXTENSION}")
+        if not self.dump(file_path, reason):
+            return None
+        _prune_trace_files(directory, MAX_TRACE_FILES)
+        return file_path
+
+
+def _prune_trace_files(directory, keep):
+    """
+    자동 저장된 실행 기록 파일을 최근 keep 개만 남기고 삭제
+    """
+    try:
+        names = sorted(name for name in os.listdir(directory) if _TRACE_FILE_PATTERN.match(name))
+        for name in names[:-keep]:
+            os.remove(os.path.join(directory, name))
+            app_logger.debug(f"오래된 실행 기록 삭제: {name}")
+    except OSError as e:
+        app_logger.warning(f"실행 기록 정리 실패: {directory} - {str(e)}")
+
+
+def read_trace(file_path):
+    """
+    실행 기록 파일 읽기
+
+    (메타데이터 딕셔너리, 레코드 튜플 목록) 반환. 레코드는 오래된 순서이며
+    (시작 후 경과 시간, 동작 인덱스, 반복 번호, 결과, 소요 시간) 형태이다.
+    메타데이터에는 저장 시 넣은 값 외에 started_wall, total 이 추가된다.
+    """
+    with open(file_path, 'rb') as f:
+        raw = f.read(_HEADER.size)
+        if len(raw) != _HEADER.size:
+            raise TraceFormatError(f"실행 기록 헤더가 잘렸습니다: {file_path}")
+        magic, version, record_size, count, total, meta_length, started_wall = _HEADER.unpack(raw)
+        if magic != TRACE_MAGIC:
+            raise TraceFormatError(f"실행 기록 파일이 아닙니다: {file_path}")
+        if version != TRACE_VERSION or record_size != RECORD_SIZE:
+            raise TraceFormatError(f"지원하지 않는 실행 기록 버전: {version}")
+
+        try:
+            meta = json.loads(f.read(meta_length).decode("utf-8"))
+        except ValueError as e:
+            raise TraceFormatError(f"실행 기록 메타데이터가 손상되었습니다: {str(e)}")
+
+        data = f.read(count * RECORD_SIZE)
+        if len(data) != count * RECORD_SIZE:
+            # 저장 도중 잘린 파일은 남은 완전한 레코드만 사용
+            app_logger.warning(f"실행 기록 파일이 잘려 일부만 읽음: {file_path}")
+            data = data[:len(data) // RECORD_SIZE * RECORD_SIZE]
+
+    meta["started_wall"] = started_wall
+    meta["total"] = total
+    return meta, list(_RECORD.iter_unpack(data))
+
+
+def _record_row(meta, record):
+    """
+    레코드 하나를 표시용 값 딕셔너리로 변환
+    """
+    offset, index, loop, result, duration = record
+    actions = meta.get("actions", [])
+    return {
+        "time": datetime.fromtimestamp(meta["started_wall"] + offset).strftime("%H:%M:%S.%f")[:-3],
+        "offset_s": round(offset, 6),
+        "loop": loop,
+        "index": index,
+        "name": actions[index] if index < len(actions) else "",
+        "result": RESULT_NAMES.get(result, str(result)),
+        "duration_ms": round(duration * 1000.0, 3),
+    }
+
+
+def trace_to_csv(meta, records):
+    """
+    실행 기록을 CSV 문자열로 변환
+    """
+    fields = ("time", "offset_s", "loop", "index", "name", "result", "duration_ms")
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow(_record_row(meta, record))
+    return output.getvalue()
+
+
+def trace_to_text(meta, records, last=None):
+    """
+    실행 기록 요약과 최근 last 개 레코드를 텍스트로 변환 (None 이면 전체)
+    """
+    started = datetime.fromtimestamp(meta["started_wall"]).strftime("%Y-%m-%d %H:%M:%S")
+    counts = {}
+    for record in records:
+        counts[record[3]] = counts.get(record[3], 0) + 1
+    summary = ", ".join(f"{RESULT_NAMES.get(result, result)} {count}"
+                        for result, count in sorted(counts.items()))
+
+    lines = [
+        f"실행 시작: {started} · 저장 이유: {meta.get('reason', '')} · 저장 시각: {meta.get('saved_at', '')}",
+        f"기록 {len(records)}개 (전체 {meta['total']}개 중 최근 기록) · {summary or '기록 없음'}",
+        "",
+        f"{'시각':<12} {'반복':>6} {'인덱스':>6}  {'결과':<7} {'소요(ms)':>10}  동작",
+    ]
+    shown = records if last is None else records[-last:] if last > 0 else []
+    for record in shown:
+        row = _record_row(meta, record)
+        lines.append(f"{row['time']:<12} {row['loop']:>6} {row['index']:>6}  {row['result']:<7} "
+                     f"{row['duration_ms']:>10.3f}  {row['name']}")
+    return "\n".join(lines)
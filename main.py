@@ -28,6 +28,8 @@ def main():
     애플리케이션의 메인 진입점
     """
     try:
+        # 로그 파일 생성 (기본 위치, MACRO_LOG_DIR 환경 변수로 변경 가능)
+        app_logger.configure()
         app_logger.info("애플리케이션 초기화 중...")
         
         app = QApplication(sys.argv)
@@ -16,9 +16,10 @@ a = Analysis(
     ],
     hiddenimports=[
         'PyQt5.sip', 
-        'ui.main_window', 'ui.action_editor', 
+        'ui.main_window', 'ui.action_editor', 'ui.profile_dialog', 'ui.text_source_model', 'ui.action_list_model',
         'core.actions', 'core.clipboard_manager', 'core.folder_monitor', 'core.macro_engine',
-        'utils.config', 'utils.logger',
+        'core.plan', 'core.scheduler', 'core.input_backend', 'core.profiler', 'core.clipboard_utils', 'core.input_arbiter', 'core.macro_cache', 'core.text_input', 'core.text_source', 'core.checkpoint', 'core.optimizer', 'core.macro_format', 'core.edit_journal', 'core.progress', 'core.trace',
+        'utils.config', 'utils.logger', 'utils.log_storage',
         'platform', 'pynput', 'pyperclip', 'pyautogui', 'logging', 'json',
         'watchdog', 'watchdog.observers', 'watchdog.observers.api', 
         'watchdog.observers.polling', 'watchdog.observers.read_directory_changes',
@@ -22,6 +22,7 @@ setup(
     entry_points={
         "console_scripts": [
             "macro-app=main:main",
+            "macro-run=cli:main",
         ],
     },
     options={
@@ -8,7 +8,7 @@ from PyQt5.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, QL
                             QComboBox, QLineEdit, QPushButton, QSpinBox,
                             QDialogButtonBox, QTabWidget, QWidget, QFileDialog,
                             QListWidget, QListWidgetItem, QGridLayout, QTextEdit,
-                            QCheckBox, QInputDialog, QMessageBox)
+                            QCheckBox, QInputDialog, QMessageBox, QStackedWidget, QListView)
 from PyQt5.QtCore import Qt, pyqtSlot, QTimer, QPoint
 from PyQt5.QtGui import QCursor
 
@@ -16,17 +16,40 @@ from core.actions import (MacroAction,
                         MouseClickAction, MouseMoveAction, MouseDragDropAction, MouseScrollAction,
                         KeyboardInputAction, KeyCombinationAction,                          
                         TextListInputAction, DelayAction,
-                        ClipboardSaveAction, FolderMonitorAction)
+                        ClipboardSaveAction, FolderMonitorAction,
+                        FlowAction, LabelAction, JumpAction, RepeatStartAction, RepeatEndAction,
+                        IfAction, ElseAction, EndIfAction, CallMacroAction)
+from core.text_input import INPUT_MODES, INPUT_MODE_NAMES, DEFAULT_KEY_INTERVAL
+from core.text_source import open_text_source
+from core.macro_format import MACRO_OPEN_FILTER
+from core.plan import resolve_macro_path
+from ui.text_source_model import TextSourceModel
 from utils.logger import app_logger
 
 class ActionEditorDialog(QDialog):
-    def __init__(self, parent=None, action=None):
+    # 텍스트 리스트 원본 (직접 입력 / 파일 참조)
+    TEXT_SOURCE_INLINE = 0
+    TEXT_SOURCE_FILE = 1
+    
+    # 파일에서 불러올 때 이 줄 수를 넘으면 파일 참조 사용을 권장
+    LARGE_TEXT_FILE_LINES = 10000
+    
+    # 흐름 제어 탭의 종류 콤보박스 순서와 동작 클래스
+    FLOW_TYPE_NAMES = ["라벨", "라벨로 이동", "반복 시작", "반복 끝", "조건 시작", "조건 아니면", "조건 끝"]
+    FLOW_TYPE_CLASSES = [LabelAction, JumpAction, RepeatStartAction, RepeatEndAction,
+                         IfAction, ElseAction, EndIfAction]
+    
+    def __init__(self, parent=None, action=None, macro_path=None):
+        """
+        macro_path: 편집 중인 매크로 파일 (하위 매크로 상대 경로 확인 기준)
+        """
         super().__init__(parent)
         
         self.setWindowTitle("매크로 동작 편집")
         self.setMinimumSize(500, 400)
         
         self.current_action = action
+        self.macro_path = macro_path
         self.capture_mode = False
         self.capture_timer = QTimer()
         self.capture_timer.timeout.connect(self.update_cursor_position)
@@ -61,7 +84,9 @@ class ActionEditorDialog(QDialog):
             "텍스트 리스트 입력",
             "지연 시간",
             "클립보드 저장",
-            "폴더 모니터링"
+            "폴더 모니터링",
+            "흐름 제어",
+            "하위 매크로 호출"
         ])
         
         type_layout.addWidget(self.action_type_combo)
@@ -191,6 +216,16 @@ class ActionEditorDialog(QDialog):
         self.keyboard_text = QTextEdit()
         keyboard_layout.addWidget(self.keyboard_text)
         
+        keyboard_mode_layout = QHBoxLayout()
+        keyboard_mode_layout.addWidget(QLabel("입력 방식:"))
+        self.keyboard_mode_combo = self.create_input_mode_combo()
+        keyboard_mode_layout.addWidget(self.keyboard_mode_combo)
+        keyboard_mode_layout.addWidget(QLabel("글자 간격 (ms):"))
+        self.keyboard_interval_spin = self.create_key_interval_spin()
+        keyboard_mode_layout.addWidget(self.keyboard_interval_spin)
+        keyboard_layout.addLayout(keyboard_mode_layout)
+        keyboard_layout.addWidget(QLabel("자동: 20자를 넘거나 한글 등이 포함된 텍스트는 붙여넣기로 입력합니다."))
+        
         # 6. 키 조합 입력 탭
         self.key_combo_tab = QWidget()
         key_combo_layout = QVBoxLayout(self.key_combo_tab)
@@ -242,9 +277,22 @@ class ActionEditorDialog(QDialog):
         self.text_list_tab = QWidget()
         text_list_layout = QVBoxLayout(self.text_list_tab)
         
-        text_list_layout.addWidget(QLabel("텍스트 리스트:"))
+        text_source_layout = QHBoxLayout()
+        text_source_layout.addWidget(QLabel("텍스트 원본:"))
+        self.text_source_combo = QComboBox()
+        self.text_source_combo.addItems(["직접 입력", "파일 참조 (대용량)"])
+        text_source_layout.addWidget(self.text_source_combo)
+        text_list_layout.addLayout(text_source_layout)
+        
+        self.text_source_stack = QStackedWidget()
+        
+        # 직접 입력: 항목을 매크로 파일에 함께 저장
+        inline_page = QWidget()
+        inline_layout = QVBoxLayout(inline_page)
+        inline_layout.setContentsMargins(0, 0, 0, 0)
+        inline_layout.addWidget(QLabel("텍스트 리스트:"))
         self.text_list_widget = QListWidget()
-        text_list_layout.addWidget(self.text_list_widget)
+        inline_layout.addWidget(self.text_list_widget)
         
         text_list_buttons = QHBoxLayout()
         self.add_text_btn = QPushButton("추가")
@@ -255,7 +303,43 @@ class ActionEditorDialog(QDialog):
         text_list_buttons.addWidget(self.remove_text_btn)
         text_list_buttons.addWidget(self.load_from_file_btn)
         
-        text_list_layout.addLayout(text_list_buttons)
+        inline_layout.addLayout(text_list_buttons)
+        self.text_source_stack.addWidget(inline_page)
+        
+        # 파일 참조: 경로만 저장하고 실행 시 한 줄씩 읽음 (미리보기는 보이는 줄만 읽음)
+        file_page = QWidget()
+        file_layout = QVBoxLayout(file_page)
+        file_layout.setContentsMargins(0, 0, 0, 0)
+        text_file_layout = QHBoxLayout()
+        text_file_layout.addWidget(QLabel("텍스트 파일:"))
+        self.text_file_edit = QLineEdit()
+        self.text_file_edit.setReadOnly(True)
+        text_file_layout.addWidget(self.text_file_edit)
+        self.browse_text_file_btn = QPushButton("찾아보기")
+        self.browse_text_file_btn.clicked.connect(self.browse_text_file)
+        text_file_layout.addWidget(self.browse_text_file_btn)
+        file_layout.addLayout(text_file_layout)
+        
+        self.text_file_model = TextSourceModel(self)
+        self.text_file_view = QListView()
+        self.text_file_view.setUniformItemSizes(True)
+        self.text_file_view.setModel(self.text_file_model)
+        file_layout.addWidget(self.text_file_view)
+        self.text_file_count_label = QLabel("항목 수: 0")
+        file_layout.addWidget(self.text_file_count_label)
+        self.text_source_stack.addWidget(file_page)
+        
+        text_list_layout.addWidget(self.text_source_stack)
+        self.text_source_combo.currentIndexChanged.connect(self.text_source_stack.setCurrentIndex)
+        
+        text_list_mode_layout = QHBoxLayout()
+        text_list_mode_layout.addWidget(QLabel("입력 방식:"))
+        self.text_list_mode_combo = self.create_input_mode_combo()
+        text_list_mode_layout.addWidget(self.text_list_mode_combo)
+        text_list_mode_layout.addWidget(QLabel("글자 간격 (ms):"))
+        self.text_list_interval_spin = self.create_key_interval_spin()
+        text_list_mode_layout.addWidget(self.text_list_interval_spin)
+        text_list_layout.addLayout(text_list_mode_layout)
 
         # 8. 지연 동작 탭
         self.delay_tab = QWidget()
@@ -300,6 +384,61 @@ class ActionEditorDialog(QDialog):
 
         folder_layout.addWidget(QLabel("새 폴더가 없을 경우, clipboard_YYYYMMDD_HHMMSS.txt로 저장됩니다."))
         folder_layout.addStretch()
+        
+        # 11. 흐름 제어 탭
+        self.flow_tab = QWidget()
+        flow_layout = QVBoxLayout(self.flow_tab)
+        
+        flow_grid = QGridLayout()
+        flow_grid.addWidget(QLabel("흐름 제어 종류:"), 0, 0)
+        self.flow_type_combo = QComboBox()
+        self.flow_type_combo.addItems(self.FLOW_TYPE_NAMES)
+        flow_grid.addWidget(self.flow_type_combo, 0, 1)
+        
+        flow_grid.addWidget(QLabel("라벨 이름:"), 1, 0)
+        self.flow_label_edit = QLineEdit()
+        flow_grid.addWidget(self.flow_label_edit, 1, 1)
+        
+        flow_grid.addWidget(QLabel("반복 횟수 (0: 무한):"), 2, 0)
+        self.flow_count_spin = QSpinBox()
+        self.flow_count_spin.setRange(0, 999999)
+        self.flow_count_spin.setValue(2)
+        flow_grid.addWidget(self.flow_count_spin, 2, 1)
+        
+        flow_grid.addWidget(QLabel("조건:"), 3, 0)
+        self.flow_condition_combo = QComboBox()
+        for condition in IfAction.CONDITIONS:
+            self.flow_condition_combo.addItem(IfAction.CONDITION_NAMES[condition], condition)
+        flow_grid.addWidget(self.flow_condition_combo, 3, 1)
+        
+        flow_grid.addWidget(QLabel("조건 값 (텍스트 / 경로):"), 4, 0)
+        self.flow_value_edit = QLineEdit()
+        flow_grid.addWidget(self.flow_value_edit, 4, 1)
+        
+        self.flow_negate_check = QCheckBox("조건 반대로 사용 (아니면 실행)")
+        flow_grid.addWidget(self.flow_negate_check, 5, 0, 1, 2)
+        
+        flow_layout.addLayout(flow_grid)
+        flow_layout.addWidget(QLabel("반복 시작/끝, 조건 시작/아니면/끝은 짝이 맞아야 하며 블록끼리 겹칠 수 없습니다."))
+        flow_layout.addStretch()
+        
+        self.flow_type_combo.currentIndexChanged.connect(self.on_flow_type_changed)
+        self.on_flow_type_changed(0)
+        
+        # 12. 하위 매크로 호출 탭
+        self.call_macro_tab = QWidget()
+        call_macro_layout = QVBoxLayout(self.call_macro_tab)
+        
+        call_macro_layout.addWidget(QLabel("호출할 매크로 파일:"))
+        self.call_macro_file_edit = QLineEdit()
+        call_macro_layout.addWidget(self.call_macro_file_edit)
+        
+        call_macro_browse_btn = QPushButton("파일 선택...")
+        call_macro_browse_btn.clicked.connect(self.browse_call_macro_file)
+        call_macro_layout.addWidget(call_macro_browse_btn)
+        
+        call_macro_layout.addWidget(QLabel("호출한 매크로의 동작을 현재 위치에서 한 번 실행합니다 (동작 간 지연은 호출한 파일의 설정 사용)."))
+        call_macro_layout.addStretch()
 
         # 탭 위젯 이름 설정    
         self.tab_widget.addTab(self.mouse_move_tab, "마우스 이동")
@@ -312,6 +451,8 @@ class ActionEditorDialog(QDialog):
         self.tab_widget.addTab(self.delay_tab, "지연 시간")
         self.tab_widget.addTab(self.clipboard_tab, "클립보드 저장")
         self.tab_widget.addTab(self.folder_tab, "폴더 모니터링")
+        self.tab_widget.addTab(self.flow_tab, "흐름 제어")
+        self.tab_widget.addTab(self.call_macro_tab, "하위 매크로 호출")
 
         main_layout.addWidget(self.tab_widget)
 
@@ -323,6 +464,19 @@ class ActionEditorDialog(QDialog):
         
         main_layout.addLayout(name_layout)
         
+        # 동작별 실행 전/후 대기 시간
+        timing_layout = QHBoxLayout()
+        timing_layout.addWidget(QLabel("실행 전 대기 (ms):"))
+        self.pre_delay_spin = QSpinBox()
+        self.pre_delay_spin.setRange(0, 3600000)
+        timing_layout.addWidget(self.pre_delay_spin)
+        timing_layout.addWidget(QLabel("실행 후 대기 (ms):"))
+        self.post_delay_spin = QSpinBox()
+        self.post_delay_spin.setRange(0, 3600000)
+        timing_layout.addWidget(self.post_delay_spin)
+        
+        main_layout.addLayout(timing_layout)
+        
         # 확인/취소 버튼
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
         button_box.accepted.connect(self.accept)
@@ -377,6 +531,43 @@ class ActionEditorDialog(QDialog):
         self.action_type_combo.blockSignals(False)
 
     
+    def create_input_mode_combo(self):
+        """
+        텍스트 입력 방식 선택 콤보박스 생성
+        """
+        combo = QComboBox()
+        for mode in INPUT_MODES:
+            combo.addItem(INPUT_MODE_NAMES[mode], mode)
+        return combo
+    
+    def create_key_interval_spin(self):
+        """
+        타이핑 글자 간격 입력 상자 생성
+        """
+        spin = QSpinBox()
+        spin.setRange(0, 10000)
+        spin.setValue(DEFAULT_KEY_INTERVAL)
+        return spin
+    
+    def set_input_mode(self, combo, mode):
+        """
+        입력 방식 콤보박스 선택 (알 수 없는 값이면 자동)
+        """
+        index = combo.findData(mode)
+        combo.setCurrentIndex(index if index >= 0 else 0)
+    
+    def on_flow_type_changed(self, index):
+        """
+        흐름 제어 종류 변경 시 해당 종류에 필요한 입력 항목만 활성화
+        """
+        action_class = self.FLOW_TYPE_CLASSES[index]
+        self.flow_label_edit.setEnabled(action_class in (LabelAction, JumpAction))
+        self.flow_count_spin.setEnabled(action_class is RepeatStartAction)
+        is_if = action_class is IfAction
+        self.flow_condition_combo.setEnabled(is_if)
+        self.flow_value_edit.setEnabled(is_if)
+        self.flow_negate_check.setEnabled(is_if)
+    
     def start_capture_mode(self, mode):
         """
         마우스 위치 캡처 모드 시작
@@ -463,29 +654,60 @@ class ActionEditorDialog(QDialog):
         if file_path:
             app_logger.info(f"텍스트 파일 선택: {file_path}")
             try:
-                # 먼저 기존 리스트 초기화
-                self.text_list_widget.clear()
+                # 줄 수가 많으면 항목을 복사하지 않고 파일을 참조하도록 권장
+                source = open_text_source(file_path).open()
+                count = len(source)
+                if count > self.LARGE_TEXT_FILE_LINES:
+                    reply = QMessageBox.question(
+                        self, "대용량 텍스트 파일",
+                        f"{count}개 항목이 있습니다. 매크로 파일에 복사하지 않고 파일을 참조할까요?",
+                        QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+                    if reply == QMessageBox.Yes:
+                        self.set_text_file(file_path)
+                        return
                 
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    count = 0
-                    for line in lines:
-                        line = line.strip()
-                        if line:
-                            self.text_list_widget.addItem(line)
-                            count += 1
+                # 먼저 기존 리스트 초기화 후 한 번에 추가
+                self.text_list_widget.clear()
+                self.text_list_widget.addItems([source[i] for i in range(count)])
                 app_logger.info(f"텍스트 파일에서 {count}개 항목 로드 완료")
             except Exception as e:
                 error_msg = f"파일을 불러오는 중 오류가 발생했습니다: {str(e)}"
                 app_logger.error(error_msg)
                 QMessageBox.warning(self, "오류", error_msg)
 
+    def browse_text_file(self):
+        """
+        참조할 텍스트 파일 선택
+        """
+        file_path, _ = QFileDialog.getOpenFileName(self, "텍스트 파일 선택", "", "텍스트 파일 (*.txt);;모든 파일 (*.*)")
+        if file_path:
+            app_logger.info(f"참조할 텍스트 파일 선택: {file_path}")
+            self.set_text_file(file_path)
+    
+    def set_text_file(self, file_path):
+        """
+        파일 참조 원본으로 전환하고 미리보기 갱신
+        """
+        self.text_source_combo.setCurrentIndex(self.TEXT_SOURCE_FILE)
+        self.text_file_edit.setText(file_path)
+        try:
+            # 미리보기는 색인을 잡고 있으므로 편집기를 닫으면 파일도 닫힘
+            self.text_file_model.set_source(open_text_source(file_path).open())
+            self.text_file_count_label.setText(f"항목 수: {self.text_file_model.rowCount()}")
+        except Exception as e:
+            error_msg = f"텍스트 파일을 읽는 중 오류가 발생했습니다: {str(e)}"
+            app_logger.error(error_msg)
+            self.text_file_count_label.setText("항목 수: 0")
+            QMessageBox.warning(self, "오류", error_msg)
+
     def _load_action_data(self, action):
         """
         기존 동작 데이터 로드
         """
         app_logger.debug(f"기존 동작 데이터 로드: {action.name}")
         self.action_name_edit.setText(action.name)
+        self.pre_delay_spin.setValue(action.pre_delay)
+        self.post_delay_spin.setValue(action.post_delay)
         
         # 액션 유형에 따라 적절한 탭 선택 및 값 설정
         if isinstance(action, MouseMoveAction):
@@ -526,6 +748,8 @@ class ActionEditorDialog(QDialog):
             self.action_type_combo.setCurrentIndex(4)
             self.tab_widget.setCurrentIndex(4)
             self.keyboard_text.setText(action.text)
+            self.set_input_mode(self.keyboard_mode_combo, action.input_mode)
+            self.keyboard_interval_spin.setValue(action.key_interval)
 
         elif isinstance(action, KeyCombinationAction):
             app_logger.debug(f"키 조합 동작 로드: {action.key_combination}")
@@ -539,8 +763,11 @@ class ActionEditorDialog(QDialog):
             self.tab_widget.setCurrentIndex(6)
             # 기존 항목 제거 후 새로 추가
             self.text_list_widget.clear()
-            for text in action.text_list:
-                self.text_list_widget.addItem(text)
+            self.text_list_widget.addItems(action.text_list)
+            if action.text_file:
+                self.set_text_file(action.text_file)
+            self.set_input_mode(self.text_list_mode_combo, action.input_mode)
+            self.text_list_interval_spin.setValue(action.key_interval)
         
         # 아래 코드 추가: 지연 시간 동작 처리
         elif isinstance(action, DelayAction):
@@ -563,11 +790,44 @@ class ActionEditorDialog(QDialog):
             self.tab_widget.setCurrentIndex(9)
             self.folder_path_edit.setText(action.folder_path)
             self.folder_filename_edit.setText(action.filename_template)
+        
+        # 흐름 제어 동작 처리
+        elif isinstance(action, FlowAction):
+            app_logger.debug(f"흐름 제어 동작 로드: {action.get_description()}")
+            self.action_type_combo.setCurrentIndex(10)
+            self.tab_widget.setCurrentIndex(10)
+            self.flow_type_combo.setCurrentIndex(self.FLOW_TYPE_CLASSES.index(type(action)))
+            if isinstance(action, (LabelAction, JumpAction)):
+                self.flow_label_edit.setText(action.label)
+            elif isinstance(action, RepeatStartAction):
+                self.flow_count_spin.setValue(action.count)
+            elif isinstance(action, IfAction):
+                condition_index = self.flow_condition_combo.findData(action.condition)
+                self.flow_condition_combo.setCurrentIndex(max(0, condition_index))
+                self.flow_value_edit.setText(action.value)
+                self.flow_negate_check.setChecked(action.negate)
+        
+        # 하위 매크로 호출 동작 처리
+        elif isinstance(action, CallMacroAction):
+            app_logger.debug(f"하위 매크로 호출 동작 로드: {action.file_path}")
+            self.action_type_combo.setCurrentIndex(11)
+            self.tab_widget.setCurrentIndex(11)
+            self.call_macro_file_edit.setText(action.file_path)
 
     def get_action(self):
         """
         현재 설정된 동작 객체 반환
         """
+        action = self._create_action()
+        if action is not None:
+            action.pre_delay = self.pre_delay_spin.value()
+            action.post_delay = self.post_delay_spin.value()
+        return action
+    
+    def _create_action(self):
+        """
+        동작 유형별 객체 생성 (공통 항목은 get_action 에서 설정)
+        """
         action_type = self.action_type_combo.currentIndex()
         tab_index = self.tab_widget.currentIndex()
 
@@ -639,7 +899,9 @@ class ActionEditorDialog(QDialog):
                 app_logger.debug(f"키보드 입력 동작 생성: 텍스트 길이: {len(text)}")
                 return KeyboardInputAction(
                     name=name,
-                    text=text
+                    text=text,
+                    input_mode=self.keyboard_mode_combo.currentData(),
+                    key_interval=self.keyboard_interval_spin.value()
                 )
             
             elif action_type == 5:  # 키 조합 입력
@@ -652,13 +914,21 @@ class ActionEditorDialog(QDialog):
             
             elif action_type == 6:  # 텍스트 리스트 입력
                 text_list = []
-                for i in range(self.text_list_widget.count()):
-                    text_list.append(self.text_list_widget.item(i).text())
+                text_file = ""
+                if self.text_source_combo.currentIndex() == self.TEXT_SOURCE_FILE:
+                    text_file = self.text_file_edit.text()
+                    app_logger.debug(f"텍스트 리스트 동작 생성: 파일 참조 {text_file}")
+                else:
+                    for i in range(self.text_list_widget.count()):
+                        text_list.append(self.text_list_widget.item(i).text())
+                    app_logger.debug(f"텍스트 리스트 동작 생성: {len(text_list)}개 항목")
                 
-                app_logger.debug(f"텍스트 리스트 동작 생성: {len(text_list)}개 항목")
                 return TextListInputAction(
                     name=name,
-                    text_list=text_list
+                    text_list=text_list,
+                    text_file=text_file,
+                    input_mode=self.text_list_mode_combo.currentData(),
+                    key_interval=self.text_list_interval_spin.value()
                 )
             
             elif action_type == 7:  # 지연 시간
@@ -681,12 +951,38 @@ class ActionEditorDialog(QDialog):
                 folder_path = self.folder_path_edit.text()
                 filename = self.folder_filename_edit.text()
                 app_logger.debug(f"폴더 모니터링 동작 생성: {folder_path}, 파일명: {filename}")
-                action = FolderMonitorAction(
+                return FolderMonitorAction(
+                    name=name,
+                    folder_path=folder_path,
+                    filename_template=filename
+                )
+            
+            elif action_type == 10:  # 흐름 제어
+                action_class = self.FLOW_TYPE_CLASSES[self.flow_type_combo.currentIndex()]
+                # 이름을 입력하지 않았으면 흐름 제어 종류 이름 사용
+                if not self.action_name_edit.text():
+                    name = self.flow_type_combo.currentText()
+                app_logger.debug(f"흐름 제어 동작 생성: {action_class.__name__}")
+                if action_class in (LabelAction, JumpAction):
+                    return action_class(name=name, label=self.flow_label_edit.text().strip())
+                elif action_class is RepeatStartAction:
+                    return RepeatStartAction(name=name, count=self.flow_count_spin.value())
+                elif action_class is IfAction:
+                    return IfAction(
+                        name=name,
+                        condition=self.flow_condition_combo.currentData(),
+                        value=self.flow_value_edit.text(),
+                        negate=self.flow_negate_check.isChecked()
+                    )
+                return action_class(name=name)
+            
+            elif action_type == 11:  # 하위 매크로 호출
+                file_path = self.call_macro_file_edit.text()
+                app_logger.debug(f"하위 매크로 호출 동작 생성: {file_path}")
+                return CallMacroAction(
                     name=name,
-                    folder_path=folder_path
+                    file_path=file_path
                 )
-                action.filename_template = filename
-                return action
         
         except Exception as e:
             app_logger.error(f"동작 생성 중 오류 발생: {str(e)}", exc_info=True)
@@ -703,11 +999,27 @@ class ActionEditorDialog(QDialog):
         # 유효성 검사
         action_type = self.action_type_combo.currentIndex()
         
-        if action_type == 6 and self.text_list_widget.count() == 0:
+        if action_type == 6 and self.text_source_combo.currentIndex() == self.TEXT_SOURCE_FILE:
+            if self.text_file_model.rowCount() == 0:
+                app_logger.warning("참조할 텍스트 파일이 없거나 비어 있음")
+                QMessageBox.warning(self, "경고", "항목이 있는 텍스트 파일을 선택해주세요.")
+                return
+        elif action_type == 6 and self.text_list_widget.count() == 0:
             app_logger.warning("텍스트 리스트가 비어 있음")
             QMessageBox.warning(self, "경고", "텍스트 리스트에 항목을 추가해주세요.")
             return
         
+        if action_type == 10 and self.flow_label_edit.isEnabled() and not self.flow_label_edit.text().strip():
+            app_logger.warning("흐름 제어 라벨 이름이 비어 있음")
+            QMessageBox.warning(self, "경고", "라벨 이름을 입력해주세요.")
+            return
+        
+        if action_type == 11 and not os.path.isfile(resolve_macro_path(self.call_macro_file_edit.text(),
+                                                                       self.macro_path)):
+            app_logger.warning(f"하위 매크로 파일이 없음: {self.call_macro_file_edit.text()}")
+            QMessageBox.warning(self, "경고", "호출할 매크로 파일을 선택해주세요.")
+            return
+        
         super().accept()
     
     def reject(self):
@@ -726,6 +1038,14 @@ class ActionEditorDialog(QDialog):
         if file_path:
             self.clipboard_file_edit.setText(file_path)
 
+    def browse_call_macro_file(self):
+        """
+        호출할 하위 매크로 파일 선택
+        """
+        file_path, _ = QFileDialog.getOpenFileName(self, "호출할 매크로 파일 선택", "", MACRO_OPEN_FILTER)
+        if file_path:
+            self.call_macro_file_edit.setText(file_path)
+
     def browse_folder_path(self):
         """
         모니터링할 폴더 경로 선택
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ui/action_list_model.py
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt5.QtGui import QColor
+from utils.logger import app_logger
+
+# 실행 중인 동작 줄 배경색
+RUNNING_ROW_COLOR = QColor(255, 236, 179)
+
+class ActionListModel(QAbstractListModel):
+    """
+    매크로 엔진의 동작 목록(MacroEngine.actions)을 그대로 보여주는 목록 모델
+
+    항목을 따로 복사해 두지 않으므로 동작이 수십만 개여도 불러올 때
+    위젯 아이템을 만들지 않는다. 이름과 설명(툴팁)은 뷰가 화면에 보이는
+    줄을 요청할 때만 만든다. 편집은 이 모델의 메서드로 하며, 엔진 동작
+    목록을 바꾸고 바뀐 줄에 대한 시그널만 보낸다.
+    """
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self._engine = engine
+        self._running_row = -1
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._engine.actions)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        action = self._engine.get_action(index.row())
+        if action is None:
+            return None
+        if role == Qt.DisplayRole:
+            return action.name
+        if role == Qt.ToolTipRole:
+            return action.get_description()
+        if role == Qt.BackgroundRole and index.row() == self._running_row:
+            return RUNNING_ROW_COLOR
+        return None
+
+    def action(self, row):
+        """
+        지정한 줄의 동작 반환 (없으면 None)
+        """
+        return self._engine.get_action(row)
+
+    def add_action(self, action):
+        """
+        동작을 목록 끝에 추가하고 추가된 줄 번호 반환
+        """
+        row = len(self._engine.actions)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._engine.add_action(action)
+        self.endInsertRows()
+        return row
+
+    def replace_action(self, row, action):
+        """
+        지정한 줄의 동작 교체
+        """
+        self._engine.replace_action(row, action)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def remove_action(self, row):
+        """
+        지정한 줄의 동작 제거
+        """
+        if not 0 <= row < len(self._engine.actions):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._engine.remove_action(row)
+        self.endRemoveRows()
+
+    def move_action_up(self, row):
+        """
+        지정한 줄의 동작을 위로 이동 (이동했으면 True)
+        """
+        if not 0 < row < len(self._engine.actions):
+            return False
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row - 1)
+        self._engine.move_action_up(row)
+        self.endMoveRows()
+        return True
+
+    def move_action_down(self, row):
+        """
+        지정한 줄의 동작을 아래로 이동 (이동했으면 True)
+        """
+        if not 0 <= row < len(self._engine.actions) - 1:
+            return False
+        # beginMoveRows 의 대상 위치는 이동 전 목록 기준 (아래 줄의 다음 위치)
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), row + 2)
+        self._engine.move_action_down(row)
+        self.endMoveRows()
+        return True
+
+    def set_actions(self, actions):
+        """
+        동작 목록 전체 교체 (최적화 결과 적용 등)
+        """
+        self.beginResetModel()
+        self._engine.set_actions(actions)
+        self.endResetModel()
+
+    def set_running_row(self, row):
+        """
+        실행 중인 동작 줄 강조 (-1 이면 강조 해제, 바뀐 두 줄만 다시 그림)
+        """
+        previous = self._running_row
+        if row == previous:
+            return
+        self._running_row = row
+        for changed in (previous, row):
+            if 0 <= changed < self.rowCount():
+                index = self.index(changed)
+                self.dataChanged.emit(index, index, [Qt.BackgroundRole])
+
+    def reload(self):
+        """
+        엔진 동작 목록이 통째로 바뀐 뒤(불러오기, 복구) 뷰 갱신
+        """
+        self.beginResetModel()
+        self.endResetModel()
+        app_logger.debug(f"동작 목록 모델 갱신: {len(self._engine.actions)}개 동작")
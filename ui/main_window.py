@@ -6,12 +6,20 @@
 import os
 import json
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                            QPushButton, QListWidget, QLabel, QMessageBox,
+                            QPushButton, QListView, QLabel, QMessageBox,
                             QGroupBox, QCheckBox, QSpinBox, QFileDialog, QInputDialog)
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 
 from ui.action_editor import ActionEditorDialog
-from core.macro_engine import MacroEngine
+from ui.profile_dialog import ProfileDialog
+from ui.action_list_model import ActionListModel
+from core.macro_engine import MacroEngine, DEFAULT_LOG_EVERY
+from core.scheduler import SCHEDULE_RELATIVE, SCHEDULE_DEADLINE
+from core.input_backend import create_backend, DEFAULT_BACKEND
+from core.optimizer import optimize_actions
+from core.progress import PROGRESS_INTERVAL_MS
+from core.macro_format import BINARY_EXTENSION, MACRO_SAVE_FILTER, MACRO_OPEN_FILTER
+from core.edit_journal import get_journal_path, remove_journal
 from core.actions import (MacroAction, MouseClickAction, MouseMoveAction, 
                          KeyboardInputAction, KeyCombinationAction, 
                          MouseDragDropAction, TextListInputAction)  # TextListInputAction 추가
@@ -20,6 +28,9 @@ from core.folder_monitor import FolderMonitor
 from utils.config import Config
 from utils.logger import app_logger
 
+# 편집 자동 저장 파일 (설정 디렉토리, 편집 저널의 기준 파일)
+AUTOSAVE_FILE_NAME = "autosave.macb"
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -30,8 +41,12 @@ class MainWindow(QMainWindow):
         self.config = Config()
         app_logger.info("설정 로드 완료")
         
-        # 매크로 엔진 초기화
+        # 매크로 엔진 초기화 (입력 백엔드는 배포 환경별로 설정에서 선택)
         self.macro_engine = MacroEngine()
+        self._apply_input_backend()
+        self._apply_logging_settings()
+        # 실행 위치를 설정 디렉토리에 주기적으로 저장 (비정상 종료 후 이어서 실행)
+        self.macro_engine.set_checkpoint(os.path.join(self.config.config_dir, "checkpoint.json"))
         app_logger.info("매크로 엔진 초기화 완료")
         
         # 클립보드 매니저 초기화
@@ -63,9 +78,38 @@ class MainWindow(QMainWindow):
         self._connect_events()
         app_logger.info("이벤트 연결 완료")
         
+        # 편집 자동 저장 (비정상 종료 후 편집 내용 복구)
+        self._init_autosave()
+        
         # 로깅 상태 메시지
         app_logger.info("메인 윈도우 초기화 완료")
     
+    def _apply_input_backend(self):
+        """
+        설정에 지정된 입력 백엔드를 매크로 엔진에 적용
+        """
+        backend_name = self.config.get("macro", "input_backend", DEFAULT_BACKEND)
+        if backend_name == DEFAULT_BACKEND:
+            return
+        
+        try:
+            self.macro_engine.set_backend(create_backend(backend_name))
+            app_logger.info(f"입력 백엔드 설정: {backend_name}")
+        except Exception as e:
+            app_logger.error(f"입력 백엔드 생성 실패 ({backend_name}), 기본 백엔드 사용: {str(e)}", exc_info=True)
+    
+    def _apply_logging_settings(self):
+        """
+        설정의 로그 수준, 동작 로그 표본 간격, 로그 저장 위치와 크기 제한 적용
+        """
+        app_logger.set_level(self.config.get("logging", "level", "DEBUG"))
+        app_logger.configure(
+            log_dir=self.config.get("logging", "dir", "") or None,
+            max_bytes=self.config.get("logging", "max_file_mb", 10) * 1024 * 1024,
+            rotate_seconds=self.config.get("logging", "rotate_hours", 24) * 60 * 60,
+            retention_bytes=self.config.get("logging", "retention_mb", 200) * 1024 * 1024)
+        self.macro_engine.set_log_every(self.config.get("logging", "action_log_every", DEFAULT_LOG_EVERY))
+    
     def _init_ui(self):
         """
         UI 요소 초기화
@@ -74,9 +118,11 @@ class MainWindow(QMainWindow):
         self.actions_group = QGroupBox("매크로 동작 리스트")
         actions_layout = QVBoxLayout()
         
-        # 동작 리스트 위젯
-        self.actions_list = QListWidget()
-        self.actions_list.setDragDropMode(QListWidget.DragDropMode.InternalMove)
+        # 동작 리스트 (엔진 동작 목록을 직접 보여주는 모델, 보이는 줄만 그림)
+        self.actions_model = ActionListModel(self.macro_engine, self)
+        self.actions_list = QListView()
+        self.actions_list.setModel(self.actions_model)
+        self.actions_list.setUniformItemSizes(True)
         actions_layout.addWidget(self.actions_list)
         
         # 동작 관리 버튼 레이아웃
@@ -102,8 +148,12 @@ class MainWindow(QMainWindow):
         self.save_macro_btn = QPushButton("매크로 저장")
         self.load_macro_btn = QPushButton("매크로 불러오기")
         
+        self.optimize_btn = QPushButton("동작 최적화")
+        self.optimize_btn.setToolTip("연속 지연 합치기, 불필요한 마우스 이동 제거, 연속 키보드 입력 합치기")
+        
         save_load_layout.addWidget(self.save_macro_btn)
         save_load_layout.addWidget(self.load_macro_btn)
+        save_load_layout.addWidget(self.optimize_btn)
         
         actions_layout.addLayout(save_load_layout)
 
@@ -126,6 +176,10 @@ class MainWindow(QMainWindow):
         self.infinite_loop_check = QCheckBox("무한 반복")
         loop_layout.addWidget(self.infinite_loop_check)
         
+        # 절대 마감 시각 기준 스케줄 (장시간 반복 시 누적 지연 방지)
+        self.deadline_schedule_check = QCheckBox("정밀 스케줄 (누적 지연 없음)")
+        loop_layout.addWidget(self.deadline_schedule_check)
+        
         # 지연 설정 (메인에서 삭제)
         # loop_layout.addWidget(QLabel("동작 간 지연(ms):"))
         # self.delay_spin = QSpinBox()
@@ -145,6 +199,14 @@ class MainWindow(QMainWindow):
         stop_key_layout.addWidget(self.set_stop_key_btn)
         stop_key_layout.addStretch()
         
+        # 마지막 실행의 동작별 시간 보고서
+        self.profile_btn = QPushButton("실행 프로파일")
+        stop_key_layout.addWidget(self.profile_btn)
+        
+        # 최근 실행 기록(링 버퍼)을 파일로 저장
+        self.trace_btn = QPushButton("실행 기록 저장")
+        stop_key_layout.addWidget(self.trace_btn)
+        
         execution_layout.addLayout(stop_key_layout)
         
         self.execution_group.setLayout(execution_layout)
@@ -169,6 +231,13 @@ class MainWindow(QMainWindow):
         self.statusbar = self.statusBar()
         self.statusbar.showMessage("준비")
         
+        # 실행 진행 상태 (엔진이 기록한 공유 상태를 10Hz 로 읽어 표시)
+        self.progress_label = QLabel()
+        self.statusbar.addPermanentWidget(self.progress_label)
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(PROGRESS_INTERVAL_MS)
+        self.last_progress_message = None
+        
         # 초기 버튼 상태 설정
         self.pause_btn.setEnabled(False)
         self.stop_btn.setEnabled(False)
@@ -178,6 +247,63 @@ class MainWindow(QMainWindow):
         self.move_up_btn.setEnabled(False)
         self.move_down_btn.setEnabled(False)
     
+    def _init_autosave(self):
+        """
+        동작 편집을 설정 디렉토리의 자동 저장 파일에 편집 저널로 기록
+        
+        이전 실행이 비정상 종료되어 저널이 남아 있으면 복구 여부를 묻는다.
+        """
+        self.autosave_path = os.path.join(self.config.config_dir, AUTOSAVE_FILE_NAME)
+        recover = False
+        if os.path.exists(get_journal_path(self.autosave_path)):
+            reply = QMessageBox.question(
+                self, "편집 내용 복구",
+                "이전에 비정상 종료되어 저장되지 않은 편집 내용이 있습니다.\n복구할까요?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes
+            )
+            recover = reply == QMessageBox.Yes
+        
+        if not self.macro_engine.set_journal(self.autosave_path, recover=recover):
+            app_logger.warning("편집 자동 저장을 사용할 수 없음")
+            return
+        if recover:
+            self._apply_engine_to_ui()
+            self.statusbar.showMessage(f"편집 내용 복구: {len(self.macro_engine.actions)}개 동작")
+    
+    def _apply_engine_to_ui(self):
+        """
+        엔진의 동작 목록과 실행 설정을 화면에 반영 (불러오기/복구 후)
+        """
+        self.actions_model.reload()
+        
+        loop_count = self.macro_engine.loop_count
+        if loop_count <= 0:
+            self.infinite_loop_check.setChecked(True)
+            self.loop_count_spin.setEnabled(False)
+        else:
+            self.infinite_loop_check.setChecked(False)
+            self.loop_count_spin.setEnabled(True)
+            self.loop_count_spin.setValue(loop_count)
+        
+        self.stop_key_label.setText(self.macro_engine.stop_key)
+        self.deadline_schedule_check.setChecked(self.macro_engine.schedule_mode == SCHEDULE_DEADLINE)
+    
+    def _current_row(self):
+        """
+        선택된 동작의 줄 번호 (선택이 없으면 -1)
+        """
+        if not self.actions_list.selectionModel().hasSelection():
+            return -1
+        return self.actions_list.currentIndex().row()
+    
+    def _set_current_row(self, row):
+        """
+        지정한 줄을 선택하고 화면에 보이도록 스크롤
+        """
+        index = self.actions_model.index(row)
+        self.actions_list.setCurrentIndex(index)
+        self.actions_list.scrollTo(index)
+    
     def _connect_events(self):
         """
         이벤트 연결
@@ -191,7 +317,9 @@ class MainWindow(QMainWindow):
         self.move_down_btn.clicked.connect(self.move_action_down)
         
         # 리스트 아이템 선택 변경
-        self.actions_list.itemSelectionChanged.connect(self.on_action_selection_changed)
+        self.actions_list.selectionModel().selectionChanged.connect(self.on_action_selection_changed)
+        self.actions_model.rowsRemoved.connect(self.on_action_selection_changed)
+        self.actions_model.modelReset.connect(self.on_action_selection_changed)
         
         # 실행 제어 버튼
         self.start_btn.clicked.connect(self.start_macro)
@@ -201,9 +329,12 @@ class MainWindow(QMainWindow):
         # 저장 및 불러오기 버튼 연결
         self.save_macro_btn.clicked.connect(self.save_macro)
         self.load_macro_btn.clicked.connect(self.load_macro)
+        self.optimize_btn.clicked.connect(self.optimize_macro)
 
         # 설정 버튼
         self.set_stop_key_btn.clicked.connect(self.set_stop_key)
+        self.profile_btn.clicked.connect(self.show_profile)
+        self.trace_btn.clicked.connect(self.save_trace)
 
         # 체크박스
         self.infinite_loop_check.stateChanged.connect(self.on_infinite_loop_changed)
@@ -211,6 +342,7 @@ class MainWindow(QMainWindow):
         # 매크로 엔진 시그널
         self.macro_engine.status_changed.connect(self.on_macro_status_changed)
         self.macro_engine.macro_finished.connect(self.on_macro_finished)
+        self.progress_timer.timeout.connect(self.update_progress)
     
     @pyqtSlot(str)
     def on_macro_status_changed(self, status):
@@ -220,14 +352,37 @@ class MainWindow(QMainWindow):
         app_logger.info(f"매크로 상태 변경: {status}")
         self.statusbar.showMessage(status)
     
+    @pyqtSlot()
+    def update_progress(self):
+        """
+        실행 진행 상태 표시 (진행 타이머에서 주기적으로 호출)
+        """
+        snapshot = self.macro_engine.progress.snapshot()
+        if snapshot.action_count == 0:
+            return
+        self.progress_label.setText(snapshot.to_text())
+        
+        # 동작 실패/오류는 새 메시지일 때만 상태 표시줄에 표시
+        if snapshot.message and snapshot.message != self.last_progress_message:
+            self.last_progress_message = snapshot.message
+            self.statusbar.showMessage(snapshot.message)
+        
+        # 최적화된 목록으로 실행 중이면 인덱스가 화면 목록과 다르므로 강조하지 않음
+        if snapshot.running and not self.macro_engine.optimize:
+            self.actions_model.set_running_row(snapshot.action_index)
+    
     @pyqtSlot()
     def on_macro_finished(self):
         """
         매크로 실행 완료 시 처리
         """
         app_logger.info("매크로 실행 완료")
+        self.progress_timer.stop()
+        self.update_progress()
+        self.actions_model.set_running_row(-1)
         self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
+        self.pause_btn.setText("일시 정지")
         self.stop_btn.setEnabled(False)
         self.actions_group.setEnabled(True)
         self.execution_group.setEnabled(True)
@@ -238,13 +393,12 @@ class MainWindow(QMainWindow):
         새 매크로 동작 추가
         """
         app_logger.log_ui_action("동작 추가 버튼 클릭")
-        dialog = ActionEditorDialog(self)
+        dialog = ActionEditorDialog(self, macro_path=self.macro_engine.macro_path)
         if dialog.exec():
             action = dialog.get_action()
             if action:
                 app_logger.log_ui_action("새 동작 추가", f"유형: {action.name}")
-                self.actions_list.addItem(action.to_list_item())
-                self.macro_engine.add_action(action)
+                self.actions_model.add_action(action)
                 
                 # 텍스트 리스트 입력인 경우 자동으로 반복 횟수 설정
                 if isinstance(action, TextListInputAction) and not self.infinite_loop_check.isChecked():
@@ -258,21 +412,18 @@ class MainWindow(QMainWindow):
         """
         선택된 매크로 동작 편집
         """
-        current_row = self.actions_list.currentRow()
+        current_row = self._current_row()
         app_logger.log_ui_action("동작 편집 버튼 클릭", f"선택된 항목: {current_row}")
         
         if current_row >= 0:
             current_action = self.macro_engine.get_action(current_row)
-            dialog = ActionEditorDialog(self, current_action)
+            dialog = ActionEditorDialog(self, current_action, self.macro_engine.macro_path)
             
             if dialog.exec():
                 edited_action = dialog.get_action()
                 if edited_action:
                     app_logger.log_ui_action("동작 편집 완료", f"유형: {edited_action.name}")
-                    self.actions_list.takeItem(current_row)
-                    self.actions_list.insertItem(current_row, edited_action.to_list_item())
-                    self.actions_list.setCurrentRow(current_row)
-                    self.macro_engine.replace_action(current_row, edited_action)
+                    self.actions_model.replace_action(current_row, edited_action)
                     
                     # 텍스트 리스트 입력인 경우 자동으로 반복 횟수 설정 (무한 반복이 설정되지 않은 경우에만)
                     if isinstance(edited_action, TextListInputAction) and not self.infinite_loop_check.isChecked():
@@ -286,56 +437,45 @@ class MainWindow(QMainWindow):
         """
         선택된 매크로 동작 제거
         """
-        current_row = self.actions_list.currentRow()
+        current_row = self._current_row()
         app_logger.log_ui_action("동작 삭제 버튼 클릭", f"선택된 항목: {current_row}")
         
         if current_row >= 0:
             action = self.macro_engine.get_action(current_row)
             app_logger.log_ui_action("동작 삭제", f"유형: {action.name}")
             
-            self.actions_list.takeItem(current_row)
-            self.macro_engine.remove_action(current_row)
-            
-            # 선택 항목이 없을 경우 버튼 비활성화
-            if self.actions_list.count() == 0:
-                self.edit_action_btn.setEnabled(False)
-                self.remove_action_btn.setEnabled(False)
-                self.move_up_btn.setEnabled(False)
-                self.move_down_btn.setEnabled(False)
+            # 삭제 후 선택 변경은 rowsRemoved 시그널에서 버튼 상태에 반영
+            self.actions_model.remove_action(current_row)
     
     @pyqtSlot()
     def move_action_up(self):
         """
         선택된 매크로 동작을 위로 이동
         """
-        current_row = self.actions_list.currentRow()
+        current_row = self._current_row()
         app_logger.log_ui_action("동작 위로 이동 버튼 클릭", f"선택된 항목: {current_row}")
         
         if current_row > 0:
             action = self.macro_engine.get_action(current_row)
             app_logger.log_ui_action("동작 위로 이동", f"유형: {action.name}, 위치: {current_row} -> {current_row-1}")
             
-            item = self.actions_list.takeItem(current_row)
-            self.actions_list.insertItem(current_row - 1, item)
-            self.actions_list.setCurrentRow(current_row - 1)
-            self.macro_engine.move_action_up(current_row)
+            if self.actions_model.move_action_up(current_row):
+                self._set_current_row(current_row - 1)
     
     @pyqtSlot()
     def move_action_down(self):
         """
         선택된 매크로 동작을 아래로 이동
         """
-        current_row = self.actions_list.currentRow()
+        current_row = self._current_row()
         app_logger.log_ui_action("동작 아래로 이동 버튼 클릭", f"선택된 항목: {current_row}")
         
-        if current_row < self.actions_list.count() - 1:
+        if 0 <= current_row < self.actions_model.rowCount() - 1:
             action = self.macro_engine.get_action(current_row)
             app_logger.log_ui_action("동작 아래로 이동", f"유형: {action.name}, 위치: {current_row} -> {current_row+1}")
             
-            item = self.actions_list.takeItem(current_row)
-            self.actions_list.insertItem(current_row + 1, item)
-            self.actions_list.setCurrentRow(current_row + 1)
-            self.macro_engine.move_action_down(current_row)
+            if self.actions_model.move_action_down(current_row):
+                self._set_current_row(current_row + 1)
     
     @pyqtSlot()
     def save_macro(self):
@@ -344,23 +484,23 @@ class MainWindow(QMainWindow):
         """
         app_logger.log_ui_action("매크로 저장 버튼 클릭")
         
-        if self.actions_list.count() == 0:
+        if self.actions_model.rowCount() == 0:
             app_logger.warning("저장할 매크로 동작이 없음")
             QMessageBox.warning(self, "경고", "저장할 매크로 동작이 없습니다.")
             return
         
         # 파일 저장 대화상자 표시
-        file_path, _ = QFileDialog.getSaveFileName(
-            self, "매크로 저장", "", "매크로 파일 (*.json);;모든 파일 (*.*)"
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "매크로 저장", "", MACRO_SAVE_FILTER
         )
         
         if not file_path:
             app_logger.debug("매크로 저장 취소됨")
             return
         
-        # 확장자 확인 및 추가
-        if not file_path.lower().endswith('.json'):
-            file_path += '.json'
+        # 확장자 확인 및 추가 (바이너리 형식을 선택했으면 .macb)
+        if not file_path.lower().endswith(('.json', BINARY_EXTENSION)):
+            file_path += BINARY_EXTENSION if BINARY_EXTENSION in selected_filter else '.json'
         
         # 매크로 저장
         if self.macro_engine.save_to_file(file_path):
@@ -383,7 +523,7 @@ class MainWindow(QMainWindow):
             return
         
         # 확인 메시지 표시
-        if self.actions_list.count() > 0:
+        if self.actions_model.rowCount() > 0:
             reply = QMessageBox.question(
                 self, "매크로 불러오기", 
                 "현재 매크로 동작 목록을 지우고 새로 불러오시겠습니까?",
@@ -397,7 +537,7 @@ class MainWindow(QMainWindow):
         
         # 파일 선택 대화상자 표시
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "매크로 불러오기", "", "매크로 파일 (*.json);;모든 파일 (*.*)"
+            self, "매크로 불러오기", "", MACRO_OPEN_FILTER
         )
         
         if not file_path:
@@ -407,20 +547,7 @@ class MainWindow(QMainWindow):
         # 매크로 불러오기
         if self.macro_engine.load_from_file(file_path):
             # UI 업데이트
-            self.actions_list.clear()
-            for action in self.macro_engine.actions:
-                self.actions_list.addItem(action.to_list_item())
-                        
-            loop_count = self.macro_engine.loop_count
-            if loop_count <= 0:
-                self.infinite_loop_check.setChecked(True)
-                self.loop_count_spin.setEnabled(False)
-            else:
-                self.infinite_loop_check.setChecked(False)
-                self.loop_count_spin.setEnabled(True)
-                self.loop_count_spin.setValue(loop_count)
-            
-            self.stop_key_label.setText(self.macro_engine.stop_key)
+            self._apply_engine_to_ui()
             
             # 최근 파일 목록에 추가
             self.config.add_recent_file(file_path)
@@ -434,8 +561,8 @@ class MainWindow(QMainWindow):
         """
         동작 선택 변경 시 핸들러
         """
-        has_selection = len(self.actions_list.selectedItems()) > 0
-        current_row = self.actions_list.currentRow()
+        has_selection = self.actions_list.selectionModel().hasSelection()
+        current_row = self._current_row()
         
         if has_selection:
             action = self.macro_engine.get_action(current_row)
@@ -445,7 +572,7 @@ class MainWindow(QMainWindow):
         self.remove_action_btn.setEnabled(has_selection)
         self.copy_action_btn.setEnabled(has_selection)
         self.move_up_btn.setEnabled(has_selection and current_row > 0)
-        self.move_down_btn.setEnabled(has_selection and current_row < self.actions_list.count() - 1)
+        self.move_down_btn.setEnabled(has_selection and current_row < self.actions_model.rowCount() - 1)
     
     @pyqtSlot()
     def start_macro(self):
@@ -454,7 +581,7 @@ class MainWindow(QMainWindow):
         """
         app_logger.log_ui_action("매크로 시작 버튼 클릭")
         
-        if self.actions_list.count() == 0:
+        if self.actions_model.rowCount() == 0:
             app_logger.warning("실행할 매크로 동작이 없음")
             QMessageBox.warning(self, "경고", "실행할 매크로 동작이 없습니다.")
             return
@@ -470,6 +597,22 @@ class MainWindow(QMainWindow):
             app_logger.info(f"매크로 반복 횟수 설정: {loop_count}")
             self.macro_engine.set_loop_count(loop_count)
         
+        schedule_mode = SCHEDULE_DEADLINE if self.deadline_schedule_check.isChecked() else SCHEDULE_RELATIVE
+        app_logger.info(f"매크로 스케줄 모드 설정: {schedule_mode}")
+        self.macro_engine.set_schedule_mode(schedule_mode)
+        
+        # 이전 실행이 중단된 체크포인트가 있으면 이어서 실행할지 확인
+        resume = False
+        checkpoint = self.macro_engine.get_resume_checkpoint()
+        if checkpoint is not None:
+            reply = QMessageBox.question(
+                self, "이어서 실행",
+                f"이전 실행이 중단된 위치가 있습니다 (반복 {checkpoint['loop_counter']}회 완료, "
+                f"단계 {checkpoint['pc'] + 1}).\n중단된 위치부터 이어서 실행할까요?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+            resume = (reply == QMessageBox.Yes)
+            app_logger.log_ui_action("체크포인트 재개 선택", "이어서 실행" if resume else "처음부터 실행")
+        
         # UI 상태 변경
         self.start_btn.setEnabled(False)
         self.pause_btn.setEnabled(True)
@@ -479,8 +622,14 @@ class MainWindow(QMainWindow):
         
         # 매크로 시작
         app_logger.log_macro_start()
-        self.macro_engine.start()
+        self.macro_engine.start(resume=resume)
+        if not self.macro_engine.is_running():
+            # 실행 계획 오류(흐름 제어 블록 짝 불일치 등)로 시작되지 않음 - 오류는 상태 표시줄에 표시됨
+            self.on_macro_finished()
+            return
         self.statusbar.showMessage("매크로 실행 중...")
+        self.last_progress_message = None
+        self.progress_timer.start()
     
     @pyqtSlot()
     def pause_macro(self):
@@ -508,17 +657,57 @@ class MainWindow(QMainWindow):
         app_logger.log_ui_action("중지 버튼 클릭")
         app_logger.log_macro_stop("사용자에 의한 중지")
         
+        # 중지 요청은 즉시 반환되며, 실행 스레드 종료 후 on_macro_finished 에서 UI 복원
         self.macro_engine.stop()
         
-        # UI 상태 복원
-        self.start_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.pause_btn.setText("일시 정지")
         self.stop_btn.setEnabled(False)
-        self.actions_group.setEnabled(True)
-        self.execution_group.setEnabled(True)
         
-        self.statusbar.showMessage("매크로 중지됨")
+        self.statusbar.showMessage("매크로 중지 중...")
+    
+    @pyqtSlot()
+    def optimize_macro(self):
+        """
+        동작 목록 최적화 (변경 내역을 보여주고 확인 후 적용)
+        """
+        app_logger.log_ui_action("동작 최적화 버튼 클릭")
+        
+        actions, report = optimize_actions(self.macro_engine.actions)
+        if not report.changes:
+            QMessageBox.information(self, "동작 최적화", "최적화할 동작이 없습니다.")
+            return
+        
+        reply = QMessageBox.question(self, "동작 최적화", f"{report.to_text()}\n\n적용할까요?",
+                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if reply != QMessageBox.Yes:
+            app_logger.debug("동작 최적화 취소됨")
+            return
+        
+        report.log()
+        self.actions_model.set_actions(actions)
+        self.statusbar.showMessage(f"동작 최적화 완료: {report.removed_count}개 동작 감소")
+    
+    @pyqtSlot()
+    def show_profile(self):
+        """
+        동작별 실행 시간 프로파일 보고서 표시
+        """
+        app_logger.log_ui_action("실행 프로파일 버튼 클릭")
+        dialog = ProfileDialog(self.macro_engine.get_profile(), self)
+        dialog.exec()
+    
+    @pyqtSlot()
+    def save_trace(self):
+        """
+        최근 실행 기록을 로그 폴더에 저장 (실행 중에도 가능)
+        """
+        app_logger.log_ui_action("실행 기록 저장 버튼 클릭")
+        file_path = self.macro_engine.dump_trace("manual")
+        if file_path:
+            self.statusbar.showMessage(f"실행 기록 저장: {file_path}")
+        else:
+            QMessageBox.warning(self, "저장 실패", "실행 기록을 저장하지 못했습니다.")
     
     @pyqtSlot()
     def set_stop_key(self):
@@ -563,6 +752,15 @@ class MainWindow(QMainWindow):
             app_logger.log_folder_action("모니터링 중지", "애플리케이션 종료로 인한 종료")
             self.folder_monitor.stop_monitoring()
         
+        # 정상 종료 시 자동 저장 파일과 편집 저널 삭제
+        self.macro_engine.close_journal(compact=False)
+        remove_journal(self.autosave_path)
+        try:
+            if os.path.exists(self.autosave_path):
+                os.remove(self.autosave_path)
+        except OSError as e:
+            app_logger.warning(f"자동 저장 파일 삭제 실패: {self.autosave_path} - {str(e)}")
+        
         # 설정 저장
         self.config.save()
         app_logger.info("설정 저장 완료")
@@ -575,7 +773,7 @@ class MainWindow(QMainWindow):
         """
         선택된 매크로 동작 복사
         """
-        current_row = self.actions_list.currentRow()
+        current_row = self._current_row()
         app_logger.log_ui_action("동작 복사 버튼 클릭", f"선택된 항목: {current_row}")
         
         if current_row >= 0:
@@ -588,4 +786,4 @@ class MainWindow(QMainWindow):
             
             if copied_action:
                 app_logger.log_ui_action("동작 복사 완료", f"유형: {copied_action.name}")
-                self.actions_list.addItem(copied_action.to_list_item())
\ No newline at end of file
+                self._set_current_row(self.actions_model.add_action(copied_action))
\ No newline at end of file
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ui/profile_dialog.py
+
+
+from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton,
+                            QPlainTextEdit, QFileDialog, QMessageBox)
+from PyQt5.QtGui import QFontDatabase
+from PyQt5.QtCore import pyqtSlot
+
+from utils.logger import app_logger
+
+class ProfileDialog(QDialog):
+    """
+    마지막 매크로 실행의 동작별 시간 프로파일 보고서 다이얼로그
+    """
+    def __init__(self, profiler, parent=None):
+        super().__init__(parent)
+
+        self.setWindowTitle("실행 프로파일")
+        self.setMinimumSize(900, 500)
+
+        self.profiler = profiler
+
+        self._init_ui()
+        self.refresh()
+
+    def _init_ui(self):
+        """
+        UI 초기화
+        """
+        main_layout = QVBoxLayout(self)
+
+        # 보고서 표시 (열 정렬을 위해 고정폭 글꼴 사용)
+        self.report_text = QPlainTextEdit()
+        self.report_text.setReadOnly(True)
+        self.report_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.report_text.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        main_layout.addWidget(self.report_text)
+
+        button_layout = QHBoxLayout()
+        self.refresh_btn = QPushButton("새로 고침")
+        self.save_btn = QPushButton("보고서 저장 (JSON/CSV)")
+        self.close_btn = QPushButton("닫기")
+
+        button_layout.addWidget(self.refresh_btn)
+        button_layout.addWidget(self.save_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.close_btn)
+        main_layout.addLayout(button_layout)
+
+        self.refresh_btn.clicked.connect(self.refresh)
+        self.save_btn.clicked.connect(self.save_report)
+        self.close_btn.clicked.connect(self.accept)
+
+    @pyqtSlot()
+    def refresh(self):
+        """
+        보고서 내용 갱신 (실행 중에도 현재까지의 기록을 표시)
+        """
+        self.report_text.setPlainText(self.profiler.to_text(top=100))
+
+    @pyqtSlot()
+    def save_report(self):
+        """
+        보고서를 JSON 또는 CSV 파일로 저장
+        """
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "실행 프로파일 저장", "", "JSON 파일 (*.json);;CSV 파일 (*.csv)"
+        )
+
+        if not file_path:
+            app_logger.debug("실행 프로파일 저장 취소됨")
+            return
+
+        # 확장자 확인 및 추가
+        if not file_path.lower().endswith(('.json', '.csv')):
+            file_path += '.csv' if 'csv' in selected_filter.lower() else '.json'
+
+        if self.profiler.save(file_path):
+            QMessageBox.information(self, "저장 완료", f"실행 프로파일이 저장되었습니다.\n{file_path}")
+        else:
+            QMessageBox.critical(self, "저장 실패", "실행 프로파일 저장 중 오류가 발생했습니다.")
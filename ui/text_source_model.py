@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# ui/text_source_model.py
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+from utils.logger import app_logger
+
+class TextSourceModel(QAbstractListModel):
+    """
+    텍스트 원본(TextIndex 등)을 보여주는 읽기 전용 목록 모델
+
+    QListView 는 화면에 보이는 줄만 data() 로 요청하므로 항목 수가
+    수백만 개여도 위젯 아이템을 만들지 않고 필요한 줄만 파일에서 읽는다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._source = None
+        self._count = 0
+
+    def set_source(self, source):
+        """
+        표시할 텍스트 원본 설정 (None 이면 비움, 읽기 실패 시 예외 전달)
+        """
+        self.beginResetModel()
+        try:
+            self._source = source
+            self._count = len(source) if source is not None else 0
+        except Exception:
+            self._source = None
+            self._count = 0
+            raise
+        finally:
+            self.endResetModel()
+        app_logger.debug(f"텍스트 원본 모델 설정: {self._count}개 항목")
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._count
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.ToolTipRole):
+            return None
+        return self._source[index.row()]
@@ -32,7 +32,8 @@ class Config(QObject):
             "macro": {
                 "delay": 100,
                 "loop_count": 1,
-                "stop_key": "f12"
+                "stop_key": "f12",
+                "input_backend": "pyautogui"
             },
             "clipboard": {
                 "enabled": False,
@@ -42,6 +43,14 @@ class Config(QObject):
                 "enabled": False,
                 "folder_path": ""
             },
+            "logging": {
+                "level": "DEBUG",
+                "action_log_every": 10,
+                "dir": "",
+                "max_file_mb": 10,
+                "rotate_hours": 24,
+                "retention_mb": 200
+            },
             "recent_files": []
         }
         
@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# utils/log_storage.py
+
+import os
+import re
+import sys
+import gzip
+import time
+import queue
+import shutil
+import threading
+import logging.handlers
+
+# 로그 파일 하나의 최대 크기 (초과하면 새 조각으로 교체)
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+# 로그 파일을 교체하는 시간 간격 (초)
+DEFAULT_ROTATE_SECONDS = 24 * 60 * 60
+# 로그 디렉토리 전체 최대 크기 (초과하면 오래된 파일부터 삭제)
+DEFAULT_RETENTION_BYTES = 200 * 1024 * 1024
+
+# 관리 대상 로그 파일 (logs_<시각>.txt, 교체된 조각 logs_<시각>.<번호>.txt[.gz])
+LOG_FILE_PATTERN = re.compile(r"^logs_\d{8}_\d{6}(\.\d{3,})?\.txt(\.gz)?$")
+# 압축되지 않은 교체 조각 (이전 실행이 압축 전에 종료된 경우)
+_ROTATED_PATTERN = re.compile(r"^logs_\d{8}_\d{6}\.\d{3,}\.txt$")
+# 압축이 끝난 교체 조각 (기록하는 프로세스가 없으므로 보존 한도 적용 대상)
+_COMPRESSED_PATTERN = re.compile(r"^logs_\d{8}_\d{6}\.\d{3,}\.txt\.gz$")
+# 이 시간(초) 동안 바뀌지 않은 압축 전 조각만 다른 실행이 남긴 것으로 보고 압축
+# (같은 디렉토리를 쓰는 다른 프로세스가 지금 압축 중일 수 있음)
+STALE_SEGMENT_SECONDS = 10 * 60
+
+
+class LogCompressor:
+    """
+    교체된 로그 조각을 gzip 으로 압축하고 보존 한도를 적용하는 백그라운드 작업자
+
+    로그 기록 스레드는 파일 이름 변경만 하고 압축과 삭제는 이 스레드가 한다.
+    같은 디렉토리에 여러 프로세스가 기록할 수 있으므로, 기록 중인 파일은
+    건드리지 않고 압축이 끝난 조각만 삭제하며, 다른 프로세스의 압축 전
+    조각은 한동안 바뀌지 않은 것(이전 실행이 남긴 것)만 압축한다.
+    """
+    def __init__(self, log_dir, retention_bytes):
+        self.log_dir = log_dir
+        self.retention_bytes = retention_bytes
+        self._queue = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._worker, name="LogCompressor", daemon=True)
+        self._thread.start()
+
+    def submit(self, path):
+        """
+        압축할 조각 추가 (None 이면 보존 한도만 적용)
+        """
+        self._queue.put(path)
+
+    def cleanup(self):
+        """
+        이전 실행에서 압축하지 못한 조각을 압축하고 보존 한도 적용
+        """
+        try:
+            names = os.listdir(self.log_dir)
+        except OSError:
+            return
+        stale = time.time() - STALE_SEGMENT_SECONDS
+        for name in names:
+            if not _ROTATED_PATTERN.match(name):
+                continue
+            path = os.path.join(self.log_dir, name)
+            try:
+                if os.stat(path).st_mtime < stale:
+                    self.submit(path)
+            except OSError:
+                continue
+        self.submit(None)
+
+    def stop(self, timeout=5.0):
+        """
+        대기 중인 압축을 마치고 작업자 종료
+        """
+        self._queue.put(False)
+        self._thread.join(timeout)
+
+    def _worker(self):
+        while True:
+            path = self._queue.get()
+            try:
+                if path is False:
+                    # 종료 직전에 압축한 조각까지 포함해 마지막으로 한 번 적용
+                    self._apply_retention()
+                    return
+                if path is not None:
+                    self._compress(path)
+                # 압축 대기 중인 조각이 남아 있으면 다 줄인 뒤에 한 번만 적용
+                if self._queue.empty():
+                    self._apply_retention()
+            except Exception as e:
+                # 로거 자신의 오류이므로 로그 대신 표준 오류로 출력
+                sys.stderr.write(f"로그 압축/정리 실패: {path} - {str(e)}\n")
+                if path is False:
+                    return
+
+    def _compress(self, path):
+        # 다른 프로세스가 같은 조각을 압축하더라도 임시 파일이 겹치지 않게 함
+        temp_path = f"{path}.{os.getpid()}.gz.tmp"
+        try:
+            source = open(path, 'rb')
+        except FileNotFoundError:
+            return
+        with source, gzip.open(temp_path, 'wb') as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        os.replace(temp_path, path + ".gz")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _apply_retention(self):
+        """
+        로그 디렉토리의 로그 파일 합계가 한도를 넘으면 오래된 압축 조각부터 삭제
+
+        기록 중이거나 압축 중일 수 있는 파일은 합계에만 넣고 삭제하지 않는다.
+        """
+        if not self.retention_bytes or self.retention_bytes <= 0:
+            return
+        files = []
+        total = 0
+        for name in os.listdir(self.log_dir):
+            if not LOG_FILE_PATTERN.match(name):
+                continue
+            path = os.path.join(self.log_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            total += stat.st_size
+            if _COMPRESSED_PATTERN.match(name):
+                files.append((stat.st_mtime, stat.st_size, path))
+
+        files.sort()
+        for _, size, path in files:
+            if total <= self.retention_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+class RotatingLogFileHandler(logging.handlers.BaseRotatingHandler):
+    """
+    크기와 시간 기준으로 교체되는 로그 파일 핸들러
+
+    기록 중인 파일이 max_bytes 를 넘거나 rotate_seconds 가 지나면 파일을
+    logs_<시각>.<번호>.txt 로 이름만 바꾸고 같은 이름의 새 파일에 이어서
+    기록한다. 바뀐 조각의 압축과 보존 한도 적용은 LogCompressor 가 한다.
+    종료할 때는 close_segment 로 기록하던 파일도 마지막 조각으로 바꾼다.
+    QueueListener 기록 스레드에서만 호출된다 (close_segment 는 기록 스레드를 멈춘 뒤).
+    """
+    def __init__(self, filename, compressor, max_bytes=DEFAULT_MAX_BYTES,
+                 rotate_seconds=DEFAULT_ROTATE_SECONDS):
+        super().__init__(filename, 'a', encoding='utf-8')
+        self.compressor = compressor
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.segment = 0
+        self.next_rotate = time.time() + rotate_seconds if rotate_seconds > 0 else None
+
+    def shouldRollover(self, record):
+        if self.next_rotate is not None and record.created >= self.next_rotate:
+            return True
+        if self.max_bytes > 0:
+            if self.stream is None:
+                self.stream = self._open()
+            return self.stream.tell() >= self.max_bytes
+        return False
+
+    def close_segment(self):
+        """
+        기록 중인 파일을 마지막 조각으로 닫음 (종료 시, 이후 압축과 보존 한도 적용 대상)
+        """
+        self.acquire()
+        try:
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            # 빈 파일은 조각으로 남기지 않고 삭제
+            if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) == 0:
+                os.remove(self.baseFilename)
+            else:
+                self.doRollover(reopen=False)
+        finally:
+            self.release()
+
+    def doRollover(self, reopen=True):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        root, extension = os.path.splitext(self.baseFilename)
+        self.segment += 1
+        rotated = f"{root}.{self.segment:03d}{extension}"
+        if os.path.exists(self.baseFilename):
+            os.replace(self.baseFilename, rotated)
+            self.compressor.submit(rotated)
+
+        if not reopen:
+            return
+        if self.rotate_seconds > 0:
+            self.next_rotate = time.time() + self.rotate_seconds
+        self.stream = self._open()
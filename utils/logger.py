@@ -3,19 +3,128 @@
 # utils/logger.py
 
 import os
+import sys
+import queue
+import atexit
 import logging
-from datetime import datetime
+import threading
 import traceback
-import sys
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from utils.log_storage import (LogCompressor, RotatingLogFileHandler, DEFAULT_MAX_BYTES,
+                               DEFAULT_ROTATE_SECONDS, DEFAULT_RETENTION_BYTES)
+
+# is_enabled / set_level 에 사용하는 로그 수준
+DEBUG = logging.DEBUG
+INFO = logging.INFO
+WARNING = logging.WARNING
+ERROR = logging.ERROR
+
+# 로그 형식
+LOG_FORMAT = '[%(asctime)s][%(levelname)s] %(message)s'
+
+# 로그 디렉토리를 지정하는 환경 변수 (없으면 프로그램 폴더의 logs)
+LOG_DIR_ENV = "MACRO_LOG_DIR"
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    로그 레코드를 포맷하지 않고 그대로 큐에 넣는 핸들러
+
+    기본 QueueHandler 는 호출한 스레드에서 메시지를 포맷하지만, 여기서는
+    메시지와 %-인자를 그대로 넘겨 기록 스레드가 포맷하게 한다. 예외 정보만
+    트레이스백 객체가 스레드 밖에서 살아 있지 않도록 문자열로 바꿔 둔다.
+    """
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self._exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        if record.exc_info:
+            record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _DeferredFileHandler(logging.Handler):
+    """
+    로그 파일을 열기 전의 레코드를 보관했다가 파일 핸들러로 넘기는 핸들러
+
+    모듈을 불러오는 시점에는 명령줄 옵션(--log-dir 등)이 아직 적용되지 않았으므로
+    파일을 바로 만들지 않는다. 보관한 레코드는 파일 핸들러가 정해지면 먼저 기록된다.
+    기록 스레드에서만 호출되며, 대상 교체는 기록 스레드를 멈춘 상태에서 한다.
+    """
+    def __init__(self, on_overflow, max_pending):
+        super().__init__(logging.DEBUG)
+        self.target = None
+        self.pending = []
+        self.on_overflow = on_overflow
+        self.max_pending = max_pending
+
+    def set_target(self, target):
+        """
+        파일 핸들러 지정 (보관한 레코드를 먼저 기록)
+        """
+        self.target = target
+        pending, self.pending = self.pending, []
+        for record in pending:
+            if record.levelno >= target.level:
+                target.handle(record)
+
+    def emit(self, record):
+        if self.target is not None:
+            if record.levelno >= self.target.level:
+                self.target.handle(record)
+            return
+        self.pending.append(record)
+        # 설정 없이 오래 실행되면 메모리에 쌓지 않고 기본 위치에 기록 시작
+        if len(self.pending) >= self.max_pending:
+            try:
+                self.on_overflow()
+            except Exception:
+                # 파일을 만들 수 없으면 보관한 레코드를 버려 메모리가 늘지 않게 함
+                self.pending.clear()
+                self.handleError(record)
+
+    def close(self):
+        if self.target is not None:
+            self.target.close()
+        super().close()
+
 
 class Logger:
     """
     애플리케이션의 로깅을 관리하는 클래스
+    
+    로그는 큐에 넣기만 하고 파일/콘솔 기록은 백그라운드 스레드(QueueListener)가
+    담당하므로 매크로 실행 스레드가 디스크 쓰기를 기다리지 않는다. 메시지는
+    logging 과 같이 %-형식 인자로 넘기면 해당 수준이 꺼져 있을 때 포맷하지 않는다.
+    로그 파일은 크기/시간 기준으로 교체되고, 교체된 조각은 gzip 으로 압축되며
+    로그 디렉토리 전체 크기가 보존 한도를 넘으면 오래된 파일부터 삭제된다.
+    로그 파일은 configure 가 처음 호출될 때 만들어지고, 그 전의 로그는
+    보관했다가 파일에 먼저 기록한다 (호출되지 않으면 종료 시 기본 위치에 기록).
     """
+    # 로그 파일을 열기 전에 보관하는 최대 레코드 수
+    MAX_PENDING_RECORDS = 10000
+    
     def __init__(self):
         self.logger = None
         self.log_file = None
         self.start_time = None
+        self.listener = None
+        self.log_dir = None
+        self.max_bytes = DEFAULT_MAX_BYTES
+        self.rotate_seconds = DEFAULT_ROTATE_SECONDS
+        self.retention_bytes = DEFAULT_RETENTION_BYTES
+        self.compressor = None
+        self._file_handler = None
+        self._deferred_handler = None
+        self._console_handler = None
+        self._debug_enabled = False
+        self._info_enabled = False
+        # 스레드별 동작 로그 사용 여부 (엔진이 반복마다 표본 추출에 사용)
+        self._local = threading.local()
         self.setup_logger()
     
     def setup_logger(self):
@@ -24,41 +133,33 @@ class Logger:
         """
         # 현재 시간 기록
         self.start_time = datetime.now()
-        timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
-        
-        # 로그 디렉토리 생성
-        log_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-        
-        # 로그 파일 경로 설정
-        self.log_file = os.path.join(log_dir, f"logs_{timestamp}.txt")
+        self._timestamp = self.start_time.strftime("%Y%m%d_%H%M%S")
         
         # 로거 설정
         self.logger = logging.getLogger("macro_app")
         self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
         
-        # 파일 핸들러 설정
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        # 파일 핸들러는 configure 에서 생성 (환경 변수로 기본 로그 디렉토리 지정 가능)
+        self.log_dir = os.path.abspath(os.environ.get(LOG_DIR_ENV) or DEFAULT_LOG_DIR)
+        self._deferred_handler = _DeferredFileHandler(self._open_default_file, self.MAX_PENDING_RECORDS)
         
         # 콘솔 핸들러 설정
         console_handler = logging.StreamHandler()
         console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._console_handler = console_handler
         
-        # 포맷터 설정
-        formatter = logging.Formatter('[%(asctime)s][%(levelname)s] %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        # 핸들러 추가
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
+        # 호출 스레드는 큐에 넣기만 하고 기록 스레드가 파일/콘솔 핸들러로 기록
+        self._queue = queue.SimpleQueue()
+        self.logger.addHandler(_DeferredQueueHandler(self._queue))
+        self._start_listener()
+        atexit.register(self.shutdown)
+        self._update_enabled()
         
         # 시작 로그 메시지
         self.logger.info("=== 매크로 애플리케이션 시작 ===")
         self.logger.info(f"시작 시간: {self.start_time}")
-        self.logger.info(f"로그 파일: {self.log_file}")
         
         # 시스템 정보 로깅
         self.log_system_info()
@@ -66,6 +167,173 @@ class Logger:
         # 예외 처리 핸들러 설정
         sys.excepthook = self.handle_exception
     
+    def shutdown(self):
+        """
+        큐에 남은 로그를 모두 기록하고 기록 스레드 종료 (프로그램 종료 시 자동 호출)
+        """
+        listener = self.listener
+        if listener is not None:
+            self.listener = None
+            listener.stop()
+            # 끝까지 configure 가 호출되지 않았으면 보관한 로그를 기본 위치에 기록
+            if self._file_handler is None:
+                try:
+                    self._open_default_file()
+                except OSError as e:
+                    sys.stderr.write(f"로그 파일 생성 실패: {str(e)}\n")
+            # 기록하던 파일을 마지막 조각으로 닫아 압축과 보존 한도 적용 대상으로 만듦
+            if self._file_handler is not None:
+                try:
+                    self._file_handler.close_segment()
+                except OSError as e:
+                    sys.stderr.write(f"로그 파일 닫기 실패: {str(e)}\n")
+            for handler in listener.handlers:
+                handler.close()
+        if self.compressor is not None:
+            self.compressor.stop()
+    
+    def _create_file_handler(self):
+        """
+        현재 로그 디렉토리에 교체형 파일 핸들러 생성 (self.log_file 갱신)
+        """
+        if not os.path.exists(self.log_dir):
+            os.makedirs(self.log_dir)
+        self.log_file = os.path.join(self.log_dir, f"logs_{self._timestamp}.txt")
+        file_handler = RotatingLogFileHandler(self.log_file, self.compressor, self.max_bytes,
+                                              self.rotate_seconds)
+        file_handler.setLevel(logging.DEBUG)
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        self._file_handler = file_handler
+        self._deferred_handler.set_target(file_handler)
+        return file_handler
+    
+    def _open_default_file(self):
+        """
+        configure 없이 현재 설정으로 로그 파일 열기 (기록 스레드가 멈췄거나 기록 스레드 안에서 호출)
+        """
+        compressor = LogCompressor(self.log_dir, self.retention_bytes)
+        self.compressor = compressor
+        try:
+            self._create_file_handler()
+        except OSError:
+            compressor.stop()
+            self.compressor = None
+            raise
+        compressor.cleanup()
+        self.logger.info(f"로그 파일: {self.log_file}")
+    
+    def _start_listener(self):
+        self.listener = QueueListener(self._queue, self._deferred_handler, self._console_handler,
+                                      respect_handler_level=True)
+        self.listener.start()
+    
+    def configure(self, log_dir=None, max_bytes=None, rotate_seconds=None, retention_bytes=None):
+        """
+        로그 저장 설정 변경 (None 인 항목은 유지, 0 이하는 해당 제한 없음)
+        
+        처음 호출되면 로그 파일을 만들고 그때까지 보관한 로그를 기록한다.
+        이후 log_dir 이 바뀌면 새 디렉토리에 이어서 기록하고, 이전 디렉토리의
+        파일은 그대로 둔다. 기록 스레드를 잠시 멈추고 핸들러를 교체한다.
+        """
+        new_dir = os.path.abspath(log_dir) if log_dir else self.log_dir
+        new_max_bytes = self.max_bytes if max_bytes is None else int(max_bytes)
+        new_rotate_seconds = self.rotate_seconds if rotate_seconds is None else int(rotate_seconds)
+        new_retention_bytes = self.retention_bytes if retention_bytes is None else int(retention_bytes)
+        if (self._file_handler is not None
+                and new_dir == self.log_dir and new_max_bytes == self.max_bytes
+                and new_rotate_seconds == self.rotate_seconds
+                and new_retention_bytes == self.retention_bytes):
+            return True
+        if self.listener is None:
+            return False
+        
+        try:
+            # 큐에 남은 로그를 이전 핸들러로 모두 기록한 뒤 교체
+            self.listener.stop()
+            self.listener = None
+            old_handler = self._file_handler
+            old_dir = self.log_dir
+            if old_handler is not None:
+                # 다른 디렉토리로 옮기면 이전 파일은 마지막 조각으로 닫음
+                if new_dir != old_dir:
+                    old_handler.close_segment()
+                old_handler.close()
+            
+            self.max_bytes = new_max_bytes
+            self.rotate_seconds = new_rotate_seconds
+            self.retention_bytes = new_retention_bytes
+            if self.compressor is None or new_dir != old_dir:
+                if self.compressor is not None:
+                    self.compressor.stop()
+                self.log_dir = new_dir
+                self.compressor = LogCompressor(self.log_dir, self.retention_bytes)
+            else:
+                self.compressor.retention_bytes = self.retention_bytes
+            
+            try:
+                file_handler = self._create_file_handler()
+                # 같은 파일에 이어서 쓰면 교체 조각 번호도 이어서 사용
+                if old_handler is not None and file_handler.baseFilename == old_handler.baseFilename:
+                    file_handler.segment = old_handler.segment
+            except OSError:
+                # 새 디렉토리를 쓸 수 없으면 이전 위치로 되돌림 (처음이면 기본 위치)
+                self.compressor.stop()
+                self.log_dir = old_dir
+                self.compressor = LogCompressor(self.log_dir, self.retention_bytes)
+                file_handler = self._create_file_handler()
+                raise
+            finally:
+                self._start_listener()
+            
+            self.compressor.cleanup()
+            self.info("로그 저장 설정: 파일 %s, 파일당 최대 %d바이트, 교체 간격 %d초, 보존 한도 %d바이트",
+                      self.log_file, self.max_bytes, self.rotate_seconds, self.retention_bytes)
+            return True
+        except Exception as e:
+            self.error(f"로그 저장 설정 변경 실패: {str(e)}", exc_info=True)
+            return False
+    
+    def _update_enabled(self):
+        self._debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+        self._info_enabled = self.logger.isEnabledFor(logging.INFO)
+    
+    def set_level(self, level):
+        """
+        로그 수준 설정 (DEBUG/INFO/WARNING/ERROR 또는 "debug" 같은 이름)
+        """
+        if isinstance(level, str):
+            level = logging.getLevelName(level.upper())
+            if not isinstance(level, int):
+                self.warning("알 수 없는 로그 수준: %s", level)
+                return
+        self.logger.setLevel(level)
+        self._update_enabled()
+    
+    def is_enabled(self, level):
+        """
+        해당 수준의 로그가 기록되는지 확인 (메시지를 만들기 전에 검사할 때 사용)
+        """
+        return self.logger.isEnabledFor(level)
+    
+    def set_action_logging(self, enabled):
+        """
+        현재 스레드의 동작 실행 로그(action_debug) 사용 여부 설정
+        """
+        self._local.action_logging = enabled
+    
+    def is_action_logging(self):
+        """
+        현재 스레드에서 동작 실행 로그를 기록하는지 확인
+        """
+        return getattr(self._local, "action_logging", True)
+    
+    def action_debug(self, message, *args):
+        """
+        동작 실행 디버그 메시지 (엔진이 표본 추출에서 제외한 반복에서는 기록하지 않음)
+        """
+        if self._debug_enabled and getattr(self._local, "action_logging", True):
+            self.logger.debug(message, *args)
+    
     def log_system_info(self):
         """
         시스템 정보 로깅
@@ -96,46 +364,46 @@ class Logger:
         # 예외 정보 로깅
         self.logger.error("처리되지 않은 예외 발생:", exc_info=(exc_type, exc_value, exc_traceback))
     
-    def debug(self, message):
+    def debug(self, message, *args):
         """
-        디버그 메시지 로깅
+        디버그 메시지 로깅 (args 가 있으면 기록할 때 message % args 로 포맷)
         """
-        if self.logger:
-            self.logger.debug(message)
+        if self._debug_enabled:
+            self.logger.debug(message, *args)
     
-    def info(self, message):
+    def info(self, message, *args):
         """
         정보 메시지 로깅
         """
-        if self.logger:
-            self.logger.info(message)
+        if self._info_enabled:
+            self.logger.info(message, *args)
     
-    def warning(self, message):
+    def warning(self, message, *args):
         """
         경고 메시지 로깅
         """
         if self.logger:
-            self.logger.warning(message)
+            self.logger.warning(message, *args)
     
-    def error(self, message, exc_info=None):
+    def error(self, message, *args, exc_info=None):
         """
         오류 메시지 로깅
         """
         if self.logger:
             if exc_info:
-                self.logger.error(message, exc_info=exc_info)
+                self.logger.error(message, *args, exc_info=exc_info)
             else:
-                self.logger.error(message)
+                self.logger.error(message, *args)
     
-    def critical(self, message, exc_info=None):
+    def critical(self, message, *args, exc_info=None):
         """
         심각한 오류 메시지 로깅
         """
         if self.logger:
             if exc_info:
-                self.logger.critical(message, exc_info=exc_info)
+                self.logger.critical(message, *args, exc_info=exc_info)
             else:
-                self.logger.critical(message)
+                self.logger.critical(message, *args)
     
     def log_ui_action(self, action_name, details=None):
         """